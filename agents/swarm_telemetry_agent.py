@@ -12,9 +12,10 @@ import numpy as np
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
 
 from sdk.python.realtime_client import RealtimeClient
-from multi_agent_eal import QuantumSwarmEAL
+from dnalang.swarm import QuantumSwarmEAL
 
 
 class SwarmTelemetryAgent:
@@ -60,38 +61,11 @@ class SwarmTelemetryAgent:
         print(f"[{self.agent_id}] Starting evolution...")
 
         for iteration in range(iterations):
-            swarm.iteration = iteration
-
-            # Evaluate fitness for all agents
-            for agent in swarm.agents:
-                agent.fitness = swarm.fitness_function(agent.position)
-
-                # Update personal best
-                if agent.fitness < agent.best_fitness:
-                    agent.best_fitness = agent.fitness
-                    agent.best_position = agent.position.copy()
-
-                # Update global best
-                if agent.fitness < swarm.global_best_fitness:
-                    swarm.global_best_fitness = agent.fitness
-                    swarm.global_best_position = agent.position.copy()
-
-            # Quantum entanglement between neighboring agents
-            for i in range(swarm.n_agents - 1):
-                if np.random.random() < swarm.entanglement_strength:
-                    swarm.quantum_entangle_agents(swarm.agents[i], swarm.agents[i + 1])
-
-            # Apply quantum coherence preservation
-            for agent in swarm.agents:
-                swarm.apply_quantum_coherence(agent)
-
-            # Update all agents
-            for agent in swarm.agents:
-                swarm.update_agent(agent)
-
-            # Calculate coherence metrics
-            positions = np.array([agent.position for agent in swarm.agents])
-            coherence = self.calculate_coherence(positions)
+            # Evaluate, track bests, entangle and update the whole
+            # population at once on its (agents, dimensions) arrays
+            swarm.step()
+
+            coherence = self.calculate_coherence(swarm.positions)
             entanglement = swarm.entanglement_strength
 
             # Send swarm coherence telemetry
@@ -121,8 +95,9 @@ class SwarmTelemetryAgent:
                       f"Entanglement={entanglement:.3f}, "
                       f"Best={swarm.global_best_fitness:.3f}")
 
-            # Small delay for telemetry
-            await asyncio.sleep(0.05)
+            # Telemetry is queued, not sent inline; yield so the client's
+            # sender can ship batches between iterations
+            await asyncio.sleep(0)
 
         print(f"[{self.agent_id}] Evolution complete!")
         print(f"[{self.agent_id}] Final best fitness: {swarm.global_best_fitness:.3f}")
@@ -0,0 +1,46 @@
+import { type NextRequest, NextResponse } from "next/server"
+import { executeQuantumOperation } from "@/lib/quantum/operations"
+
+// Upper bound on operations per batch request; clients split larger sweeps
+const MAX_BATCH_SIZE = 1000
+
+export async function POST(request: NextRequest) {
+  try {
+    const body = await request.json()
+    const operations = body?.operations
+
+    if (!Array.isArray(operations)) {
+      return NextResponse.json({ error: "Invalid batch", details: "operations must be an array" }, { status: 400 })
+    }
+    if (operations.length > MAX_BATCH_SIZE) {
+      return NextResponse.json(
+        { error: "Batch too large", details: `At most ${MAX_BATCH_SIZE} operations per batch` },
+        { status: 413 },
+      )
+    }
+
+    // Each item succeeds or fails on its own; one bad spec never fails the batch
+    const results = await Promise.all(
+      operations.map(async (spec: any, index: number) => {
+        try {
+          // Accept both { operation, parameters } and flat { operation, shots, ... } specs
+          const { operation, parameters, ...rest } = spec ?? {}
+          if (typeof operation !== "string") {
+            throw new Error("operation is required")
+          }
+          const result = await executeQuantumOperation(operation, parameters ?? rest)
+          return { index, status: "ok", result }
+        } catch (error) {
+          return { index, status: "error", error: error instanceof Error ? error.message : "Unknown error" }
+        }
+      }),
+    )
+
+    return NextResponse.json({ results, count: results.length, timestamp: new Date().toISOString() })
+  } catch (error) {
+    return NextResponse.json(
+      { error: "Batch failed", details: error instanceof Error ? error.message : "Unknown error" },
+      { status: 500 },
+    )
+  }
+}
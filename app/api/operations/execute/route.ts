@@ -1,93 +1,29 @@
 import { type NextRequest, NextResponse } from "next/server"
+import { executeQuantumOperation } from "@/lib/quantum/operations"
+import { CircuitNotFoundError } from "@/lib/quantum/circuit-registry"
 
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json()
-    const { operation, parameters } = body
+    // Accept both { operation, parameters } and flat { operation, shots, ... } bodies
+    const { operation, parameters, ...rest } = body
 
     // Simulate quantum operation execution
     // In production, this would call the Python backend or IBM Quantum
-    const result = await executeQuantumOperation(operation, parameters)
+    const result = await executeQuantumOperation(operation, parameters ?? rest)
 
     return NextResponse.json(result)
   } catch (error) {
+    if (error instanceof CircuitNotFoundError) {
+      // `detail` carries the hash so clients know to resend the QASM body
+      return NextResponse.json(
+        { error: "Unknown circuit", detail: error.message, circuit_hash: error.circuitHash },
+        { status: 404 },
+      )
+    }
     return NextResponse.json(
       { error: "Operation failed", details: error instanceof Error ? error.message : "Unknown error" },
       { status: 500 },
     )
   }
 }
-
-async function executeQuantumOperation(operation: string, parameters: any) {
-  // Simulate operation execution with realistic results
-  const baseResult = {
-    operation,
-    timestamp: new Date().toISOString(),
-    backend: parameters?.backend || "ibm_brisbane",
-    shots: parameters?.shots || 2048,
-    execution_time: Math.random() * 2 + 0.5,
-  }
-
-  switch (operation) {
-    case "coherence":
-      return {
-        ...baseResult,
-        result: {
-          fidelity: 0.95 + Math.random() * 0.04,
-          coherence: 0.98 + Math.random() * 0.02,
-          bell_violation: 2.7 + Math.random() * 0.1,
-          counts: {
-            "00": Math.floor(parameters.shots * 0.48),
-            "11": Math.floor(parameters.shots * 0.48),
-            "01": Math.floor(parameters.shots * 0.02),
-            "10": Math.floor(parameters.shots * 0.02),
-          },
-        },
-      }
-
-    case "wflow":
-      return {
-        ...baseResult,
-        result: {
-          wgf_cost: 0.15 + Math.random() * 0.1,
-          fidelity_cost: 0.85 + Math.random() * 0.1,
-          gradient_variance: 0.02 + Math.random() * 0.01,
-          convergence_rate: 0.92 + Math.random() * 0.05,
-        },
-      }
-
-    case "disentangle":
-      return {
-        ...baseResult,
-        result: {
-          separability: 0.88 + Math.random() * 0.1,
-          mutual_information: 0.12 + Math.random() * 0.05,
-          feature_clusters: 4,
-          monosemantic_score: 0.91 + Math.random() * 0.08,
-        },
-      }
-
-    case "finance_optimize_portfolio":
-      return {
-        ...baseResult,
-        result: {
-          optimal_allocation: parameters.assets.map((asset: any, i: number) => ({
-            symbol: asset.symbol,
-            allocation: Math.random() * 0.3,
-          })),
-          expected_return: 0.12 + Math.random() * 0.03,
-          sharpe_ratio: 1.5 + Math.random() * 0.5,
-          risk: 0.15 + Math.random() * 0.05,
-        },
-      }
-
-    default:
-      return {
-        ...baseResult,
-        result: {
-          status: "completed",
-          message: `Operation ${operation} executed successfully`,
-        },
-      }
-  }
-}
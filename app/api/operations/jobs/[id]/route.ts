@@ -0,0 +1,27 @@
+import { type NextRequest, NextResponse } from "next/server"
+import { cancelJob, getJob, jobPage, jobSummary } from "@/lib/quantum/jobs"
+
+// Partial results returned per poll; clients page through with `offset`
+const MAX_PAGE_SIZE = 1000
+
+export async function GET(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
+  const { id } = await params
+  const job = getJob(id)
+  if (!job) {
+    return NextResponse.json({ error: "Job not found", detail: `Unknown job ${id}` }, { status: 404 })
+  }
+
+  const offset = Math.max(0, Number(request.nextUrl.searchParams.get("offset") ?? 0) || 0)
+  const rawLimit = request.nextUrl.searchParams.get("limit")
+  const limit = rawLimit === null ? MAX_PAGE_SIZE : Math.min(MAX_PAGE_SIZE, Math.max(0, Number(rawLimit) || 0))
+  return NextResponse.json(jobPage(job, offset, limit))
+}
+
+export async function DELETE(_request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
+  const { id } = await params
+  const job = cancelJob(id)
+  if (!job) {
+    return NextResponse.json({ error: "Job not found", detail: `Unknown job ${id}` }, { status: 404 })
+  }
+  return NextResponse.json({ job: jobSummary(job) })
+}
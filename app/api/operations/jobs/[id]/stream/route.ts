@@ -0,0 +1,40 @@
+import { type NextRequest, NextResponse } from "next/server"
+import { getJob, jobEvents } from "@/lib/quantum/jobs"
+
+// Idle connections get a heartbeat line this often so client read
+// timeouts only fire when the server is actually gone
+const HEARTBEAT_MS = 10_000
+
+export async function GET(request: NextRequest, { params }: { params: Promise<{ id: string }> }) {
+  const { id } = await params
+  const job = getJob(id)
+  if (!job) {
+    return NextResponse.json({ error: "Job not found", detail: `Unknown job ${id}` }, { status: 404 })
+  }
+
+  const offset = Math.max(0, Number(request.nextUrl.searchParams.get("offset") ?? 0) || 0)
+  const encoder = new TextEncoder()
+
+  const stream = new ReadableStream({
+    async start(controller) {
+      const send = (event: object) => controller.enqueue(encoder.encode(JSON.stringify(event) + "\n"))
+      const heartbeat = setInterval(() => send({ type: "heartbeat" }), HEARTBEAT_MS)
+      try {
+        for await (const event of jobEvents(job, offset)) {
+          if (request.signal.aborted) break
+          send(event)
+        }
+      } finally {
+        clearInterval(heartbeat)
+        controller.close()
+      }
+    },
+  })
+
+  return new Response(stream, {
+    headers: {
+      "Content-Type": "application/x-ndjson",
+      "Cache-Control": "no-cache",
+    },
+  })
+}
@@ -0,0 +1,21 @@
+import { type NextRequest, NextResponse } from "next/server"
+import { submitJob } from "@/lib/quantum/jobs"
+
+export async function POST(request: NextRequest) {
+  try {
+    const body = await request.json()
+    // Accept both { operation, parameters } and flat { operation, shots, ... } bodies
+    const { operation, parameters, ...rest } = body ?? {}
+    if (typeof operation !== "string") {
+      return NextResponse.json({ error: "Invalid job", detail: "operation is required" }, { status: 400 })
+    }
+
+    const job = submitJob(operation, parameters ?? rest)
+    return NextResponse.json({ job }, { status: 202 })
+  } catch (error) {
+    return NextResponse.json(
+      { error: "Job submission failed", details: error instanceof Error ? error.message : "Unknown error" },
+      { status: 500 },
+    )
+  }
+}
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Catalyst Grid Benchmark
+
+Scores a synthetic alloy library over a temperature x pressure grid two
+ways with the local catalyst model: a plain per-point loop (descriptors
+recomputed and ``grid_scores`` called for each grid point, with no cache
+or deduplication), and one ``sweep_catalyst`` call for the whole grid.
+Reports wall time, speedup, and checks that both give the same scores.
+
+The baseline is a naive local loop written for this comparison, not the
+server-side ``design_catalyst`` call, whose cost is dominated by network
+round trips and is not measured here.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang import QuantumClient
+from dnalang.catalysis import D_BAND_CENTRES, grid_scores, material_descriptors
+
+
+def alloy_library(num_materials: int, duplicates: float, rng: np.random.Generator):
+    elements = sorted(D_BAND_CENTRES)
+    materials = []
+    for i in range(num_materials):
+        if materials and rng.random() < duplicates:
+            materials.append(dict(materials[rng.integers(len(materials))]))
+            continue
+        a, b = rng.choice(elements, size=2, replace=False)
+        x, y = rng.integers(1, 4, size=2)
+        materials.append({"name": f"M{i:05d}", "composition": f"{a}{x}{b}{y}"})
+    return materials
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalyst temperature x pressure sweep")
+    parser.add_argument("--materials", type=int, nargs="+", default=[10, 100, 1000], help="Library sizes")
+    parser.add_argument("--temperatures", type=int, default=41, help="Grid temperatures (300-700 K)")
+    parser.add_argument("--pressures", type=int, default=31, help="Grid pressures (0.1-100 atm)")
+    parser.add_argument("--duplicates", type=float, default=0.1, help="Share of repeated materials")
+    parser.add_argument("--workers", type=int, default=None, help="Sweep processes")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    temperatures = np.linspace(300.0, 700.0, args.temperatures)
+    pressures = np.logspace(-1, 2, args.pressures)
+
+    print(f"{'materials':>9} {'points':>7} {'per-point':>10} {'sweep':>9} {'speedup':>8} "
+          f"{'evaluated':>10} {'processes':>9}")
+    for num_materials in args.materials:
+        materials = alloy_library(num_materials, args.duplicates, rng)
+        start = time.perf_counter()
+        baseline = np.empty((num_materials, temperatures.size, pressures.size))
+        for t, temperature in enumerate(temperatures):
+            for p, pressure in enumerate(pressures):
+                descriptors = np.array([material_descriptors(m) for m in materials])
+                baseline[:, t, p] = grid_scores(descriptors, temperatures[t:t + 1], pressures[p:p + 1])[:, 0, 0]
+        per_point = time.perf_counter() - start
+
+        # Fresh client per size so the sweep does not start with a warm cache
+        client = QuantumClient(api_key="benchmark")
+        start = time.perf_counter()
+        grid = client.materials.sweep_catalyst(
+            "CO2 Reduction", materials, temperatures, pressures, workers=args.workers
+        )
+        sweep = time.perf_counter() - start
+        assert np.allclose(grid.scores, baseline), "sweep and per-point scores differ"
+
+        print(f"{num_materials:>9} {temperatures.size * pressures.size:>7} {per_point:>8.2f} s "
+              f"{sweep:>7.3f} s {per_point / sweep:>7.0f}x "
+              f"{grid.stats['evaluated']:>10} {grid.stats['workers']:>9}")
+
+
+if __name__ == "__main__":
+    main()
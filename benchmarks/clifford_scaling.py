@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Clifford Scaling Benchmark
+
+Prepares and samples n-qubit GHZ states, the ``coherence`` workload, on
+the stabilizer tableau and (while it fits) the dense statevector, and
+reports wall time and peak state memory for each engine.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang.local import ghz_instructions
+from dnalang.stabilizer import StabilizerSimulator
+from dnalang.statevector import StatevectorSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stabilizer vs statevector on GHZ states")
+    parser.add_argument("--qubits", type=int, nargs="+", default=[10, 20, 24, 100, 1000, 2000],
+                        help="GHZ sizes")
+    parser.add_argument("--shots", type=int, default=4096, help="Shots per run")
+    parser.add_argument("--max-dense", type=int, default=24, help="Largest statevector run")
+    args = parser.parse_args()
+
+    print(f"{'qubits':>6} {'stabilizer':>11} {'tableau':>9} {'statevector':>12} {'state':>10}")
+    for n in args.qubits:
+        start = time.perf_counter()
+        tableau = StabilizerSimulator(n).run(ghz_instructions(n))
+        counts = tableau.sample_counts(args.shots, seed=1)
+        stabilizer = time.perf_counter() - start
+        assert len(counts) == 2, counts.keys()
+        tableau_mb = (tableau.x.nbytes + tableau.z.nbytes) / 1024 ** 2
+
+        dense = "-"
+        state = "-"
+        if n <= args.max_dense:
+            start = time.perf_counter()
+            sim = StatevectorSimulator(n).run(ghz_instructions(n))
+            sim.sample_counts(args.shots, seed=1)
+            dense = f"{time.perf_counter() - start:.3f} s"
+            state = f"{sim.state.nbytes / 1024 ** 2:.1f} MB"
+        print(f"{n:>6} {stabilizer:>9.3f} s {tableau_mb:>6.1f} MB {dense:>12} {state:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark
+
+Times ``import dnalang`` (and the circuit-validation path) in fresh
+interpreters and fails when the median exceeds a fixed budget or when a
+heavy dependency (requests, httpx, numpy) is pulled in eagerly.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+LIB = Path(__file__).parent.parent / "lib"
+
+HEAVY_MODULES = ["requests", "httpx", "numpy"]
+
+PROBES = {
+    "import dnalang": "import dnalang",
+    "validate_circuit": (
+        "from dnalang import validate_circuit\n"
+        "validate_circuit('OPENQASM 2.0; qreg q[1]; h q[0];')"
+    ),
+}
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1e3, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(code: str) -> dict:
+    """Run ``code`` in a fresh interpreter; return elapsed ms and heavy modules loaded"""
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(code=code, heavy=HEAVY_MODULES)],
+        cwd=LIB, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dnalang import-time budget")
+    parser.add_argument("--budget-ms", type=float, default=25.0, help="Median budget per probe")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters per probe")
+    args = parser.parse_args()
+
+    failed = False
+    for name, code in PROBES.items():
+        runs = [measure(code) for _ in range(args.runs)]
+        median = statistics.median(run["ms"] for run in runs)
+        loaded = sorted({m for run in runs for m in run["loaded"]})
+        ok = median <= args.budget_ms and not loaded
+        failed |= not ok
+        print(f"{'PASS' if ok else 'FAIL'}  {name:<18} median {median:6.1f} ms "
+              f"(budget {args.budget_ms:.0f} ms)"
+              + (f", eagerly loaded: {', '.join(loaded)}" if loaded else ""))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
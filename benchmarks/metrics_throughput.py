@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Metrics Engine Throughput Benchmark
+
+Scores a stacked batch of simulated result sets against a target
+distribution and reports result sets per second, for array input and for
+the legacy ``{"bitstring": count}`` dict input.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang.metrics import compute_metrics, counts_matrix, ghz_target
+from dnalang.utils import calculate_metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metrics engine throughput")
+    parser.add_argument("--batch", type=int, default=100_000, help="Result sets per batch")
+    parser.add_argument("--qubits", type=int, default=2, help="Qubits per result set")
+    parser.add_argument("--shots", type=int, default=2048, help="Shots per result set")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of repetitions")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    target = ghz_target(args.qubits)
+    noisy = 0.9 * target + 0.1 / target.size
+    batch = rng.multinomial(args.shots, noisy, size=args.batch)
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        metrics = compute_metrics(batch, target=target)
+        best = min(best, time.perf_counter() - start)
+    print(f"arrays:   {args.batch / best:,.0f} result sets/s ({best * 1e3:.1f} ms for {args.batch:,})")
+    print(f"          mean fidelity {metrics['fidelity'].mean():.4f}, "
+          f"mean HOP {metrics['heavy_output_probability'].mean():.4f}")
+
+    width = args.qubits
+    dicts = [
+        {format(i, f"0{width}b"): int(c) for i, c in enumerate(row) if c}
+        for row in batch
+    ]
+    start = time.perf_counter()
+    compute_metrics(counts_matrix(dicts, width), target=target)
+    elapsed = time.perf_counter() - start
+    print(f"dicts:    {args.batch / elapsed:,.0f} result sets/s (stacked, then vectorized)")
+
+    sample = dicts[: min(len(dicts), 10_000)]
+    start = time.perf_counter()
+    for counts in sample:
+        calculate_metrics(counts)
+    elapsed = time.perf_counter() - start
+    print(f"per-call: {len(sample) / elapsed:,.0f} result sets/s (calculate_metrics)")
+
+
+if __name__ == "__main__":
+    main()
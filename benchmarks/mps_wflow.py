@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+MPS wflow Benchmark
+
+Runs the ``wflow`` random-circuit workload on the matrix-product-state
+engine from 20 to 80 qubits at several depths and bond caps, and reports
+wall time, the bond dimension reached, the truncation error and the
+fidelity estimate. At 20 qubits the statevector runs the same circuit
+for comparison.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang.local import random_circuit_instructions
+from dnalang.mps import MPSSimulator, estimate_bond
+from dnalang.statevector import StatevectorSimulator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MPS engine on wide, shallow random circuits")
+    parser.add_argument("--qubits", type=int, nargs="+", default=[20, 40, 60, 80], help="Circuit widths")
+    parser.add_argument("--depths", type=int, nargs="+", default=[3, 6, 10], help="Circuit depths")
+    parser.add_argument("--bonds", type=int, nargs="+", default=[16, 64], help="Bond-dimension caps")
+    parser.add_argument("--shots", type=int, default=2048, help="Shots per run")
+    parser.add_argument("--max-dense", type=int, default=20, help="Largest statevector run")
+    args = parser.parse_args()
+
+    print(f"{'qubits':>6} {'depth':>5} {'est':>6} {'cap':>5} {'bond':>5} {'time':>9} "
+          f"{'trunc err':>10} {'fidelity':>9} {'statevector':>12}")
+    for n in args.qubits:
+        for depth in args.depths:
+            instructions = random_circuit_instructions(n, depth, np.random.default_rng(1))
+            estimate = estimate_bond(instructions, n)
+
+            dense = "-"
+            if n <= args.max_dense:
+                start = time.perf_counter()
+                StatevectorSimulator(n).run(instructions).sample(args.shots, seed=1)
+                dense = f"{time.perf_counter() - start:.3f} s"
+
+            for cap in args.bonds:
+                start = time.perf_counter()
+                sim = MPSSimulator(n, max_bond=cap).run(instructions)
+                sim.sample(args.shots, seed=1)
+                elapsed = time.perf_counter() - start
+                print(f"{n:>6} {depth:>5} {estimate:>6} {cap:>5} {sim.bond_dimension:>5} {elapsed:>7.3f} s "
+                      f"{sim.truncation_error:>10.2e} {sim.fidelity_estimate:>9.4f} {dense:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+QASM Parser Throughput Benchmark
+
+Generates a large OpenQASM 2 program and reports tokenize/parse/validate
+throughput in MB/s.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang.qasm import tokenize, parse_circuit, validate_qasm
+
+
+def generate_qasm(num_gates: int, num_qubits: int = 20, seed: int = 0) -> str:
+    """Random H/CX/rotation program with ``num_gates`` gates"""
+    rng = random.Random(seed)
+    lines = [
+        "OPENQASM 2.0;",
+        'include "qelib1.inc";',
+        f"qreg q[{num_qubits}];",
+        f"creg c[{num_qubits}];",
+    ]
+    for _ in range(num_gates):
+        kind = rng.random()
+        if kind < 0.4:
+            a, b = rng.sample(range(num_qubits), 2)
+            lines.append(f"cx q[{a}],q[{b}];")
+        elif kind < 0.7:
+            lines.append(f"h q[{rng.randrange(num_qubits)}];")
+        else:
+            gate = rng.choice(["rx", "ry", "rz"])
+            lines.append(f"{gate}({rng.uniform(-3.14, 3.14):.6f}) q[{rng.randrange(num_qubits)}];")
+    lines.append("measure q -> c;")
+    return "\n".join(lines) + "\n"
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QASM parser throughput")
+    parser.add_argument("--gates", type=int, default=100_000, help="Gates in the generated program")
+    parser.add_argument("--qubits", type=int, default=20, help="Register width")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repetitions")
+    args = parser.parse_args()
+
+    source = generate_qasm(args.gates, args.qubits)
+    megabytes = len(source.encode()) / 1e6
+
+    tokenize_time = timed(tokenize, source, repeat=args.repeat)
+    parse_time = timed(parse_circuit.__wrapped__, source, repeat=args.repeat)
+
+    parse_circuit.cache_clear()
+    validate_qasm.cache_clear()
+    start = time.perf_counter()
+    validate_qasm(source)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    validate_qasm(source)
+    warm = time.perf_counter() - start
+
+    circuit = parse_circuit(source)
+    print(f"Program: {args.gates} gates, {megabytes:.2f} MB, depth {circuit.depth()}")
+    print(f"tokenize:        {megabytes / tokenize_time:8.2f} MB/s ({tokenize_time * 1e3:.1f} ms)")
+    print(f"tokenize+parse:  {megabytes / parse_time:8.2f} MB/s ({parse_time * 1e3:.1f} ms)")
+    print(f"validate (cold): {cold * 1e3:.1f} ms, (cached): {warm * 1e6:.1f} us")
+    print(f"IR size: {len(circuit)} ops, "
+          f"{circuit.opcodes.itemsize * len(circuit.opcodes) + circuit.qubits.itemsize * len(circuit.qubits) + circuit.params.itemsize * len(circuit.params)} bytes of arrays")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Sharded Statevector Scaling Benchmark
+
+Runs one compiled random circuit (U3 layers and a CZ brickwork, as a
+``custom`` QASM program would compile) on the shared-memory sharded
+statevector with 1, 2, 4, ... worker processes, and reports wall time,
+speedup and parallel efficiency against one worker, plus the number of
+cross-shard exchanges the schedule needed.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang.compiler import compile_circuit
+from dnalang.local import random_circuit_instructions
+from dnalang.sharded import ShardedStatevectorSimulator
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Sharded statevector scaling with worker count")
+    parser.add_argument("--qubits", type=int, nargs="+", default=[24, 26], help="Circuit widths")
+    parser.add_argument("--depth", type=int, default=10, help="Circuit depth")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[1 << k for k in range(cores.bit_length())], help="Worker counts")
+    args = parser.parse_args()
+
+    print(f"{cores} cores")
+    print(f"{'qubits':>6} {'workers':>7} {'shards':>6} {'time':>9} {'speedup':>8} {'efficiency':>10} {'exchanges':>9}")
+    for n in args.qubits:
+        instructions, _ = compile_circuit(random_circuit_instructions(n, args.depth, np.random.default_rng(1)))
+        baseline = None
+        for workers in args.workers:
+            with ShardedStatevectorSimulator(n, workers=workers) as sim:
+                start = time.perf_counter()
+                sim.run(instructions)
+                elapsed = time.perf_counter() - start
+                shards, exchanges = sim.num_shards, sim.exchanges
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            print(f"{n:>6} {workers:>7} {shards:>6} {elapsed:>7.2f} s {speedup:>7.2f}x "
+                  f"{speedup / shards:>10.0%} {exchanges:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Swarm Step Benchmark
+
+Times whole-population iterations of the struct-of-arrays quantum swarm
+(evaluate, best tracking, entanglement, update) from the 5-agent default
+up to 10^4 agents x 100 dimensions, in float64 and float32.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
+
+from dnalang.swarm import QuantumSwarmEAL
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantum swarm iteration time")
+    parser.add_argument("--sizes", nargs="+", default=["5x10", "1000x100", "10000x100"],
+                        help="AGENTSxDIMENSIONS")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed iterations")
+    args = parser.parse_args()
+
+    print(f"{'agents':>7} {'dims':>5} {'dtype':>8} {'ms/iter':>8} {'iter/s':>7} {'best':>10} {'coherence':>9}")
+    for size in args.sizes:
+        agents, dimensions = (int(v) for v in size.lower().split("x"))
+        for dtype in (np.float64, np.float32):
+            swarm = QuantumSwarmEAL(agents, dimensions, seed=0, dtype=dtype)
+            swarm.step()
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                swarm.step()
+            per_iteration = (time.perf_counter() - start) / args.iterations
+            print(f"{agents:>7} {dimensions:>5} {np.dtype(dtype).name:>8} {per_iteration * 1e3:>8.2f} "
+                  f"{1 / per_iteration:>7.0f} {swarm.global_best_fitness:>10.2f} {swarm.coherence():>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
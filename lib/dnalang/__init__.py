@@ -27,46 +27,114 @@ __version__ = "1.0.0"
 __author__ = "DNALang Quantum Team"
 __license__ = "Proprietary"
 
-# Core imports
-from .client import QuantumClient
-from .config import DNALangConfig
-from .exceptions import (
-    DNALangException,
-    AuthenticationError,
-    RateLimitError,
-    OperationError
-)
-
-# Operation modules
-from .operations import (
-    CoherenceOperation,
-    WflowOperation,
-    DisentangleOperation,
-    WormholeOperation
-)
-
-# Industry verticals
-from .verticals import (
-    FinanceClient,
-    PharmaClient,
-    MaterialsClient,
-    LogisticsClient
-)
-
-# Enhancement
-from .enhancement import AutoEnhancer
-
-# Utilities
-from .utils import (
-    validate_circuit,
-    format_results,
-    calculate_metrics
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> defining submodule. Submodules load on first attribute
+# access, so ``import dnalang`` stays cheap: validating a circuit never
+# pulls in requests/httpx, and NumPy loads only with the local engines.
+_LAZY_IMPORTS = {
+    # Core
+    "QuantumClient": ".client",
+    "AsyncQuantumClient": ".async_client",
+    "DNALangConfig": ".config",
+    "RetryPolicy": ".retry",
+    "TokenBucket": ".retry",
+    "ResultCache": ".cache",
+    "CircuitRegistry": ".registry",
+    "Job": ".jobs",
+    "AsyncJob": ".jobs",
+
+    # Exceptions
+    "DNALangException": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "OperationError": ".exceptions",
+
+    # Operations
+    "CoherenceOperation": ".operations",
+    "WflowOperation": ".operations",
+    "DisentangleOperation": ".operations",
+    "WormholeOperation": ".operations",
+
+    # Industry verticals
+    "FinanceClient": ".verticals",
+    "PharmaClient": ".verticals",
+    "MaterialsClient": ".verticals",
+    "LogisticsClient": ".verticals",
+
+    # Enhancement
+    "AutoEnhancer": ".enhancement",
+
+    # Algorithms
+    "VQE": ".vqe",
+    "Hamiltonian": ".vqe",
+
+    # Utilities
+    "validate_circuit": ".utils",
+    "format_results": ".utils",
+    "calculate_metrics": ".utils",
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers see eager imports
+    from .client import QuantumClient
+    from .async_client import AsyncQuantumClient
+    from .config import DNALangConfig
+    from .retry import RetryPolicy, TokenBucket
+    from .cache import ResultCache
+    from .registry import CircuitRegistry
+    from .jobs import Job, AsyncJob
+    from .exceptions import (
+        DNALangException,
+        AuthenticationError,
+        RateLimitError,
+        OperationError
+    )
+    from .operations import (
+        CoherenceOperation,
+        WflowOperation,
+        DisentangleOperation,
+        WormholeOperation
+    )
+    from .verticals import (
+        FinanceClient,
+        PharmaClient,
+        MaterialsClient,
+        LogisticsClient
+    )
+    from .enhancement import AutoEnhancer
+    from .vqe import VQE, Hamiltonian
+    from .utils import (
+        validate_circuit,
+        format_results,
+        calculate_metrics
+    )
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Core
     "QuantumClient",
+    "AsyncQuantumClient",
     "DNALangConfig",
+    "RetryPolicy",
+    "TokenBucket",
+    "ResultCache",
+    "CircuitRegistry",
+    "Job",
+    "AsyncJob",
 
     # Exceptions
     "DNALangException",
@@ -89,6 +157,10 @@ __all__ = [
     # Enhancement
     "AutoEnhancer",
 
+    # Algorithms
+    "VQE",
+    "Hamiltonian",
+
     # Utils
     "validate_circuit",
     "format_results",
@@ -104,7 +176,8 @@ VERSION_INFO = {
         "multi_backend",
         "industry_verticals",
         "wormhole_protocol",
-        "enterprise_features"
+        "enterprise_features",
+        "async_client"
     ],
     "backends": ["ibm_quantum", "aer_simulator"],
     "license": __license__
@@ -130,4 +203,5 @@ def init(api_key=None, config=None):
         >>> client = dnalang.init(api_key="qos_...")
         >>> result = client.operations.coherence()
     """
+    from .client import QuantumClient
     return QuantumClient(api_key=api_key, config=config)
@@ -0,0 +1,302 @@
+"""
+DNALang Async Quantum Client
+============================
+
+asyncio client for the DNALang Quantum Platform, backed by a bounded
+keep-alive (HTTP/2 when available) connection pool.
+"""
+
+import os
+import json
+import asyncio
+import importlib.util
+from typing import Dict, Any, Optional, Callable
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .config import DNALangConfig
+from .exceptions import DNALangException, AuthenticationError, OperationError, BackendError
+from .operations import OperationsClient
+from .verticals import VerticalsClient
+from .enhancement import AutoEnhancer
+from .client import DEFAULT_BASE_URL, build_rate_limiter, build_cache, raise_for_status
+from .jobs import AsyncJob, JOBS_ENDPOINT
+from .retry import RETRYABLE_STATUSES, RetryPolicy, TokenBucket, parse_retry_after
+from .cache import make_cache_key
+
+
+class AsyncQuantumClient:
+    """
+    asyncio DNALang Quantum client
+
+    Exposes the same ``operations``/``verticals``/``enhancer`` surface as
+    :class:`QuantumClient`; every network call returns an awaitable. All
+    requests share one pooled ``httpx.AsyncClient`` so thousands of
+    executions can be in flight without one OS thread per request.
+
+    Example:
+        >>> from dnalang import AsyncQuantumClient
+        >>> async with AsyncQuantumClient(api_key="qos_...") as client:
+        ...     results = await asyncio.gather(*[
+        ...         client.operations.coherence(shots=2048)
+        ...         for _ in range(1000)
+        ...     ])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        config: Optional[DNALangConfig] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
+        """
+        Initialize AsyncQuantumClient
+
+        Args:
+            api_key: API key for authentication (or set DNALANG_API_KEY env var)
+            config: Custom configuration
+            base_url: API base URL
+            rate_limiter: Token bucket to share with other clients
+                (defaults to one built from ``config.rate_limit``, if set)
+        """
+        if httpx is None:
+            raise DNALangException(
+                "AsyncQuantumClient requires httpx. Install it with: pip install 'httpx[http2]'"
+            )
+
+        self.api_key = api_key or os.getenv("DNALANG_API_KEY")
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key required. Set DNALANG_API_KEY env var or pass api_key parameter."
+            )
+
+        self.config = config or DNALangConfig()
+        self.base_url = base_url.rstrip("/")
+
+        # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive
+        http2 = self.config.http2 and importlib.util.find_spec("h2") is not None
+
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=http2,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": f"DNALang-Python/{self.config.version}"
+            },
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry
+            ),
+            # pool=None: requests beyond the pool size queue for a connection
+            # instead of failing with PoolTimeout
+            timeout=httpx.Timeout(self.config.timeout, pool=None)
+        )
+
+        self.retry_policy = RetryPolicy.from_config(self.config)
+        self.rate_limiter = rate_limiter or build_rate_limiter(self.config)
+        self.cache = build_cache(self.config)
+
+        # Initialize sub-clients
+        self.operations = OperationsClient(self)
+        self.verticals = VerticalsClient(self)
+        self.enhancer = AutoEnhancer(self)
+
+        # Shortcuts to verticals
+        self.finance = self.verticals.finance
+        self.pharma = self.verticals.pharma
+        self.materials = self.verticals.materials
+        self.logistics = self.verticals.logistics
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to API
+
+        Retries follow the same policy as :meth:`QuantumClient.request`.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: URL parameters
+            cache: Serve from / store in the result cache (when
+                ``config.caching`` is enabled)
+
+        Returns:
+            Response data
+
+        Raises:
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit still exceeded after retries
+            OperationError: If operation fails
+        """
+        key = None
+        if cache and self.cache is not None:
+            key = make_cache_key(endpoint, data, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        attempt = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            try:
+                response = await self.session.request(
+                    method=method,
+                    url=endpoint,
+                    json=data,
+                    params=params
+                )
+            except httpx.HTTPError as e:
+                delay = self.retry_policy.next_delay(
+                    attempt, method,
+                    connect_error=isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                )
+                if delay is None:
+                    raise OperationError(f"Request failed: {str(e)}")
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if response.status_code == 429 or response.status_code >= 500:
+                delay = self.retry_policy.next_delay(
+                    attempt, method,
+                    status=response.status_code,
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                    limiter=self.rate_limiter
+                )
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+
+            if response.status_code >= 400:
+                raise_for_status(response.status_code, response.json() if response.content else {})
+
+            result = response.json()
+            if key is not None:
+                self.cache.set(key, result)
+            return result
+
+    async def stream(self, endpoint: str, params: Optional[Dict] = None):
+        """
+        GET an NDJSON endpoint, async-yielding one decoded object per line
+
+        See :meth:`QuantumClient.stream`.
+        """
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        try:
+            async with self.session.stream("GET", endpoint, params=params) as response:
+                if response.status_code in RETRYABLE_STATUSES:
+                    raise BackendError(
+                        f"Stream unavailable: HTTP {response.status_code}",
+                        status=response.status_code,
+                        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                if response.status_code >= 400:
+                    body = await response.aread()
+                    raise_for_status(response.status_code, json.loads(body) if body else {})
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event.get("type") != "heartbeat":
+                        yield event
+        except httpx.HTTPError as e:
+            raise BackendError(f"Stream failed: {str(e)}")
+
+    async def submit_job(self, operation: str, parameters: Dict[str, Any]) -> AsyncJob:
+        """
+        Submit a long-running operation without waiting for it
+
+        Returns:
+            :class:`AsyncJob` handle; ``async for`` over it for partial results
+        """
+        response = await self.request("POST", JOBS_ENDPOINT, data={
+            "operation": operation,
+            "parameters": parameters
+        })
+        return AsyncJob(self, response["job"])
+
+    async def run_local(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a local (in-process) backend call in the default executor
+
+        Keeps CPU-bound simulation off the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def health(self) -> Dict[str, Any]:
+        """
+        Check API health
+
+        Returns:
+            Health status dict
+        """
+        return await self.request("GET", "/api/health", cache=True)
+
+    async def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get platform metrics
+
+        Returns:
+            Dashboard metrics
+        """
+        return await self.request("GET", "/api/dashboard/metrics", cache=True)
+
+    async def enhance(
+        self,
+        result: Dict[str, Any],
+        iterations: int = 3,
+        noise: Optional[Dict[str, float]] = None,
+        schedule: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Auto-enhance operation result
+
+        The search runs in the default executor, off the event loop.
+
+        Args:
+            result: Operation result to enhance (left unmodified)
+            iterations: Max enhancement iterations
+            noise: Noise model to evaluate under (see :meth:`AutoEnhancer.enhance`)
+            schedule: ``"halving"`` or ``"full"`` shot allocation per round
+
+        Returns:
+            New result from the best variant found, with an ``enhancement`` report
+        """
+        return await self.enhancer.enhance(result, iterations=iterations, noise=noise, schedule=schedule)
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncQuantumClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"<AsyncQuantumClient(base_url='{self.base_url}')>"
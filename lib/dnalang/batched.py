@@ -0,0 +1,344 @@
+"""DNALang Batched Statevector Simulator"""
+
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+from .sampling import SeedLike, make_rng, _check_shots
+from .statevector import CONTROLLED_GATES, NON_UNITARY, Instruction, gate_matrix
+
+# Amplitudes simulated at once when a large batch is split into chunks
+# (rows x 2**n); 16 MB of state keeps every gate pass cache-friendly
+BATCH_AMPLITUDES = 1 << 20
+
+
+def batch_chunks(batch_size: int, num_qubits: int) -> Iterator[slice]:
+    """Row slices of a batch, each within ``BATCH_AMPLITUDES`` amplitudes"""
+    step = max(1, BATCH_AMPLITUDES >> num_qubits)
+    for lo in range(0, batch_size, step):
+        yield slice(lo, min(lo + step, batch_size))
+
+
+def _angles(params: Sequence[Any]) -> List[np.ndarray]:
+    return [np.asarray(p, dtype=np.float64) for p in np.broadcast_arrays(*params)]
+
+
+def _u3(theta: np.ndarray, phi: np.ndarray, lam: np.ndarray) -> np.ndarray:
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.stack([
+        np.stack([c + 0j, -np.exp(1j * lam) * s], axis=-1),
+        np.stack([np.exp(1j * phi) * s, np.exp(1j * (phi + lam)) * c], axis=-1)
+    ], axis=-2)
+
+
+def _diagonal(d0: np.ndarray, d1: np.ndarray) -> np.ndarray:
+    out = np.zeros(np.shape(d1) + (2, 2), dtype=np.complex128)
+    out[..., 0, 0] = d0
+    out[..., 1, 1] = d1
+    return out
+
+
+# Single-qubit gates over arrays of angles, shape (..., 2, 2)
+BATCH_GATES = {
+    "rx": lambda t: np.cos(t / 2)[..., None, None] * np.eye(2)
+    - 1j * np.sin(t / 2)[..., None, None] * np.array([[0, 1], [1, 0]]),
+    "ry": lambda t: np.cos(t / 2)[..., None, None] * np.eye(2)
+    + np.sin(t / 2)[..., None, None] * np.array([[0, -1], [1, 0]]),
+    "rz": lambda t: _diagonal(np.exp(-0.5j * t), np.exp(0.5j * t)),
+    "p": lambda lam: _diagonal(np.ones_like(lam), np.exp(1j * lam)),
+    "u1": lambda lam: _diagonal(np.ones_like(lam), np.exp(1j * lam)),
+    "u2": lambda phi, lam: _u3(np.full_like(phi, math.pi / 2), phi, lam),
+    "u3": _u3,
+    "u": _u3,
+}
+
+
+def batch_gate_matrix(name: str, params: Sequence[Any]) -> np.ndarray:
+    """
+    2x2 unitaries of a single-qubit gate for every binding
+
+    Args:
+        name: Gate name
+        params: Angles, each a float or an (N,) array
+
+    Returns:
+        (N, 2, 2) array, or (1, 2, 2) when every angle is a float
+    """
+    if all(np.ndim(p) == 0 for p in params):
+        return gate_matrix(name, [float(p) for p in params])[None]
+    if name not in BATCH_GATES:
+        raise ValidationError(f"Gate {name!r} takes no parameters")
+    return BATCH_GATES[name](*_angles(params)).astype(np.complex128)
+
+
+def pauli_masks(pauli: str, num_qubits: int) -> Tuple[int, int, int]:
+    """
+    ``(x_mask, z_mask, sign)`` for a Pauli string (qubit 0 leftmost)
+
+    The operator is ``sign * i**(#Y) * X^x_mask Z^z_mask``.
+
+    Raises:
+        ValidationError: For a malformed string
+    """
+    sign = -1 if pauli.startswith("-") else 1
+    letters = pauli.lstrip("+-").upper()
+    if len(letters) != num_qubits or set(letters) - set("IXYZ"):
+        raise ValidationError(f"Pauli string must have {num_qubits} letters from IXYZ, got {pauli!r}")
+    x_mask = sum(1 << q for q, c in enumerate(letters) if c in "XY")
+    z_mask = sum(1 << q for q, c in enumerate(letters) if c in "ZY")
+    return x_mask, z_mask, sign
+
+
+def _parity(values: np.ndarray, num_bits: int) -> np.ndarray:
+    """(-1)**popcount of non-negative integers below ``2**num_bits``"""
+    parity = np.zeros(values.shape, dtype=np.int64)
+    for bit in range(num_bits):
+        parity ^= (values >> bit) & 1
+    return 1.0 - 2.0 * parity
+
+
+class BatchedStatevectorSimulator:
+    """
+    Statevector with a leading batch axis, one row per parameter binding
+
+    ``state`` has shape ``(N, 2**n)``. Every gate is applied to all rows
+    at once; parametrized gates take an (N,) array per angle (see
+    :func:`batch_gate_matrix`) and fixed gates broadcast, so N bindings
+    of one circuit cost one pass of whole-array NumPy operations per
+    gate rather than N separate simulations. Qubit 0 is the least
+    significant bit of the basis index, as in
+    :class:`~dnalang.statevector.StatevectorSimulator`.
+
+    The amplitudes are stored batch-minor, as ``amplitudes`` of shape
+    ``(2**n, N)`` (``state`` is its transpose view): the per-binding
+    gate entries then broadcast along the contiguous axis, which is
+    several times faster than scaling strided rows. They stay float64
+    while every gate applied is real (such as RY/CX ansätze, common for
+    molecular Hamiltonians), halving memory traffic, and become
+    complex128 at the first complex gate.
+
+    Example:
+        >>> theta = np.linspace(0, np.pi, 5)
+        >>> sim = BatchedStatevectorSimulator(1, batch_size=5)
+        >>> sim.apply("ry", (0,), (theta,))
+        >>> sim.expectation(["Z"])[:, 0].round(3)
+        array([ 1.   ,  0.707,  0.   , -0.707, -1.   ])
+    """
+
+    def __init__(self, num_qubits: int, batch_size: int):
+        if num_qubits < 1 or batch_size < 1:
+            raise ValidationError("num_qubits and batch_size must be positive")
+        self.num_qubits = num_qubits
+        self.batch_size = batch_size
+        self.amplitudes = np.zeros((1 << num_qubits, batch_size), dtype=np.float64)
+        self.amplitudes[0] = 1.0
+
+    @property
+    def state(self) -> np.ndarray:
+        """(N, 2**n) view of the amplitudes, one row per binding"""
+        return self.amplitudes.T
+
+    def _check(self, qubits: Sequence[int], params: Sequence[Any] = ()) -> None:
+        for q in qubits:
+            if not 0 <= q < self.num_qubits:
+                raise ValidationError(f"Qubit index {q} out of range for {self.num_qubits} qubits")
+        if len(set(qubits)) != len(qubits):
+            raise ValidationError(f"Repeated qubit in {tuple(qubits)}")
+        for p in params:
+            if np.ndim(p) and np.shape(p) != (self.batch_size,):
+                raise ValidationError(f"Parameter arrays must have shape ({self.batch_size},)")
+
+    @staticmethod
+    def _pair(a0: np.ndarray, a1: np.ndarray, matrix: np.ndarray) -> None:
+        """Apply (B, 2, 2) ``matrix`` in place to the amplitude pairs (a0, a1)"""
+        m00, m01, m10, m11 = matrix[:, 0, 0], matrix[:, 0, 1], matrix[:, 1, 0], matrix[:, 1, 1]
+        if not m01.any() and not m10.any():
+            a0 *= m00
+            a1 *= m11
+            return
+        if not m00.any() and not m11.any():
+            # X-like: swap the halves, scaling only if needed
+            tmp = a0.copy()
+            a0[...] = a1
+            a1[...] = tmp
+            if (m01 != 1).any():
+                a0 *= m01
+            if (m10 != 1).any():
+                a1 *= m10
+            return
+        tmp = m00 * a0
+        tmp += m01 * a1
+        a1 *= m11
+        a1 += m10 * a0
+        a0[...] = tmp
+
+    def _fit(self, matrix: np.ndarray) -> np.ndarray:
+        """``matrix`` in the amplitudes' dtype, promoting them to complex if needed"""
+        if self.amplitudes.dtype.kind == "c":
+            return matrix
+        if np.iscomplexobj(matrix) and matrix.imag.any():
+            self.amplitudes = self.amplitudes.astype(np.complex128)
+            return matrix
+        return matrix.real
+
+    def _view2(self, q_hi: int, q_lo: int) -> np.ndarray:
+        return self.amplitudes.reshape(-1, 2, 1 << (q_hi - q_lo - 1), 2, 1 << q_lo, self.batch_size)
+
+    def apply_1q(self, matrix: np.ndarray, qubit: int) -> None:
+        """(B, 2, 2) unitaries, B = 1 or N, on ``qubit`` in place"""
+        matrix = self._fit(matrix)
+        v = self.amplitudes.reshape(-1, 2, 1 << qubit, self.batch_size)
+        self._pair(v[:, 0], v[:, 1], matrix)
+
+    def apply_controlled_1q(self, matrix: np.ndarray, control: int, target: int) -> None:
+        """(B, 2, 2) unitaries on ``target`` where ``control`` is 1"""
+        matrix = self._fit(matrix)
+        if control > target:
+            v = self._view2(control, target)
+            self._pair(v[:, 1, :, 0], v[:, 1, :, 1], matrix)
+        else:
+            v = self._view2(target, control)
+            self._pair(v[:, 0, :, 1], v[:, 1, :, 1], matrix)
+
+    def apply_swap(self, q1: int, q2: int) -> None:
+        v = self._view2(max(q1, q2), min(q1, q2))
+        tmp = v[:, 0, :, 1].copy()
+        v[:, 0, :, 1] = v[:, 1, :, 0]
+        v[:, 1, :, 0] = tmp
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        (B, 2**k, 2**k) unitaries on ``qubits`` (``qubits[0]`` the MSB)
+        """
+        matrix = self._fit(matrix)
+        n, k = self.num_qubits, len(qubits)
+        psi = self.amplitudes.reshape((2,) * n + (self.batch_size,))
+        targets = [n - 1 - q for q in qubits]
+        perm = [n] + [axis for axis in range(n) if axis not in targets] + targets
+        gathered = psi.transpose(perm).reshape(self.batch_size, -1, 1 << k)
+        out = np.matmul(gathered, np.swapaxes(matrix, 1, 2))
+        psi[...] = out.reshape((self.batch_size,) + (2,) * n).transpose(np.argsort(perm))
+
+    def apply(self, name: str, qubits: Sequence[int], params: Sequence[Any] = ()) -> None:
+        """
+        Apply a named gate to every row
+
+        Args:
+            name: Gate name (OpenQASM 2 qelib1 names)
+            qubits: Qubit indices (controls first)
+            params: Angles, each a float or an (N,) array of per-row values
+        """
+        name = name.lower()
+        if name in NON_UNITARY:
+            return
+        qubits = tuple(qubits)
+        self._check(qubits, params)
+
+        if name == "swap":
+            self.apply_swap(*qubits)
+        elif name in CONTROLLED_GATES:
+            n_controls, base = CONTROLLED_GATES[name]
+            matrix = batch_gate_matrix(base, params)
+            if n_controls == 1:
+                self.apply_controlled_1q(matrix, qubits[0], qubits[1])
+            else:
+                full = np.broadcast_to(np.eye(8, dtype=np.complex128), (matrix.shape[0], 8, 8)).copy()
+                full[:, -2:, -2:] = matrix
+                self.apply_unitary(full, qubits)
+        elif name == "cswap":
+            full = np.eye(8, dtype=np.complex128)
+            full[[5, 6], :] = full[[6, 5], :]
+            self.apply_unitary(full[None], qubits)
+        elif name == "unitary":
+            self.apply_unitary(np.asarray(params[0])[None], qubits)
+        else:
+            self.apply_1q(batch_gate_matrix(name, params), qubits[0])
+
+    def run(self, instructions: Iterable[Instruction]) -> "BatchedStatevectorSimulator":
+        """
+        Apply a circuit to every row
+
+        Runs of single-qubit gates on the same qubit are multiplied into
+        one (N, 2, 2) matrix first, so e.g. an RY-RZ layer costs one pass
+        over the batched state per qubit instead of two, and fixed runs
+        that multiply to the identity are dropped.
+        """
+        pending: Dict[int, np.ndarray] = {}
+        for name, qubits, params in instructions:
+            name = name.lower()
+            if name in NON_UNITARY:
+                continue
+            qubits = tuple(qubits)
+            if len(qubits) == 1 and name != "unitary":
+                self._check(qubits, params)
+                matrix = batch_gate_matrix(name, params)
+                q = qubits[0]
+                pending[q] = np.matmul(matrix, pending[q]) if q in pending else matrix
+                continue
+            for q in qubits:
+                if q in pending:
+                    self._flush(pending.pop(q), q)
+            self.apply(name, qubits, params)
+        for q, matrix in pending.items():
+            self._flush(matrix, q)
+        return self
+
+    def _flush(self, matrix: np.ndarray, qubit: int) -> None:
+        # Fused runs often cancel, e.g. basis changes undone and redone
+        if len(matrix) == 1 and np.allclose(matrix[0], np.eye(2), rtol=0, atol=1e-12):
+            return
+        self.apply_1q(matrix, qubit)
+
+    def probabilities(self) -> np.ndarray:
+        """(N, 2**n) Born-rule probabilities"""
+        amps = self.amplitudes
+        return (amps.real ** 2 + amps.imag ** 2).T
+
+    def expectation(self, paulis: Sequence[str]) -> np.ndarray:
+        """
+        Exact expectation of each Pauli string (qubit 0 leftmost) per row
+
+        Terms sharing an X/Y pattern share one gathered product of the
+        state with its bit-flipped copy, so a K-term observable costs one
+        pass per distinct pattern plus a (K, 2**n) x (2**n, N) product.
+
+        Returns:
+            (N, K) real array
+        """
+        n = self.num_qubits
+        masks = [pauli_masks(p, n) for p in paulis]
+        index = np.arange(1 << n, dtype=np.int64)
+        out = np.empty((self.batch_size, len(masks)), dtype=np.float64)
+        groups: Dict[int, List[int]] = {}
+        for column, (x_mask, _, _) in enumerate(masks):
+            groups.setdefault(x_mask, []).append(column)
+        for x_mask, columns in groups.items():
+            flipped = index ^ x_mask
+            if x_mask:
+                overlap = self.amplitudes.conj() * self.amplitudes[flipped]
+            else:
+                overlap = self.probabilities().T
+            z_masks = np.array([masks[c][1] for c in columns], dtype=np.int64)
+            # Z acts before X in X^x Z^z, so its sign reads the flipped index
+            signs = _parity(flipped[None, :] & z_masks[:, None], n)
+            values = signs @ overlap
+            for i, column in enumerate(columns):
+                _, z_mask, sign = masks[column]
+                phase = 1j ** bin(x_mask & z_mask).count("1")
+                out[:, column] = sign * (phase * values[i]).real
+        return out
+
+    def sample(self, shots: int, seed: SeedLike = None) -> np.ndarray:
+        """
+        Measurement counts for every row
+
+        Returns:
+            (N, 2**n) int64 array indexed by basis state
+        """
+        shots = _check_shots(shots)
+        rng = make_rng(seed)
+        probs = self.probabilities()
+        probs /= probs.sum(axis=1, keepdims=True)
+        return rng.multinomial(shots, probs)
@@ -0,0 +1,141 @@
+"""DNALang Result Cache"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+
+def make_cache_key(
+    endpoint: str,
+    data: Optional[Dict] = None,
+    params: Optional[Dict] = None
+) -> str:
+    """
+    Canonical hash of a request
+
+    Args:
+        endpoint: API endpoint path
+        data: Request body (operation, parameters, backend, ...)
+        params: URL parameters
+
+    Returns:
+        Hex SHA-256 digest; identical requests hash identically regardless
+        of dict key order
+    """
+    data = data or {}
+    body = {k: v for k, v in data.items() if k not in ("operation", "backend")}
+    if "circuit_hash" in body:
+        # The hash already addresses the program; hash-only and full-body
+        # requests for the same circuit share one entry
+        body.pop("qasm", None)
+    canonical = json.dumps(
+        {
+            "endpoint": endpoint,
+            "operation": data.get("operation"),
+            "backend": data.get("backend"),
+            "parameters": body,
+            "params": params or {},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with per-entry TTL expiry
+
+    Values are deep-copied on the way in and out so callers can mutate
+    results without corrupting the cached copy.
+
+    Example:
+        >>> cache = ResultCache(maxsize=100, ttl=300)
+        >>> cache.set("k", {"fidelity": 0.97})
+        >>> cache.get("k")
+        {'fidelity': 0.97}
+        >>> cache.stats()["hits"]
+        1
+    """
+
+    def __init__(self, maxsize: int = 100, ttl: float = 300):
+        """
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        if self.maxsize <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single entry"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache counters
+
+        Returns:
+            Dict with size, hits, misses, evictions, expirations and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,272 @@
+"""DNALang Catalyst Screening"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+
+BOLTZMANN_EV = 8.617333262e-5  # eV/K
+
+# Approximate d-band centres of close-packed surfaces, eV relative to the
+# Fermi level (Hammer-Norskov); alloys use the composition-weighted mean
+D_BAND_CENTRES = {
+    "Fe": -0.92, "Co": -1.17, "Ni": -1.29, "Cu": -2.67,
+    "Ru": -1.41, "Rh": -1.73, "Pd": -1.83, "Ag": -4.30,
+    "Ir": -2.11, "Pt": -2.25, "Au": -3.56,
+}
+
+# Linear scaling of the key intermediate's adsorption energy with the
+# d-band centre, and a Bronsted-Evans-Polanyi barrier; materials may
+# override either with explicit ``adsorption_energy``/``activation_energy``
+ADSORPTION_SLOPE = -0.5
+ADSORPTION_OFFSET = -1.6
+BEP_SLOPE = 0.6
+BEP_OFFSET = 1.0
+MIN_BARRIER = 0.05
+
+DEFAULT_PREFACTOR = 1e13  # attempt frequency, 1/s
+DEFAULT_ENTROPY_LOSS = 1e-3  # adsorption entropy loss, eV/K
+
+# Grids smaller than this many evaluations run inline; process start-up
+# would cost more than it saves
+POOL_MIN_EVALUATIONS = 1 << 21
+
+# Per-material descriptors kept across calls
+DESCRIPTOR_CACHE_SIZE = 4096
+
+_FORMULA = re.compile(r"([A-Z][a-z]?)(\d*\.?\d*)")
+
+
+def parse_composition(formula: str) -> Dict[str, float]:
+    """Element -> amount for formulas like ``"Pt3Co"`` or ``"Pd0.5Au0.5"``"""
+    if not formula or _FORMULA.sub("", formula).strip():
+        raise ValidationError(f"Cannot parse composition: {formula!r}")
+    amounts: Dict[str, float] = {}
+    for element, amount in _FORMULA.findall(formula):
+        amounts[element] = amounts.get(element, 0.0) + (float(amount) if amount else 1.0)
+    return amounts
+
+
+def material_descriptors(material: Dict[str, Any]) -> Tuple[float, float, float, float]:
+    """
+    Temperature- and pressure-independent intermediates of one material
+
+    Returns:
+        (adsorption_energy eV, activation_energy eV, prefactor 1/s,
+        entropy_loss eV/K)
+
+    Raises:
+        ValidationError: If the composition has elements without a
+            tabulated d-band centre and no explicit energies are given
+    """
+    adsorption = material.get("adsorption_energy")
+    if adsorption is None:
+        amounts = parse_composition(material.get("composition", ""))
+        unknown = sorted(set(amounts) - set(D_BAND_CENTRES))
+        if unknown:
+            raise ValidationError(
+                f"No d-band centre for {', '.join(unknown)} in {material.get('name', material.get('composition'))!r}; "
+                "give adsorption_energy explicitly"
+            )
+        total = sum(amounts.values())
+        centre = sum(D_BAND_CENTRES[e] * n for e, n in amounts.items()) / total
+        adsorption = ADSORPTION_SLOPE * centre + ADSORPTION_OFFSET
+    activation = material.get("activation_energy")
+    if activation is None:
+        activation = max(MIN_BARRIER, BEP_SLOPE * adsorption + BEP_OFFSET)
+    return (
+        float(adsorption),
+        float(activation),
+        float(material.get("prefactor", DEFAULT_PREFACTOR)),
+        float(material.get("entropy_loss", DEFAULT_ENTROPY_LOSS))
+    )
+
+
+def grid_scores(descriptors: np.ndarray, temperatures: np.ndarray, pressures: np.ndarray) -> np.ndarray:
+    """
+    log10 turnover frequency for every material x temperature x pressure
+
+    Langmuir-Hinshelwood surface step: coverage ``KP / (1 + KP)`` with
+    ``K = exp(-(E_ads + T * S_loss) / kT)``, rate
+    ``prefactor * exp(-E_a / kT) * coverage * (1 - coverage)``. Binding too
+    weakly leaves the surface empty and too strongly poisons it, so the
+    scores trace a Sabatier volcano.
+
+    Args:
+        descriptors: (materials, 4) rows from :func:`material_descriptors`
+        temperatures: Kelvin
+        pressures: atm
+
+    Returns:
+        float64 array of shape (materials, temperatures, pressures)
+    """
+    adsorption, activation, prefactor, entropy = (descriptors[:, i, None, None] for i in range(4))
+    kt = BOLTZMANN_EV * temperatures[None, :, None]
+    log_p = np.log(pressures)[None, None, :]
+    # log(KP); coverage terms in log space stay finite for strong binding
+    log_kp = -(adsorption + temperatures[None, :, None] * entropy) / kt + log_p
+    log_cover = -np.logaddexp(0.0, -log_kp)
+    log_free = -np.logaddexp(0.0, log_kp)
+    log_rate = np.log(prefactor) - activation / kt + log_cover + log_free
+    return log_rate / np.log(10.0)
+
+
+def _grid_scores_task(args) -> np.ndarray:
+    return grid_scores(*args)
+
+
+@dataclass(frozen=True)
+class CatalystGrid:
+    """
+    Scores of a temperature x pressure sweep
+
+    ``scores[m, t, p]`` is the log10 turnover frequency (1/s) of material
+    ``m`` at ``temperatures[t]`` and ``pressures[p]``; higher is better.
+    """
+
+    reaction: str
+    materials: List[str]
+    temperatures: np.ndarray
+    pressures: np.ndarray
+    scores: np.ndarray
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def best_material(self) -> np.ndarray:
+        """Index of the best material at every grid point, shape (temperatures, pressures)"""
+        return self.scores.argmax(axis=0)
+
+    def best(self) -> Dict[str, Any]:
+        """Best material and conditions over the whole grid"""
+        m, t, p = np.unravel_index(int(self.scores.argmax()), self.scores.shape)
+        return {
+            "material": self.materials[m],
+            "index": int(m),
+            "temperature": float(self.temperatures[t]),
+            "pressure": float(self.pressures[p]),
+            "score": float(self.scores[m, t, p])
+        }
+
+
+class CatalystModel:
+    """
+    Descriptor-based microkinetic catalyst scoring
+
+    Per-material intermediates (composition parsing, scaling-relation
+    energies) are computed once per distinct material and cached across
+    calls; a sweep then evaluates identical materials and repeated
+    temperatures or pressures only once, in one vectorized pass per
+    material chunk, spread over a process pool for large grids.
+
+    Example:
+        >>> model = CatalystModel()
+        >>> grid = model.sweep("CO2 Reduction", materials,
+        ...                    np.linspace(300, 700, 41), np.logspace(-1, 2, 31))
+        >>> grid.scores.shape
+        (len(materials), 41, 31)
+    """
+
+    def __init__(self, cache_size: int = DESCRIPTOR_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[float, float, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def descriptors(self, materials: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """(materials, 4) descriptor rows, through the cache"""
+        rows = []
+        for material in materials:
+            key = json.dumps(material, sort_keys=True, default=str)
+            with self._lock:
+                row = self._cache.get(key)
+                if row is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+            if row is None:
+                row = material_descriptors(material)
+                with self._lock:
+                    self.misses += 1
+                    self._cache[key] = row
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            rows.append(row)
+        return np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+    def sweep(
+        self,
+        reaction: str,
+        candidate_materials: Sequence[Dict[str, Any]],
+        temperatures: Sequence[float],
+        pressures: Sequence[float],
+        workers: Optional[int] = None
+    ) -> CatalystGrid:
+        """
+        Score every material over the temperature x pressure grid
+
+        Args:
+            reaction: Target reaction (recorded with the result; the
+                descriptor model is reaction-agnostic)
+            candidate_materials: Material dicts with ``name`` and
+                ``composition`` and/or explicit energies
+            temperatures: Kelvin
+            pressures: atm
+            workers: Processes for large grids (default: CPU count)
+
+        Returns:
+            :class:`CatalystGrid`; ``stats`` reports requested versus
+            evaluated points, descriptor cache hits and wall time
+
+        Raises:
+            ValidationError: For empty inputs or non-positive T or P
+        """
+        start = time.perf_counter()
+        temperatures = np.asarray(temperatures, dtype=np.float64).ravel()
+        pressures = np.asarray(pressures, dtype=np.float64).ravel()
+        if not len(candidate_materials) or not temperatures.size or not pressures.size:
+            raise ValidationError("Sweep needs materials, temperatures and pressures")
+        if (temperatures <= 0).any() or (pressures <= 0).any():
+            raise ValidationError("Temperatures and pressures must be positive")
+
+        hits_before = self.hits
+        descriptors = self.descriptors(candidate_materials)
+        unique_rows, material_of = np.unique(descriptors, axis=0, return_inverse=True)
+        unique_t, t_of = np.unique(temperatures, return_inverse=True)
+        unique_p, p_of = np.unique(pressures, return_inverse=True)
+
+        evaluations = unique_rows.shape[0] * unique_t.size * unique_p.size
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and evaluations >= POOL_MIN_EVALUATIONS:
+            chunks = np.array_split(unique_rows, min(workers * 4, unique_rows.shape[0]))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_grid_scores_task, [(chunk, unique_t, unique_p) for chunk in chunks]))
+            unique_scores = np.concatenate(parts, axis=0)
+        else:
+            workers = 1
+            unique_scores = grid_scores(unique_rows, unique_t, unique_p)
+
+        scores = unique_scores[np.ix_(material_of.ravel(), t_of.ravel(), p_of.ravel())]
+        return CatalystGrid(
+            reaction=reaction,
+            materials=[m.get("name", m.get("composition", str(i))) for i, m in enumerate(candidate_materials)],
+            temperatures=temperatures,
+            pressures=pressures,
+            scores=scores,
+            stats={
+                "requested": int(scores.size),
+                "evaluated": int(evaluations),
+                "unique_materials": int(unique_rows.shape[0]),
+                "cache_hits": self.hits - hits_before,
+                "workers": workers,
+                "wall_time": time.perf_counter() - start
+            }
+        )
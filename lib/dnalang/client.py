@@ -6,13 +6,21 @@ Main client for interacting with DNALang Quantum Platform
 """
 
 import os
+import json
+import time
 import requests
-from typing import Dict, Any, Optional
+import urllib3
+from typing import Dict, Any, Optional, Callable, Iterator
 from .config import DNALangConfig
-from .exceptions import AuthenticationError, RateLimitError, OperationError
+from .exceptions import AuthenticationError, RateLimitError, OperationError, BackendError
 from .operations import OperationsClient
 from .verticals import VerticalsClient
 from .enhancement import AutoEnhancer
+from .retry import RETRYABLE_STATUSES, RetryPolicy, TokenBucket, parse_retry_after
+from .cache import ResultCache, make_cache_key
+from .jobs import Job, JOBS_ENDPOINT
+
+DEFAULT_BASE_URL = "https://dnalang-quantum-swarm.vercel.app"
 
 
 class QuantumClient:
@@ -37,7 +45,8 @@ class QuantumClient:
         self,
         api_key: Optional[str] = None,
         config: Optional[DNALangConfig] = None,
-        base_url: str = "https://dnalang-quantum-swarm.vercel.app"
+        base_url: str = DEFAULT_BASE_URL,
+        rate_limiter: Optional[TokenBucket] = None
     ):
         """
         Initialize QuantumClient
@@ -46,6 +55,8 @@ class QuantumClient:
             api_key: API key for authentication (or set DNALANG_API_KEY env var)
             config: Custom configuration
             base_url: API base URL
+            rate_limiter: Token bucket to share with other clients
+                (defaults to one built from ``config.rate_limit``, if set)
         """
         self.api_key = api_key or os.getenv("DNALANG_API_KEY")
         if not self.api_key:
@@ -62,6 +73,10 @@ class QuantumClient:
             "User-Agent": f"DNALang-Python/{self.config.version}"
         })
 
+        self.retry_policy = RetryPolicy.from_config(self.config)
+        self.rate_limiter = rate_limiter or build_rate_limiter(self.config)
+        self.cache = build_cache(self.config)
+
         # Initialize sub-clients
         self.operations = OperationsClient(self)
         self.verticals = VerticalsClient(self)
@@ -78,51 +93,161 @@ class QuantumClient:
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        cache: bool = False
     ) -> Dict[str, Any]:
         """
         Make HTTP request to API
 
+        Failed attempts are retried per ``config.max_retries``/``retry_delay``
+        with jittered exponential backoff; Retry-After is honored. Throttled
+        (429/503) responses are retried for every method, other transient
+        failures only for idempotent ones.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Request body data
             params: URL parameters
+            cache: Serve from / store in the result cache (when
+                ``config.caching`` is enabled)
 
         Returns:
             Response data
 
         Raises:
             AuthenticationError: If authentication fails
-            RateLimitError: If rate limit exceeded
+            RateLimitError: If rate limit still exceeded after retries
             OperationError: If operation fails
         """
         url = f"{self.base_url}{endpoint}"
+        key = None
+        if cache and self.cache is not None:
+            key = make_cache_key(endpoint, data, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        attempt = 0
+
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    json=data,
+                    params=params,
+                    timeout=self.config.timeout
+                )
+            except requests.RequestException as e:
+                delay = self.retry_policy.next_delay(
+                    attempt, method,
+                    connect_error=connect_failed(e)
+                )
+                if delay is None:
+                    raise OperationError(f"Request failed: {str(e)}")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if response.status_code == 429 or response.status_code >= 500:
+                delay = self.retry_policy.next_delay(
+                    attempt, method,
+                    status=response.status_code,
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                    limiter=self.rate_limiter
+                )
+                if delay is not None:
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+
+            if response.status_code >= 400:
+                raise_for_status(response.status_code, response.json() if response.content else {})
+
+            result = response.json()
+            if key is not None:
+                self.cache.set(key, result)
+            return result
 
+    def stream(self, endpoint: str, params: Optional[Dict] = None) -> Iterator[Dict[str, Any]]:
+        """
+        GET an NDJSON endpoint, yielding one decoded object per line
+
+        ``config.timeout`` bounds the gap between lines, not the whole
+        response; heartbeat lines are skipped.
+
+        Raises:
+            AuthenticationError: If authentication fails
+            OperationError: If the server rejects the request
+            BackendError: If the connection fails or drops mid-stream, or
+                the server answers 429/5xx (``status`` and ``retry_after``
+                set)
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
+            response = self.session.get(
+                f"{self.base_url}{endpoint}",
                 params=params,
+                stream=True,
                 timeout=self.config.timeout
             )
+        except requests.RequestException as e:
+            raise BackendError(f"Stream failed: {str(e)}")
 
-            # Handle errors
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            elif response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded")
-            elif response.status_code >= 400:
-                error_data = response.json() if response.content else {}
-                raise OperationError(
-                    error_data.get("detail", f"HTTP {response.status_code}")
+        with response:
+            if response.status_code in RETRYABLE_STATUSES:
+                raise BackendError(
+                    f"Stream unavailable: HTTP {response.status_code}",
+                    status=response.status_code,
+                    retry_after=parse_retry_after(response.headers.get("Retry-After"))
                 )
+            if response.status_code >= 400:
+                raise_for_status(response.status_code, response.json() if response.content else {})
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event.get("type") != "heartbeat":
+                        yield event
+            except requests.RequestException as e:
+                raise BackendError(f"Stream interrupted: {str(e)}")
 
-            return response.json()
+    def submit_job(self, operation: str, parameters: Dict[str, Any]) -> Job:
+        """
+        Submit a long-running operation without waiting for it
 
-        except requests.RequestException as e:
-            raise OperationError(f"Request failed: {str(e)}")
+        Args:
+            operation: Operation name (e.g. ``"logistics_route_optimization"``)
+            parameters: Operation parameters
+
+        Returns:
+            :class:`Job` handle; iterate it for partial results
+
+        Example:
+            >>> job = client.submit_job("pharma_drug_docking", {...})
+            >>> for partial in job:
+            ...     print(partial["data"])
+        """
+        response = self.request("POST", JOBS_ENDPOINT, data={
+            "operation": operation,
+            "parameters": parameters
+        })
+        return Job(self, response["job"])
+
+    def run_local(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a local (in-process) backend call
+
+        QuantumClient runs it inline; AsyncQuantumClient overrides this to
+        return an awaitable so sub-clients stay client-agnostic.
+        """
+        return func(*args)
 
     def health(self) -> Dict[str, Any]:
         """
@@ -136,7 +261,7 @@ class QuantumClient:
             >>> print(health['status'])
             'healthy'
         """
-        return self.request("GET", "/api/health")
+        return self.request("GET", "/api/health", cache=True)
 
     def get_metrics(self) -> Dict[str, Any]:
         """
@@ -149,25 +274,77 @@ class QuantumClient:
             >>> metrics = client.get_metrics()
             >>> print(f"Coherence: {metrics['coherence']:.4f}")
         """
-        return self.request("GET", "/api/dashboard/metrics")
+        return self.request("GET", "/api/dashboard/metrics", cache=True)
 
-    def enhance(self, result: Dict[str, Any], iterations: int = 3) -> Dict[str, Any]:
+    def enhance(
+        self,
+        result: Dict[str, Any],
+        iterations: int = 3,
+        noise: Optional[Dict[str, float]] = None,
+        schedule: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Auto-enhance operation result
 
         Args:
-            result: Operation result to enhance
+            result: Operation result to enhance (left unmodified)
             iterations: Max enhancement iterations
+            noise: Noise model to evaluate under (see :meth:`AutoEnhancer.enhance`)
+            schedule: ``"halving"`` or ``"full"`` shot allocation per round
 
         Returns:
-            Enhanced result
+            New result from the best variant found, with an ``enhancement`` report
 
         Example:
             >>> result = client.operations.coherence()
             >>> enhanced = client.enhance(result)
-            >>> print(f"Improvement: +{enhanced['improvement']:.1%}")
+            >>> print(f"Improvement: +{enhanced['enhancement']['total_improvement']:.1%}")
         """
-        return self.enhancer.enhance(result, iterations=iterations)
+        return self.enhancer.enhance(result, iterations=iterations, noise=noise, schedule=schedule)
 
     def __repr__(self) -> str:
         return f"<QuantumClient(base_url='{self.base_url}')>"
+
+
+def raise_for_status(status_code: int, error_data: Dict[str, Any]) -> None:
+    """Map an HTTP error status to the matching DNALang exception"""
+    if status_code == 401:
+        raise AuthenticationError("Invalid API key")
+    elif status_code == 429:
+        raise RateLimitError("Rate limit exceeded")
+    elif status_code >= 400:
+        raise OperationError(
+            error_data.get("detail", f"HTTP {status_code}")
+        )
+
+
+def connect_failed(error: requests.RequestException) -> bool:
+    """
+    Whether a request failed before reaching the server
+
+    Matches httpx's ``ConnectError``/``ConnectTimeout`` so both clients
+    replay the same failures: refused or unresolvable hosts, connect
+    timeouts, proxy and TLS handshake errors. Connections dropped after
+    the request was sent, and read timeouts, do not count.
+    """
+    if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.ProxyError,
+                          requests.exceptions.SSLError)):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    reason = getattr(error.args[0], "reason", error.args[0])
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+def build_rate_limiter(config: DNALangConfig) -> Optional[TokenBucket]:
+    """Create the token bucket described by ``config.rate_limit``, if any"""
+    if not config.rate_limit:
+        return None
+    return TokenBucket(config.rate_limit, config.rate_limit_burst)
+
+
+def build_cache(config: DNALangConfig) -> Optional[ResultCache]:
+    """Create the result cache described by ``config.caching``, if enabled"""
+    if not config.caching:
+        return None
+    return ResultCache(maxsize=config.cache_size, ttl=config.cache_ttl)
@@ -0,0 +1,250 @@
+"""DNALang Circuit Compiler"""
+
+import math
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .statevector import (
+    Instruction,
+    CONTROLLED_GATES,
+    NON_UNITARY,
+    gate_matrix,
+)
+
+# Gates equal to their own inverse; key is whether qubit order matters
+SELF_INVERSE = {
+    "id": False, "h": False, "x": False, "y": False, "z": False,
+    "cz": False, "swap": False, "cx": True, "cy": True, "ch": True, "ccx": True,
+}
+
+INVERSE_PAIRS = {("s", "sdg"), ("sdg", "s"), ("t", "tdg"), ("tdg", "t")}
+
+# Mergeable rotations and the angle period after which they are the
+# identity (up to global phase for uncontrolled gates)
+ROTATIONS = {
+    "rx": 2 * math.pi, "ry": 2 * math.pi, "rz": 2 * math.pi,
+    "p": 2 * math.pi, "u1": 2 * math.pi, "cp": 2 * math.pi, "cu1": 2 * math.pi,
+    "crx": 4 * math.pi, "cry": 4 * math.pi, "crz": 4 * math.pi,
+}
+
+_ANGLE_EPS = 1e-12
+
+
+def instruction_matrix(name: str, qubits: Sequence[int], params: Sequence[Any]) -> np.ndarray:
+    """
+    Dense unitary of a one- or two-qubit instruction
+
+    ``qubits[0]`` is the most significant bit of the returned matrix.
+    """
+    if name == "unitary":
+        return params[0]
+    if name == "swap":
+        return np.eye(4, dtype=np.complex128)[[0, 2, 1, 3]]
+    if name in CONTROLLED_GATES and CONTROLLED_GATES[name][0] == 1:
+        matrix = np.eye(4, dtype=np.complex128)
+        matrix[2:, 2:] = gate_matrix(CONTROLLED_GATES[name][1], params)
+        return matrix
+    return gate_matrix(name, params)
+
+
+def _swap_order(matrix: np.ndarray) -> np.ndarray:
+    """Re-express a 4x4 gate with its two qubits in the opposite order"""
+    return matrix.reshape(2, 2, 2, 2).transpose(1, 0, 3, 2).reshape(4, 4)
+
+
+def cancel_and_merge(instructions: Sequence[Instruction]) -> Tuple[List[Instruction], Dict[str, int]]:
+    """
+    Peephole pass: drop adjacent inverse pairs and merge rotation runs
+
+    Two gates are adjacent when no other instruction touches any of their
+    qubits in between. Cancellation cascades, so ``H X X H`` disappears.
+
+    Returns:
+        ``(instructions, {"cancelled": n, "merged": n})``
+    """
+    out: List[Optional[Instruction]] = []
+    history: Dict[int, List[int]] = {}
+    cancelled = merged = 0
+
+    def previous(qubits):
+        heads = {history[q][-1] if history.get(q) else None for q in qubits}
+        if len(heads) != 1:
+            return None
+        head = heads.pop()
+        if head is None or set(out[head][1]) != set(qubits):
+            return None
+        return head
+
+    def remove(index):
+        for q in out[index][1]:
+            history[q].pop()
+        out[index] = None
+
+    for name, qubits, params in instructions:
+        qubits = tuple(qubits)
+        head = previous(qubits) if name not in NON_UNITARY else None
+
+        if head is not None:
+            prev_name, prev_qubits, prev_params = out[head]
+            same_order = prev_qubits == qubits
+
+            if name == prev_name and name in SELF_INVERSE and (same_order or not SELF_INVERSE[name]):
+                remove(head)
+                cancelled += 2
+                continue
+            if (prev_name, name) in INVERSE_PAIRS:
+                remove(head)
+                cancelled += 2
+                continue
+            if name == prev_name and name in ROTATIONS and same_order:
+                angle = (prev_params[0] + params[0]) % ROTATIONS[name]
+                merged += 1
+                if min(angle, ROTATIONS[name] - angle) < _ANGLE_EPS:
+                    remove(head)
+                    cancelled += 1
+                else:
+                    out[head] = (name, qubits, (angle,))
+                continue
+
+        if name in ROTATIONS:
+            angle = params[0] % ROTATIONS[name]
+            if min(angle, ROTATIONS[name] - angle) < _ANGLE_EPS:
+                cancelled += 1
+                continue
+
+        out.append((name, qubits, tuple(params)))
+        for q in qubits:
+            history.setdefault(q, []).append(len(out) - 1)
+
+    return [inst for inst in out if inst is not None], {"cancelled": cancelled, "merged": merged}
+
+
+def fuse_gates(instructions: Sequence[Instruction]) -> Tuple[List[Instruction], Dict[str, int]]:
+    """
+    Fuse runs of one- and two-qubit gates into dense ``unitary`` blocks
+
+    Single-qubit runs collapse into one 2x2; single-qubit gates next to a
+    two-qubit gate and consecutive two-qubit gates on the same pair collapse
+    into one 4x4. Blocks holding a single original gate are emitted
+    unchanged so the simulator keeps its specialised kernels for them.
+
+    Returns:
+        ``(instructions, {"fused": n})`` where n is the number of original
+        gates folded into multi-gate blocks
+    """
+    out: List[Dict[str, Any]] = []
+    pending: Dict[int, Dict[str, Any]] = {}
+    open_block: Dict[int, int] = {}
+
+    def flush(q):
+        block = pending.pop(q, None)
+        if block is not None:
+            out.append(block)
+
+    def close(q):
+        flush(q)
+        open_block.pop(q, None)
+
+    for name, qubits, params in instructions:
+        qubits = tuple(qubits)
+        k = len(qubits)
+        if name in NON_UNITARY or k > 2:
+            for q in qubits:
+                close(q)
+            out.append({"qubits": qubits, "matrix": None, "ops": [(name, qubits, params)]})
+            continue
+
+        matrix = instruction_matrix(name, qubits, params)
+
+        if k == 1:
+            q = qubits[0]
+            if q in open_block:
+                block = out[open_block[q]]
+                eye = np.eye(2, dtype=np.complex128)
+                lift = np.kron(matrix, eye) if block["qubits"][0] == q else np.kron(eye, matrix)
+                block["matrix"] = lift @ block["matrix"]
+                block["ops"].append((name, qubits, params))
+            elif q in pending:
+                pending[q]["matrix"] = matrix @ pending[q]["matrix"]
+                pending[q]["ops"].append((name, qubits, params))
+            else:
+                pending[q] = {"qubits": qubits, "matrix": matrix, "ops": [(name, qubits, params)]}
+            continue
+
+        a, b = qubits
+        index = open_block.get(a)
+        if index is not None and open_block.get(b) == index:
+            block = out[index]
+            if block["qubits"] != qubits:
+                matrix = _swap_order(matrix)
+            block["matrix"] = matrix @ block["matrix"]
+            block["ops"].append((name, qubits, params))
+            continue
+
+        ops = []
+        pre = []
+        for q in qubits:
+            open_block.pop(q, None)
+            single = pending.pop(q, None)
+            pre.append(single["matrix"] if single else np.eye(2, dtype=np.complex128))
+            if single:
+                ops.extend(single["ops"])
+        ops.append((name, qubits, params))
+        out.append({"qubits": qubits, "matrix": matrix @ np.kron(pre[0], pre[1]), "ops": ops})
+        open_block[a] = open_block[b] = len(out) - 1
+
+    for q in list(pending):
+        flush(q)
+
+    result: List[Instruction] = []
+    fused = 0
+    for block in out:
+        if len(block["ops"]) == 1:
+            result.append(block["ops"][0])
+        else:
+            fused += len(block["ops"])
+            result.append(("unitary", block["qubits"], (block["matrix"],)))
+    return result, {"fused": fused}
+
+
+def compile_circuit(
+    instructions: Sequence[Instruction],
+    fuse: bool = True
+) -> Tuple[List[Instruction], Dict[str, Any]]:
+    """
+    Optimise a circuit before simulation
+
+    Runs :func:`cancel_and_merge` then (optionally) :func:`fuse_gates`.
+
+    Args:
+        instructions: ``(name, qubits, params)`` instructions
+        fuse: Fuse gates into dense blocks
+
+    Returns:
+        ``(instructions, report)``; the report counts gates before/after,
+        gates cancelled, rotations merged, gates fused and the number of
+        statevector sweeps saved
+
+    Example:
+        >>> compiled, report = compile_circuit(instructions)
+        >>> print(f"{report['sweep_reduction']:.1f}x fewer sweeps")
+    """
+    instructions = list(instructions)
+    before = sum(1 for inst in instructions if inst[0] not in NON_UNITARY)
+
+    compiled, report = cancel_and_merge(instructions)
+    if fuse:
+        compiled, fuse_report = fuse_gates(compiled)
+        report.update(fuse_report)
+    else:
+        report["fused"] = 0
+
+    after = sum(1 for inst in compiled if inst[0] not in NON_UNITARY)
+    report.update({
+        "gates_before": before,
+        "gates_after": after,
+        "sweeps_removed": before - after,
+        "sweep_reduction": before / after if after else float(before or 1),
+    })
+    return compiled, report
@@ -1,7 +1,7 @@
 """DNALang Configuration"""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 @dataclass
 class DNALangConfig:
@@ -14,6 +14,23 @@ class DNALangConfig:
     timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    max_retry_delay: float = 30.0
+
+    # Client-side rate limit (requests/second); None disables the token bucket
+    rate_limit: Optional[float] = None
+    rate_limit_burst: Optional[int] = None
+
+    # Connection pool settings (AsyncQuantumClient)
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+    # Batch execution (operations.execute_many)
+    batch_size: int = 100  # max operations per batch request
+    batch_max_bytes: int = 512 * 1024  # max JSON payload per batch request
+    batch_concurrency: int = 8  # batch requests in flight
+    screening_batch_size: int = 256  # candidates per shard in pharma.screen
 
     # Feature flags
     auto_enhance: bool = True
@@ -23,16 +40,39 @@ class DNALangConfig:
     # Quantum settings
     default_backend: str = "simulator"
     default_shots: int = 2048
-    max_qubits: int = 20
+    max_qubits: int = 20  # statevector engine
+    max_clifford_qubits: int = 5000  # stabilizer engine (Clifford-only circuits)
+    max_mps_qubits: int = 256  # matrix-product-state engine
+    max_sharded_qubits: int = 32  # multi-process statevector (16 * 2**n bytes of shared memory)
+    mps_max_bond: int = 64  # bond-dimension cap; larger is more exact and slower
+    mps_cutoff: float = 1e-12  # singular values below this weight are dropped
+
+    # Run backend="simulator" operations in-process instead of over HTTP
+    local_simulator: bool = True
+    simulator_seed: Optional[int] = None
+    simulator_engine: str = "auto"  # "auto", "statevector", "stabilizer", "mps" or "sharded"
+    simulator_workers: Optional[int] = None  # sharded engine processes; None uses every core
+    optimize_circuits: bool = True  # gate cancellation/fusion before local simulation
+    circuit_registry_size: int = 256  # parsed QASM programs kept by content hash
+    # Local noise model, e.g. {"gate_error": 0.002, "readout_error": 0.02}; None is noiseless
+    simulator_noise: Optional[Dict[str, float]] = None
 
     # Enhancement settings
     enhancement_threshold: float = 0.05  # 5% minimum improvement
     max_enhancement_iterations: int = 5
+    enhancement_workers: int = 4  # candidate evaluations run concurrently
+    enhancement_schedule: str = "full"  # shot allocation per round: "full" or "halving"
 
     # Industry vertical settings
     verticals_enabled: List[str] = field(default_factory=lambda: [
         "finance", "pharma", "materials", "logistics"
     ])
+    # Solve blocking (wait=True) vertical calls with in-process classical engines
+    local_verticals: bool = True
+    portfolio_solver: str = "tabu"  # QUBO solver: "tabu" or "anneal"
+    route_time_limit: float = 30.0  # seconds of local search per routing call
+    route_workers: int = 4  # threads filling the routing distance matrix
+    sweep_workers: Optional[int] = None  # processes for catalyst grid sweeps (None: CPU count)
 
     # Cache settings
     cache_ttl: int = 300  # seconds
@@ -1,5 +1,7 @@
 """DNALang Exceptions"""
 
+from typing import Optional
+
 class DNALangException(Exception):
     """Base exception for DNALang framework"""
     pass
@@ -21,5 +23,14 @@ class ValidationError(DNALangException):
     pass
 
 class BackendError(DNALangException):
-    """Raised when quantum backend is unavailable"""
-    pass
+    """
+    Raised when quantum backend is unavailable
+
+    ``status`` and ``retry_after`` are set when the server answered with
+    a retryable HTTP status (and Retry-After), so callers can back off.
+    """
+
+    def __init__(self, message: str = "", status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
@@ -0,0 +1,241 @@
+"""DNALang Job Handles"""
+
+import asyncio
+import time
+from typing import Dict, Any, Iterator, Optional
+
+from .exceptions import BackendError, OperationError
+
+JOBS_ENDPOINT = "/api/operations/jobs"
+
+FINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Partial results requested per poll
+POLL_PAGE_SIZE = 1000
+
+
+class _JobState:
+    """Status bookkeeping shared by :class:`Job` and :class:`AsyncJob`"""
+
+    def __init__(self, client, info: Dict[str, Any]):
+        self.client = client
+        self.id = info["id"]
+        self.operation = info.get("operation")
+        self.status = info.get("status", "queued")
+        self.info = info
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        # Index of the next partial result not yet handed to the caller;
+        # reconnects and polls resume from here
+        self.offset = 0
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+    def _path(self, suffix: str = "") -> str:
+        return f"{JOBS_ENDPOINT}/{self.id}{suffix}"
+
+    def _apply_event(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update state from one stream event; return it if it is a partial result"""
+        kind = event.get("type")
+        if kind == "partial":
+            self.offset = event["index"] + 1
+            return event
+        if kind == "result":
+            self.result = event.get("result")
+            self.status = "completed"
+        elif kind == "error":
+            self.error = event.get("error", "job failed")
+            self.status = event.get("status", "failed")
+        return None
+
+    def _apply_page(self, page: Dict[str, Any]) -> None:
+        self.info = page.get("job", self.info)
+        self.status = self.info.get("status", self.status)
+        if page.get("result") is not None:
+            self.result = page["result"]
+        if page.get("error"):
+            self.error = page["error"]
+
+    def _check(self) -> None:
+        if self.status != "completed":
+            raise OperationError(self.error or f"Job {self.id} {self.status}")
+
+    def _backoff(self, attempt: int, error: BackendError) -> Optional[float]:
+        """Delay before reconnecting a dropped or refused stream, or None to give up"""
+        return self.client.retry_policy.next_delay(
+            attempt, "GET",
+            status=error.status,
+            retry_after=error.retry_after,
+            connect_error=error.status is None,
+            limiter=self.client.rate_limiter
+        )
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(id='{self.id}', status='{self.status}', offset={self.offset})>"
+
+
+class Job(_JobState):
+    """
+    Handle to a submitted long-running operation
+
+    Iterating the handle streams partial results (NDJSON) as the server
+    produces them, so the first results can be processed while the job is
+    still running and nothing accumulates in memory. Dropped connections
+    resume from the last partial result received. :meth:`poll` is the
+    fallback for proxies that buffer streamed responses.
+
+    Example:
+        >>> job = client.logistics.optimize_routes(depot, stops, vehicles, wait=False)
+        >>> for partial in job:
+        ...     print(partial["index"], partial["data"])
+        >>> routes = job.result
+    """
+
+    def refresh(self) -> Dict[str, Any]:
+        """Fetch the job's current status"""
+        page = self.client.request("GET", self._path(), params={"offset": self.offset, "limit": 0})
+        self._apply_page(page)
+        return self.info
+
+    def stream(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield partial results as they arrive
+
+        Yields:
+            ``{"type": "partial", "index": i, "data": {...}}`` events; the
+            final result is stored on :attr:`result` when the stream ends
+
+        Raises:
+            OperationError: If the job fails or is cancelled
+            BackendError: If the stream cannot be re-established (dropped
+                connections and 429/5xx answers are retried with backoff)
+        """
+        attempt = 0
+        while not self.done:
+            try:
+                for event in self.client.stream(self._path("/stream"), params={"offset": self.offset}):
+                    attempt = 0
+                    partial = self._apply_event(event)
+                    if partial is not None:
+                        yield partial
+                if not self.done:
+                    # Clean close before the final event (e.g. a proxy's
+                    # max-duration cut): back off like any dropped stream
+                    raise BackendError(f"Stream for job {self.id} closed before the final result")
+            except BackendError as e:
+                delay = self._backoff(attempt, e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+        self._check()
+
+    def poll(self, interval: float = 1.0) -> Iterator[Dict[str, Any]]:
+        """
+        Yield partial results by polling instead of streaming
+
+        Args:
+            interval: Seconds between polls while no new results are available
+        """
+        while True:
+            page = self.client.request(
+                "GET", self._path(),
+                params={"offset": self.offset, "limit": POLL_PAGE_SIZE}
+            )
+            self._apply_page(page)
+            results = page.get("results", [])
+            for event in results:
+                yield self._apply_event(event)
+            if self.done and len(results) < POLL_PAGE_SIZE:
+                break
+            if not results:
+                time.sleep(interval)
+        self._check()
+
+    def wait(self) -> Dict[str, Any]:
+        """Block until the job finishes, discarding partial results; return the final result"""
+        for _ in self.stream():
+            pass
+        return self.result
+
+    def cancel(self) -> Dict[str, Any]:
+        """Cancel the job on the server"""
+        response = self.client.request("DELETE", self._path())
+        self._apply_page(response)
+        return self.info
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.stream()
+
+
+class AsyncJob(_JobState):
+    """
+    asyncio handle to a submitted long-running operation
+
+    Example:
+        >>> job = await client.pharma.drug_docking(protein, library, wait=False)
+        >>> async for partial in job:
+        ...     print(partial["index"], partial["data"])
+    """
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Fetch the job's current status"""
+        page = await self.client.request("GET", self._path(), params={"offset": self.offset, "limit": 0})
+        self._apply_page(page)
+        return self.info
+
+    async def stream(self):
+        """Async-iterate partial results as they arrive (see :meth:`Job.stream`)"""
+        attempt = 0
+        while not self.done:
+            try:
+                async for event in self.client.stream(self._path("/stream"), params={"offset": self.offset}):
+                    attempt = 0
+                    partial = self._apply_event(event)
+                    if partial is not None:
+                        yield partial
+                if not self.done:
+                    # Clean close before the final event (e.g. a proxy's
+                    # max-duration cut): back off like any dropped stream
+                    raise BackendError(f"Stream for job {self.id} closed before the final result")
+            except BackendError as e:
+                delay = self._backoff(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+        self._check()
+
+    async def poll(self, interval: float = 1.0):
+        """Async-iterate partial results by polling (see :meth:`Job.poll`)"""
+        while True:
+            page = await self.client.request(
+                "GET", self._path(),
+                params={"offset": self.offset, "limit": POLL_PAGE_SIZE}
+            )
+            self._apply_page(page)
+            results = page.get("results", [])
+            for event in results:
+                yield self._apply_event(event)
+            if self.done and len(results) < POLL_PAGE_SIZE:
+                break
+            if not results:
+                await asyncio.sleep(interval)
+        self._check()
+
+    async def wait(self) -> Dict[str, Any]:
+        """Wait for the job to finish, discarding partial results; return the final result"""
+        async for _ in self.stream():
+            pass
+        return self.result
+
+    async def cancel(self) -> Dict[str, Any]:
+        """Cancel the job on the server"""
+        response = await self.client.request("DELETE", self._path())
+        self._apply_page(response)
+        return self.info
+
+    def __aiter__(self):
+        return self.stream()
@@ -0,0 +1,459 @@
+"""DNALang Local Simulator Backend"""
+
+import math
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from .exceptions import ValidationError
+from .statevector import StatevectorSimulator, Instruction, NON_UNITARY
+from .compiler import compile_circuit
+from .sampling import count_packed, sample_counts
+from .noise import NoiseModel
+from .qasm import Circuit, parse_circuit
+from .stabilizer import StabilizerSimulator, is_clifford
+from .mps import MPSSimulator, estimate_bond
+from .sharded import ShardedStatevectorSimulator
+from .batched import BatchedStatevectorSimulator, batch_chunks
+from .parametric import parametric_circuit
+
+# Local engines; "auto" picks the stabilizer tableau for Clifford circuits,
+# the MPS for wide, weakly entangled ones and the sharded statevector for
+# anything else too wide for one process
+ENGINES = ("auto", "statevector", "stabilizer", "mps", "sharded")
+
+# Engines holding the full dense state
+_DENSE_ENGINES = ("statevector", "sharded")
+
+# Config field holding each engine's qubit limit
+_QUBIT_LIMITS = {
+    "statevector": "max_qubits",
+    "stabilizer": "max_clifford_qubits",
+    "mps": "max_mps_qubits",
+    "sharded": "max_sharded_qubits",
+}
+
+
+def ghz_instructions(num_qubits: int) -> List[Instruction]:
+    """H on qubit 0 followed by a CX chain (a Bell pair for two qubits)"""
+    instructions: List[Instruction] = [("h", (0,), ())]
+    instructions += [("cx", (q, q + 1), ()) for q in range(num_qubits - 1)]
+    return instructions
+
+
+def random_circuit_instructions(
+    num_qubits: int,
+    depth: int,
+    rng: np.random.Generator
+) -> List[Instruction]:
+    """Random U3 layers interleaved with a brickwork of CZ gates"""
+    instructions: List[Instruction] = []
+    for layer in range(depth):
+        angles = rng.uniform(0, 2 * math.pi, size=(num_qubits, 3))
+        for q in range(num_qubits):
+            instructions.append(("u3", (q,), tuple(angles[q])))
+        for q in range(layer % 2, num_qubits - 1, 2):
+            instructions.append(("cz", (q, q + 1), ()))
+    return instructions
+
+
+def disentangle_instructions(num_qubits: int) -> List[Instruction]:
+    """Partially entangling RY/CX ladder used for separability analysis"""
+    instructions: List[Instruction] = []
+    for _ in range(2):
+        instructions += [("ry", (q,), (math.pi / 3,)) for q in range(num_qubits)]
+        instructions += [("cx", (q, q + 1), ()) for q in range(num_qubits - 1)]
+    return instructions
+
+
+def execute_local(payload: Dict[str, Any], config, circuit: Optional[Circuit] = None) -> Dict[str, Any]:
+    """
+    Run an ``/api/operations/execute`` payload in-process
+
+    Besides the operation parameters, a payload may carry local-engine
+    settings: ``seed``, ``optimize`` (compile before simulating),
+    ``noise`` (``{"gate_error", "readout_error"}``), ``mitigation``
+    (a list of ``"readout"``/``"depolarizing"``), ``engine`` (one of
+    ``ENGINES``) and ``max_bond`` (the MPS bond-dimension cap). They
+    default to the matching config fields, and are echoed back under
+    ``parameters`` so a run can be reproduced.
+
+    With ``engine="auto"``, circuits made only of Clifford gates (H, S,
+    Paulis, CX/CZ/CY/SWAP, quarter-turn rotations) run on the stabilizer
+    tableau in polynomial time, up to ``config.max_clifford_qubits``.
+    Circuits wider than ``config.max_qubits`` whose estimated bond
+    dimension (see :func:`dnalang.mps.estimate_bond`) fits within
+    ``max_bond`` run exactly on the matrix-product-state engine, up to
+    ``config.max_mps_qubits``. Anything else, or a run asking for
+    mitigation (which needs the dense distribution), uses the
+    statevector up to ``config.max_qubits`` and the sharded multi-process
+    statevector (``config.simulator_workers`` processes) beyond that, up
+    to ``config.max_sharded_qubits``. ``engine="mps"`` forces the
+    MPS, truncating to ``max_bond`` if needed; its result carries an
+    ``mps`` entry with the truncation error and an estimate of the
+    state fidelity.
+
+    Args:
+        payload: Request body as built by OperationsClient
+        config: DNALangConfig (the engine qubit limits, ``mps_max_bond``,
+            ``mps_cutoff``, ``simulator_workers``, ``simulator_engine``,
+            ``simulator_seed``,
+            ``optimize_circuits`` and ``simulator_noise`` are used)
+        circuit: Pre-parsed IR for ``custom`` (e.g. from the circuit
+            registry); parsed from ``payload["qasm"]`` when omitted
+
+    Returns:
+        Result dict shaped like the server response
+
+    Raises:
+        ValidationError: If the circuit is too wide or malformed
+    """
+    start = time.perf_counter()
+    operation = payload["operation"]
+    shots = int(payload.get("shots", config.default_shots))
+    rng = np.random.default_rng(payload.get("seed", config.simulator_seed))
+    noise = NoiseModel.from_dict(payload.get("noise", config.simulator_noise))
+    mitigation = list(payload.get("mitigation") or ())
+
+    if operation == "custom":
+        if circuit is None:
+            circuit = parse_circuit(payload["qasm"])
+        num_qubits, instructions = circuit.num_qubits, list(circuit.instructions())
+    else:
+        num_qubits = int(payload.get("qubits", 2))
+        if operation == "coherence":
+            if num_qubits < 2:
+                raise ValidationError("coherence needs at least 2 qubits")
+            instructions = ghz_instructions(num_qubits)
+        elif operation == "wflow":
+            instructions = random_circuit_instructions(num_qubits, int(payload.get("depth", 3)), rng)
+        elif operation == "disentangle":
+            instructions = disentangle_instructions(num_qubits)
+        else:
+            raise ValidationError(f"Operation {operation!r} has no local implementation")
+
+    max_bond = int(payload.get("max_bond", config.mps_max_bond))
+    if max_bond < 1:
+        raise ValidationError("max_bond must be at least 1")
+    engine = _select_engine(
+        payload.get("engine", config.simulator_engine), instructions, num_qubits, mitigation, max_bond, config
+    )
+
+    setting = _QUBIT_LIMITS[engine]
+    limit = getattr(config, setting)
+    if num_qubits > limit:
+        raise ValidationError(
+            f"{num_qubits} qubits exceeds {setting}={limit} for the local {engine} engine"
+        )
+
+    report = None
+    num_gates = sum(1 for inst in instructions if inst[0] not in NON_UNITARY)
+    if payload.get("optimize", config.optimize_circuits):
+        # The tableau takes named Clifford gates and the MPS at most
+        # two-qubit ones, so only the dense engines get fused blocks
+        instructions, report = compile_circuit(instructions, fuse=engine in _DENSE_ENGINES)
+        # Gates left on hardware: fused blocks still execute their member gates
+        num_gates = report["gates_before"] - report["cancelled"] - report["merged"]
+
+    if engine == "stabilizer":
+        sim = StabilizerSimulator(num_qubits).run(instructions)
+        result = _run_sampled(operation, sim, shots, rng, noise, num_gates)
+    elif engine == "mps":
+        sim = MPSSimulator(num_qubits, max_bond, config.mps_cutoff).run(instructions)
+        result = _run_sampled(operation, sim, shots, rng, noise, num_gates)
+        result["mps"] = {
+            "max_bond": max_bond,
+            "bond_dimension": sim.bond_dimension,
+            "truncation_error": sim.truncation_error,
+            "fidelity_estimate": sim.fidelity_estimate
+        }
+    else:
+        if engine == "sharded":
+            sim = ShardedStatevectorSimulator(num_qubits, workers=config.simulator_workers)
+        else:
+            sim = StatevectorSimulator(num_qubits)
+        try:
+            result = _run_dense(operation, sim.run(instructions), shots, rng, noise, num_gates, mitigation)
+        finally:
+            if engine == "sharded":
+                sim.close()
+    if operation == "custom":
+        result = {
+            "num_qubits": num_qubits,
+            "num_gates": circuit.num_gates,
+            "depth": circuit.depth(),
+            **result
+        }
+    result["engine"] = engine
+    if report is not None:
+        result["compilation"] = report
+
+    return {
+        "operation": operation,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "backend": "simulator",
+        "local": True,
+        "shots": shots,
+        "execution_time": time.perf_counter() - start,
+        "parameters": {
+            key: value for key, value in payload.items()
+            if key not in ("operation", "backend", "shots", "qasm")
+        },
+        "result": result
+    }
+
+
+def execute_parametric(payload: Dict[str, Any], config) -> Dict[str, Any]:
+    """
+    Run a ``parametric`` payload: one circuit under N parameter bindings
+
+    The program in ``payload["qasm"]`` is parsed once (see
+    :class:`~dnalang.parametric.ParametricCircuit`) and bound to the
+    (N, P) matrix in ``payload["bindings"]``, whose columns follow
+    ``payload["parameter_names"]`` (default: order of first use). All
+    bindings are simulated together on
+    :class:`~dnalang.batched.BatchedStatevectorSimulator`, in chunks of
+    ``BATCH_AMPLITUDES`` so memory stays bounded for large N. Simulation
+    is noiseless.
+
+    With ``observables`` (Pauli strings, qubit 0 leftmost) the result
+    holds their exact expectations as an (N, K) array; with ``shots``
+    (default ``config.default_shots`` when no observables are given) it
+    holds (N, 2**n) measurement counts indexed by basis state.
+
+    Args:
+        payload: Request body as built by
+            :meth:`OperationsClient.execute_parametric`
+        config: DNALangConfig (``max_qubits``, ``default_shots`` and
+            ``simulator_seed`` are used)
+
+    Returns:
+        Result dict shaped like :func:`execute_local`'s
+
+    Raises:
+        ValidationError: If the circuit is too wide or malformed, or the
+            binding matrix does not match the parameters
+    """
+    start = time.perf_counter()
+    names = payload.get("parameter_names")
+    template = parametric_circuit(payload["qasm"], tuple(names) if names is not None else None)
+    num_qubits = template.num_qubits
+    if num_qubits > config.max_qubits:
+        raise ValidationError(
+            f"{num_qubits} qubits exceeds max_qubits={config.max_qubits} for the local batched engine"
+        )
+    bindings = np.asarray(payload["bindings"], dtype=np.float64)
+    if bindings.ndim == 1:
+        bindings = bindings[None, :]
+    if bindings.ndim != 2 or bindings.shape[1] != len(template.parameters) or not len(bindings):
+        raise ValidationError(
+            f"bindings must be an (N, {len(template.parameters)}) matrix for parameters "
+            f"{template.parameters}, got shape {bindings.shape}"
+        )
+    observables = list(payload.get("observables") or ())
+    shots = int(payload.get("shots", 0 if observables else config.default_shots))
+    rng = np.random.default_rng(payload.get("seed", config.simulator_seed))
+
+    expectations, counts = [], []
+    for rows in batch_chunks(len(bindings), num_qubits):
+        block = bindings[rows]
+        sim = BatchedStatevectorSimulator(num_qubits, len(block)).run(template.bind(block))
+        if observables:
+            expectations.append(sim.expectation(observables))
+        if shots:
+            counts.append(sim.sample(shots, seed=rng))
+
+    result: Dict[str, Any] = {
+        "num_qubits": num_qubits,
+        "num_gates": template.num_gates,
+        "num_bindings": len(bindings),
+        "parameter_names": template.parameters,
+        "engine": "batched"
+    }
+    if observables:
+        result["observables"] = observables
+        result["expectations"] = np.concatenate(expectations)
+    if shots:
+        result["counts"] = np.concatenate(counts)
+
+    return {
+        "operation": "parametric",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "backend": "simulator",
+        "local": True,
+        "shots": shots,
+        "execution_time": time.perf_counter() - start,
+        "parameters": {
+            key: value for key, value in payload.items()
+            if key not in ("operation", "backend", "shots", "qasm", "bindings")
+        },
+        "result": result
+    }
+
+
+def _run_dense(
+    operation: str,
+    sim: StatevectorSimulator,
+    shots: int,
+    rng: np.random.Generator,
+    noise: NoiseModel,
+    num_gates: int,
+    mitigation: List[str]
+) -> Dict[str, Any]:
+    """Metrics from the full outcome distribution"""
+    ideal = sim.probabilities()
+    counts = sample_counts(noise.apply(ideal, num_gates), shots, seed=rng)
+    freqs = counts.probabilities()
+    if mitigation:
+        freqs = noise.mitigate(freqs, num_gates, mitigation)
+
+    if operation == "coherence":
+        result = _coherence_metrics(sim, freqs)
+    elif operation == "wflow":
+        result = _wflow_metrics(ideal, freqs)
+    elif operation == "disentangle":
+        result = _disentangle_metrics(sim)
+    else:
+        # Classical fidelity of the measured distribution to the ideal one
+        result = {"fidelity": float(np.sqrt(freqs * ideal).sum() ** 2)}
+    result["counts"] = counts.to_dict()
+    return result
+
+
+def _select_engine(
+    engine: str,
+    instructions: List[Instruction],
+    num_qubits: int,
+    mitigation: List[str],
+    max_bond: int,
+    config
+) -> str:
+    """Resolve ``engine`` (possibly ``"auto"``) for a circuit"""
+    if engine not in ENGINES:
+        raise ValidationError(f"Unknown engine {engine!r}; expected one of {', '.join(ENGINES)}")
+    dense = "sharded" if num_qubits > config.max_qubits else "statevector"
+    if engine in _DENSE_ENGINES:
+        return engine
+    if mitigation:
+        if engine != "auto":
+            raise ValidationError("Mitigation needs the dense distribution; use the statevector engine")
+        return dense
+    if engine == "stabilizer" and not is_clifford(instructions):
+        raise ValidationError("engine='stabilizer' needs a Clifford-only circuit")
+    if engine != "auto":
+        return engine
+    if is_clifford(instructions):
+        return "stabilizer"
+    if config.max_qubits < num_qubits <= config.max_mps_qubits:
+        try:
+            if estimate_bond(instructions, num_qubits) <= max_bond:
+                return "mps"
+        except ValidationError:
+            pass
+    return dense
+
+
+def _run_sampled(
+    operation: str,
+    sim,
+    shots: int,
+    rng: np.random.Generator,
+    noise: NoiseModel,
+    num_gates: int
+) -> Dict[str, Any]:
+    """
+    Metrics from an engine without a dense distribution
+
+    ``sim`` is a :class:`StabilizerSimulator` or :class:`MPSSimulator`;
+    both sample bit-packed outcomes and give the ideal probability and
+    Pauli expectations of individual outcomes, so the metrics match the
+    statevector path, with sums over all ``2**n`` outcomes replaced by
+    sums over the sampled ones.
+    """
+    num_qubits = sim.num_qubits
+    ideal_samples = sim.sample(shots, seed=rng)
+    samples = noise.corrupt(ideal_samples, num_qubits, num_gates, rng)
+    counts, outcomes = count_packed(samples, num_qubits)
+    freqs = np.fromiter(counts.values(), dtype=np.float64, count=len(counts)) / max(shots, 1)
+    ideal = sim.probabilities(outcomes)
+
+    if operation == "coherence":
+        zeros, ones = "0" * num_qubits, "1" * num_qubits
+        ends = sim.probabilities(np.array([[False] * num_qubits, [True] * num_qubits]))
+        pair = "{}" + "I" * (num_qubits - 2)
+        result = {
+            "fidelity": (counts.get(zeros, 0) + counts.get(ones, 0)) / max(shots, 1),
+            # |<0...0|psi>| * |<1...1|psi>|, as the dense path's amplitude product
+            "coherence": float(2 * np.sqrt(ends[0] * ends[1])),
+            "bell_violation": math.sqrt(2) * (
+                abs(sim.expectation(pair.format("ZZ"))) + abs(sim.expectation(pair.format("XX")))
+            )
+        }
+    elif operation == "wflow":
+        xeb = 2.0 ** num_qubits * float(np.dot(freqs, ideal)) - 1
+        # Outcomes never sampled have f = 0 and contribute their ideal mass
+        tvd = 0.5 * (float(np.abs(freqs - ideal).sum()) + max(0.0, 1.0 - float(ideal.sum())))
+        # Shannon entropy as the mean surprisal of ideal (noiseless) samples
+        if samples is not ideal_samples:
+            ideal_counts, outcomes = count_packed(ideal_samples, num_qubits)
+            weights = np.fromiter(ideal_counts.values(), dtype=np.float64, count=len(ideal_counts))
+            ideal = sim.probabilities(outcomes)
+        else:
+            weights = freqs * max(shots, 1)
+        entropy = float(-np.dot(weights, np.log2(np.maximum(ideal, 1e-300)))) / max(shots, 1)
+        result = {"wgf_cost": tvd, "fidelity_cost": xeb, "entropy": entropy}
+    elif operation == "disentangle":
+        result = _disentangle_metrics(sim)
+    else:
+        result = {"fidelity": float(np.sqrt(freqs * ideal).sum() ** 2)}
+    result["counts"] = counts
+    return result
+
+
+def _coherence_metrics(sim: StatevectorSimulator, freqs: np.ndarray) -> Dict[str, float]:
+    fidelity = freqs[0] + freqs[-1]
+    coherence = 2 * abs(sim.state[0] * np.conj(sim.state[-1]))
+
+    # CHSH bound for the first pair: sqrt(2) * (|<ZZ>| + |<XX>|)
+    probs = sim.probabilities()
+    index = np.arange(probs.size)
+    parity = 1 - 2 * (((index >> 0) ^ (index >> 1)) & 1)
+    zz = float(np.dot(parity, probs))
+    rotated = StatevectorSimulator(sim.num_qubits)
+    rotated.state[:] = sim.state
+    rotated.apply("h", (0,))
+    rotated.apply("h", (1,))
+    xx = float(np.dot(parity, rotated.probabilities()))
+
+    return {
+        "fidelity": float(fidelity),
+        "coherence": float(coherence),
+        "bell_violation": math.sqrt(2) * (abs(zz) + abs(xx))
+    }
+
+
+def _wflow_metrics(probs: np.ndarray, freqs: np.ndarray) -> Dict[str, float]:
+
+    # Linear cross-entropy benchmark fidelity of the samples
+    xeb = probs.size * float(np.dot(freqs, probs)) - 1
+    # Total variation distance between the sampled and ideal distributions
+    tvd = 0.5 * float(np.abs(freqs - probs).sum())
+    nonzero = probs[probs > 0]
+
+    return {
+        "wgf_cost": tvd,
+        "fidelity_cost": xeb,
+        "entropy": float(-np.sum(nonzero * np.log2(nonzero)))
+    }
+
+
+def _disentangle_metrics(sim) -> Dict[str, float]:
+    cut = sim.num_qubits // 2 or 1
+    schmidt = sim.reduced_purity(cut)
+    return {
+        "separability": schmidt["purity"],
+        "mutual_information": 2 * schmidt["entropy"],
+        "entanglement_entropy": schmidt["entropy"]
+    }
@@ -0,0 +1,228 @@
+"""DNALang Metrics Engine"""
+
+from typing import Dict, Any, Iterable, Optional, Union
+
+import numpy as np
+
+from .exceptions import ValidationError
+from .sampling import Counts
+
+CountsLike = Union[np.ndarray, Counts, Dict[str, int], Iterable[Dict[str, int]]]
+
+# Widest register expanded to dense ``2**n`` rows; wider dict input goes
+# through :func:`sparse_metrics`, keyed on the outcomes that occur
+DENSE_QUBITS = 20
+
+
+def _check_dense(num_qubits: int) -> None:
+    if num_qubits > DENSE_QUBITS:
+        raise ValidationError(
+            f"{num_qubits} qubits is too wide for a dense 2**n array "
+            f"(limit {DENSE_QUBITS}); use sparse_metrics for wide counts"
+        )
+
+
+def counts_matrix(counts: CountsLike, num_qubits: Optional[int] = None) -> np.ndarray:
+    """
+    Stack counts into a dense ``(batch, 2**n)`` array
+
+    Args:
+        counts: A count array, a stacked ``(batch, 2**n)`` array, a
+            :class:`Counts`, a ``{"bitstring": count}`` dict or a sequence
+            of dicts
+        num_qubits: Width for dict input (default: longest key)
+
+    Returns:
+        2-D count array (a single experiment becomes one row)
+
+    Raises:
+        ValidationError: If dict input is wider than :data:`DENSE_QUBITS`
+    """
+    if isinstance(counts, Counts):
+        counts = counts.array
+    if isinstance(counts, dict):
+        counts = [counts]
+    if not isinstance(counts, np.ndarray):
+        rows = list(counts)
+        if rows and isinstance(rows[0], dict):
+            return _dicts_to_matrix(rows, num_qubits)
+        counts = np.asarray(rows)
+    if counts.ndim == 1:
+        counts = counts[np.newaxis, :]
+    if counts.ndim != 2:
+        raise ValidationError(f"counts must be 1-D or 2-D, got shape {counts.shape}")
+    return counts
+
+
+def _dicts_to_matrix(rows, num_qubits: Optional[int]) -> np.ndarray:
+    if num_qubits is None:
+        num_qubits = max((len(k) for row in rows for k in row), default=1)
+    _check_dense(num_qubits)
+    sizes = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    total = int(sizes.sum())
+    columns = np.fromiter((int(k, 2) for row in rows for k in row), dtype=np.int64, count=total)
+    values = np.fromiter((v for row in rows for v in row.values()), dtype=np.float64, count=total)
+    if total and columns.max() >= 1 << num_qubits:
+        raise ValidationError(f"bitstring wider than num_qubits={num_qubits}")
+    matrix = np.zeros((len(rows), 1 << num_qubits), dtype=np.float64)
+    np.add.at(matrix, (np.repeat(np.arange(len(rows)), sizes), columns), values)
+    return matrix
+
+
+def ghz_target(num_qubits: int) -> np.ndarray:
+    """Ideal GHZ (Bell for two qubits) outcome distribution"""
+    _check_dense(num_qubits)
+    target = np.zeros(1 << num_qubits, dtype=np.float64)
+    target[0] = target[-1] = 0.5
+    return target
+
+
+def heavy_outputs(target: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of heavy outcomes
+
+    An outcome is heavy when its ideal probability exceeds the median
+    ideal probability (row-wise for a stacked target).
+    """
+    target = np.asarray(target, dtype=np.float64)
+    return target > np.median(target, axis=-1, keepdims=True)
+
+
+def compute_metrics(
+    counts: CountsLike,
+    target: Optional[np.ndarray] = None,
+    num_qubits: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Metrics for one experiment or a stacked batch in one vectorized pass
+
+    Args:
+        counts: Counts as accepted by :func:`counts_matrix`
+        target: Ideal outcome distribution, shape ``(2**n,)`` (shared by all
+            rows) or ``(batch, 2**n)``; target-relative metrics are omitted
+            when None
+        num_qubits: Width for dict input
+
+    Returns:
+        Dict of ``(batch,)`` arrays:
+
+        - ``total_shots``, ``num_states`` (outcomes observed) and
+          ``entropy`` (Shannon, bits)
+        - with a target: ``fidelity`` (measured population on the outcomes
+          the target allows, e.g. all-0/all-1 for GHZ), ``classical_fidelity``
+          (Bhattacharyya overlap ``(sum sqrt(p*q))**2``), ``tvd`` (total
+          variation distance), ``hellinger``, ``xeb`` (linear cross-entropy)
+          and ``heavy_output_probability``
+
+        Rows with zero shots yield NaN.
+
+    Example:
+        >>> batch = np.stack([run.array for run in runs])  # (100000, 4)
+        >>> m = compute_metrics(batch, target=ghz_target(2))
+        >>> m["fidelity"].mean(), m["heavy_output_probability"].min()
+    """
+    matrix = counts_matrix(counts, num_qubits)
+    if target is not None:
+        target = np.asarray(target, dtype=np.float64)
+        if target.shape[-1] != matrix.shape[1]:
+            raise ValidationError(
+                f"target has {target.shape[-1]} outcomes, counts have {matrix.shape[1]}"
+            )
+    return _metrics(matrix, target, matrix.shape[1])
+
+
+def sparse_metrics(
+    counts: Dict[str, int],
+    target: Optional[Dict[str, float]] = None,
+    num_qubits: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    :func:`compute_metrics` for one counts dict of any width
+
+    Works on the outcomes that occur in ``counts`` or ``target`` only, so
+    40+ qubit counts from the stabilizer and MPS engines cost nothing
+    extra; every other outcome has probability zero in both.
+
+    Args:
+        counts: ``{"bitstring": count}`` dict
+        target: Ideal outcome probabilities keyed by bitstring (default:
+            the GHZ distribution over ``num_qubits``)
+        num_qubits: Register width (default: longest key)
+
+    Returns:
+        Dict of ``(1,)`` arrays with the same keys as :func:`compute_metrics`
+    """
+    if num_qubits is None:
+        num_qubits = max((len(k) for k in counts), default=1)
+        if target is not None:
+            num_qubits = max([num_qubits, *(len(k) for k in target)])
+    if target is None:
+        target = {"0" * num_qubits: 0.5, "1" * num_qubits: 0.5}
+
+    columns: Dict[int, int] = {}
+    for key in (*counts, *target):
+        columns.setdefault(int(key, 2), len(columns))
+    if max(columns, default=0) >> num_qubits:
+        raise ValidationError(f"bitstring wider than num_qubits={num_qubits}")
+
+    matrix = np.zeros((1, len(columns)), dtype=np.float64)
+    ideal = np.zeros(len(columns), dtype=np.float64)
+    for key, count in counts.items():
+        matrix[0, columns[int(key, 2)]] += count
+    for key, probability in target.items():
+        ideal[columns[int(key, 2)]] += probability
+    return _metrics(matrix, ideal, 2.0 ** num_qubits)
+
+
+def _metrics(matrix: np.ndarray, target: Optional[np.ndarray], num_outcomes: float) -> Dict[str, np.ndarray]:
+    # ``matrix`` and ``target`` may cover a subset of the ``num_outcomes``
+    # outcomes; the rest are zero in both
+    shots = matrix.sum(axis=1, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        probs = matrix / shots[:, np.newaxis]
+
+    plogp = np.zeros_like(probs)
+    np.multiply(probs, np.log2(probs, out=plogp, where=probs > 0), out=plogp, where=probs > 0)
+
+    metrics = {
+        "total_shots": shots,
+        "num_states": np.count_nonzero(matrix, axis=1),
+        "entropy": np.where(shots > 0, -plogp.sum(axis=1), np.nan),
+    }
+    if target is None:
+        return metrics
+
+    target = target / target.sum(axis=-1, keepdims=True)
+    if target.shape[-1] < num_outcomes:
+        heavy = _heavy_outputs_sparse(target, num_outcomes)
+    else:
+        heavy = heavy_outputs(target)
+
+    overlap = np.sqrt(probs * target).sum(axis=1)
+    metrics.update({
+        "fidelity": (probs * (target > 0)).sum(axis=1),
+        "classical_fidelity": overlap ** 2,
+        "tvd": 0.5 * np.abs(probs - target).sum(axis=1),
+        "hellinger": np.sqrt(np.clip(1.0 - overlap, 0.0, None)),
+        "xeb": num_outcomes * (probs * target).sum(axis=1) - 1.0,
+        "heavy_output_probability": (probs * heavy).sum(axis=1),
+    })
+    return metrics
+
+
+def _heavy_outputs_sparse(target: np.ndarray, num_outcomes: float) -> np.ndarray:
+    # Median over the full outcome space: the omitted outcomes are zeros,
+    # so when they are the majority the median is zero
+    missing = int(num_outcomes) - target.shape[-1]
+    if 2 * missing > num_outcomes:
+        return target > 0
+    padding = np.zeros(target.shape[:-1] + (missing,))
+    median = np.median(np.concatenate([target, padding], axis=-1), axis=-1, keepdims=True)
+    return target > median
+
+
+def summarize(metrics: Dict[str, np.ndarray], index: int = 0) -> Dict[str, Any]:
+    """Plain-Python view of one row of :func:`compute_metrics` output"""
+    row = {key: value[index].item() for key, value in metrics.items()}
+    row["total_shots"] = int(row["total_shots"])
+    return row
@@ -0,0 +1,289 @@
+"""DNALang Matrix-Product-State Simulator"""
+
+import math
+from typing import Dict, Any, Iterable, List, Sequence
+
+import numpy as np
+
+from .compiler import instruction_matrix, _swap_order
+from .exceptions import ValidationError
+from .sampling import SeedLike, count_packed, make_rng, _check_shots
+from .statevector import CONTROLLED_GATES, FIXED_GATES, Instruction, NON_UNITARY, gate_matrix
+
+_SHOT_CHUNK = 4096
+
+_PAULIS = {
+    "I": FIXED_GATES["id"], "X": FIXED_GATES["x"], "Y": FIXED_GATES["y"], "Z": FIXED_GATES["z"]
+}
+
+
+def estimate_bond(instructions: Iterable[Instruction], num_qubits: int) -> int:
+    """
+    Upper bound on the bond dimension a circuit needs to run exactly
+
+    Each two-qubit gate adds at most one bit of Schmidt rank to every cut
+    it spans: one for controlled gates (CX, CZ, CP, ...), two for SWAP and
+    general two-qubit unitaries. The bound at each cut is also capped by
+    the smaller side's Hilbert space.
+
+    Raises:
+        ValidationError: For gates on more than two qubits, which the
+            MPS engine does not take
+    """
+    bits = np.zeros(num_qubits + 1, dtype=np.int64)
+    for name, qubits, _ in instructions:
+        if name in NON_UNITARY or len(qubits) < 2:
+            continue
+        if len(qubits) > 2:
+            raise ValidationError(f"The MPS engine takes one- and two-qubit gates, not {name!r}")
+        low, high = sorted(qubits)
+        weight = 1 if name in CONTROLLED_GATES else 2
+        # Cut c lies between qubits c - 1 and c
+        bits[low + 1] += weight
+        bits[high + 1] -= weight
+    crossing = np.cumsum(bits)[1:num_qubits]
+    if crossing.size == 0:
+        return 1
+    sides = np.minimum(np.arange(1, num_qubits), np.arange(num_qubits - 1, 0, -1))
+    exponent = np.minimum(crossing, sides).max()
+    return 1 << int(min(exponent, 62))
+
+
+class MPSSimulator:
+    """
+    Matrix-product-state simulator for wide, weakly entangled circuits
+
+    The state is a chain of ``(chi_left, 2, chi_right)`` tensors, one per
+    qubit, kept in mixed canonical form around a moving orthogonality
+    centre. Two-qubit gates on neighbours contract the pair, apply the
+    gate and split it again by SVD, keeping at most ``max_bond`` singular
+    values and dropping those whose weight is below ``cutoff``; gates on
+    distant qubits are routed through a SWAP network. Memory and time
+    scale with ``num_qubits * max_bond**2`` instead of ``2**num_qubits``,
+    so shallow circuits on 40-80+ qubits are cheap.
+
+    Whenever singular values are dropped the state is renormalised and
+    the discarded weight is added to :attr:`truncation_error`;
+    :attr:`fidelity_estimate` is the product of the per-split kept
+    weights, an estimate of ``|<exact|mps>|**2``.
+
+    Qubit 0 is the rightmost bit of outcome bitstrings, as in
+    :class:`~dnalang.statevector.StatevectorSimulator`.
+
+    Args:
+        num_qubits: Number of qubits
+        max_bond: Bond-dimension cap
+        cutoff: Discarded-weight threshold per singular value
+
+    Example:
+        >>> sim = MPSSimulator(60, max_bond=32)
+        >>> sim.run(random_circuit_instructions(60, 4, rng))
+        >>> sim.bond_dimension, sim.truncation_error < 1e-12
+        (4, True)
+    """
+
+    def __init__(self, num_qubits: int, max_bond: int = 64, cutoff: float = 1e-12):
+        if num_qubits < 1:
+            raise ValidationError("num_qubits must be positive")
+        if max_bond < 1:
+            raise ValidationError("max_bond must be at least 1")
+        if not 0.0 <= cutoff < 1.0:
+            raise ValidationError("cutoff must be in [0, 1)")
+        self.num_qubits = num_qubits
+        self.max_bond = int(max_bond)
+        self.cutoff = float(cutoff)
+        zero = np.zeros((1, 2, 1), dtype=np.complex128)
+        zero[0, 0, 0] = 1.0
+        self.tensors: List[np.ndarray] = [zero.copy() for _ in range(num_qubits)]
+        self.truncation_error = 0.0
+        self.fidelity_estimate = 1.0
+        self._centre = 0
+
+    @property
+    def bond_dimension(self) -> int:
+        """Largest bond currently in the chain"""
+        return max(t.shape[2] for t in self.tensors)
+
+    @property
+    def bond_dimensions(self) -> List[int]:
+        """Bond between qubit ``q`` and ``q + 1`` for every cut"""
+        return [t.shape[2] for t in self.tensors[:-1]]
+
+    def _check(self, qubits: Sequence[int]) -> None:
+        for q in qubits:
+            if not 0 <= q < self.num_qubits:
+                raise ValidationError(f"Qubit index {q} out of range for {self.num_qubits} qubits")
+        if len(set(qubits)) != len(qubits):
+            raise ValidationError(f"Repeated qubit in {tuple(qubits)}")
+
+    def _move_centre(self, site: int) -> None:
+        tensors = self.tensors
+        while self._centre < site:
+            c = self._centre
+            left, _, right = tensors[c].shape
+            q, r = np.linalg.qr(tensors[c].reshape(left * 2, right))
+            tensors[c] = q.reshape(left, 2, -1)
+            tensors[c + 1] = np.tensordot(r, tensors[c + 1], axes=1)
+            self._centre += 1
+        while self._centre > site:
+            c = self._centre
+            left, _, right = tensors[c].shape
+            q, r = np.linalg.qr(tensors[c].reshape(left, 2 * right).T)
+            tensors[c] = q.T.reshape(-1, 2, right)
+            tensors[c - 1] = np.tensordot(tensors[c - 1], r.T, axes=1)
+            self._centre -= 1
+
+    def _apply_1q(self, matrix: np.ndarray, qubit: int) -> None:
+        self.tensors[qubit] = np.einsum("ij,ajb->aib", matrix, self.tensors[qubit])
+
+    def _apply_adjacent(self, matrix: np.ndarray, site: int) -> None:
+        """4x4 ``matrix`` on sites ``(site, site + 1)``, ``site`` the MSB"""
+        self._move_centre(site)
+        a, b = self.tensors[site], self.tensors[site + 1]
+        left, right = a.shape[0], b.shape[2]
+        theta = np.einsum("aib,bjc->aijc", a, b)
+        theta = np.einsum("klij,aijc->aklc", matrix.reshape(2, 2, 2, 2), theta)
+        u, s, vh = np.linalg.svd(theta.reshape(left * 2, 2 * right), full_matrices=False)
+
+        weights = s ** 2
+        total = weights.sum()
+        keep = min(self.max_bond, int(np.count_nonzero(weights > self.cutoff * total)) or 1)
+        discarded = float(weights[keep:].sum() / total)
+        if discarded > 0:
+            self.truncation_error += discarded
+            self.fidelity_estimate *= 1.0 - discarded
+        s = s[:keep] / math.sqrt(weights[:keep].sum())
+
+        self.tensors[site] = u[:, :keep].reshape(left, 2, keep)
+        self.tensors[site + 1] = (s[:, None] * vh[:keep]).reshape(keep, 2, right)
+        self._centre = site + 1
+
+    def apply_2q(self, matrix: np.ndarray, q0: int, q1: int) -> None:
+        """
+        Apply a 4x4 unitary with ``q0`` as its most significant qubit
+
+        Distant qubits are brought next to each other with SWAPs and
+        moved back afterwards; the SWAPs truncate like any other gate.
+        """
+        self._check((q0, q1))
+        if q0 > q1:
+            matrix, q0, q1 = _swap_order(matrix), q1, q0
+        swap = instruction_matrix("swap", (), ())
+        for site in range(q1 - 1, q0, -1):
+            self._apply_adjacent(swap, site)
+        self._apply_adjacent(matrix, q0)
+        for site in range(q0 + 1, q1):
+            self._apply_adjacent(swap, site)
+
+    def apply(self, name: str, qubits: Sequence[int], params: Sequence[float] = ()) -> None:
+        """
+        Apply a named gate
+
+        Raises:
+            ValidationError: For unknown gates, bad qubit indices or gates
+                on more than two qubits
+        """
+        qubits = tuple(qubits)
+        if name in NON_UNITARY:
+            return
+        self._check(qubits)
+        if len(qubits) == 1:
+            matrix = params[0] if name == "unitary" else gate_matrix(name, params)
+            self._apply_1q(np.asarray(matrix, dtype=np.complex128), qubits[0])
+        elif len(qubits) == 2:
+            self.apply_2q(np.asarray(instruction_matrix(name, qubits, params), dtype=np.complex128), *qubits)
+        else:
+            raise ValidationError(f"The MPS engine takes one- and two-qubit gates, not {name!r}")
+
+    def run(self, instructions: Iterable[Instruction]) -> "MPSSimulator":
+        for name, qubits, params in instructions:
+            self.apply(name, qubits, params)
+        return self
+
+    def amplitudes(self, outcomes: np.ndarray) -> np.ndarray:
+        """
+        Amplitude of each outcome
+
+        Args:
+            outcomes: (m, n) bool array, column ``q`` = qubit ``q``
+
+        Returns:
+            (m,) complex amplitudes
+        """
+        outcomes = np.atleast_2d(np.asarray(outcomes, dtype=np.bool_)).astype(np.intp)
+        env = np.ones((outcomes.shape[0], 1), dtype=np.complex128)
+        for q, tensor in enumerate(self.tensors):
+            # tensor[:, bits, :] is (left, m, right)
+            env = np.einsum("ma,amb->mb", env, tensor[:, outcomes[:, q], :])
+        return env[:, 0]
+
+    def probabilities(self, outcomes: np.ndarray) -> np.ndarray:
+        """Ideal probability of each outcome ((m, n) bool, column ``q`` = qubit ``q``)"""
+        return np.abs(self.amplitudes(outcomes)) ** 2
+
+    def expectation(self, pauli: str) -> float:
+        """Expectation of a Pauli string (qubit 0 leftmost, optional sign)"""
+        sign = -1.0 if pauli.startswith("-") else 1.0
+        letters = pauli.lstrip("+-").upper()
+        if len(letters) != self.num_qubits or set(letters) - set(_PAULIS):
+            raise ValidationError(f"Pauli string must have {self.num_qubits} letters from IXYZ")
+        env = np.ones((1, 1), dtype=np.complex128)
+        for letter, tensor in zip(letters, self.tensors):
+            if letter == "I":
+                env = np.einsum("ab,aic,bid->cd", env, tensor.conj(), tensor)
+            else:
+                env = np.einsum("ab,aic,ij,bjd->cd", env, tensor.conj(), _PAULIS[letter], tensor)
+        return sign * float(env[0, 0].real)
+
+    def reduced_purity(self, num_low: int) -> Dict[str, Any]:
+        """
+        Schmidt decomposition across the cut after the ``num_low`` low qubits
+
+        Returns:
+            Dict with the subsystem ``purity`` and ``entropy`` (bits)
+        """
+        if not 0 < num_low < self.num_qubits:
+            return {"purity": 1.0, "entropy": 0.0}
+        self._move_centre(num_low)
+        tensor = self.tensors[num_low]
+        schmidt = np.linalg.svd(tensor.reshape(tensor.shape[0], -1), compute_uv=False) ** 2
+        schmidt = schmidt[schmidt > 1e-15]
+        return {
+            "purity": float(np.sum(schmidt ** 2)),
+            "entropy": float(-np.sum(schmidt * np.log2(schmidt)))
+        }
+
+    def sample(self, shots: int, seed: SeedLike = None) -> np.ndarray:
+        """
+        Measure every qubit ``shots`` times
+
+        Qubits are sampled in order, each conditioned on the bits already
+        drawn, with all shots of a chunk advanced together; cost is
+        ``O(shots * n * max_bond**2)``.
+
+        Returns:
+            (shots, ceil(n / 8)) uint8 outcomes, bit ``q`` of each row
+            (little-endian bit order) holding qubit ``q``; see
+            :func:`dnalang.sampling.count_packed`
+        """
+        shots = _check_shots(shots)
+        rng = make_rng(seed)
+        # With the centre on qubit 0 every later tensor is right-canonical,
+        # so conditional probabilities need only the left environment
+        self._move_centre(0)
+        bits = np.empty((shots, self.num_qubits), dtype=np.bool_)
+        for start in range(0, shots, _SHOT_CHUNK):
+            stop = min(start + _SHOT_CHUNK, shots)
+            env = np.ones((stop - start, 1), dtype=np.complex128)
+            for q, tensor in enumerate(self.tensors):
+                branch = np.einsum("sa,aib->sib", env, tensor)
+                weight = np.einsum("sib,sib->si", branch, branch.conj()).real
+                one = rng.random(stop - start) * weight.sum(axis=1) < weight[:, 1]
+                bits[start:stop, q] = one
+                chosen = branch[np.arange(stop - start), one.astype(np.intp)]
+                env = chosen / np.sqrt(weight[np.arange(stop - start), one.astype(np.intp)])[:, None]
+        return np.packbits(bits, axis=1, bitorder="little")
+
+    def sample_counts(self, shots: int, seed: SeedLike = None) -> Dict[str, int]:
+        """Counts keyed by bitstring (qubit 0 rightmost)"""
+        return count_packed(self.sample(shots, seed), self.num_qubits)[0]
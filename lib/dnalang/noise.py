@@ -0,0 +1,153 @@
+"""DNALang Noise Model and Error Mitigation"""
+
+from typing import Dict, Any, Iterable, Optional
+
+import numpy as np
+
+from .exceptions import ValidationError
+
+MITIGATIONS = ("readout", "depolarizing")
+
+
+def _check_noise(noise: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    noise = dict(noise or {})
+    unknown = set(noise) - {"gate_error", "readout_error"}
+    if unknown:
+        raise ValidationError(f"Unknown noise parameters: {', '.join(sorted(unknown))}")
+    gate_error = float(noise.get("gate_error", 0.0))
+    readout_error = float(noise.get("readout_error", 0.0))
+    if not 0.0 <= gate_error < 1.0 or not 0.0 <= readout_error < 0.5:
+        raise ValidationError("gate_error must be in [0, 1) and readout_error in [0, 0.5)")
+    return {"gate_error": gate_error, "readout_error": readout_error}
+
+
+def _per_qubit(probs: np.ndarray, num_qubits: int, keep: float, flip: float) -> np.ndarray:
+    """Apply the 2x2 map [[keep, flip], [flip, keep]] to every qubit of a distribution"""
+    out = np.array(probs, dtype=np.float64)
+    for q in range(num_qubits):
+        view = out.reshape(-1, 2, 1 << q)
+        low, high = view[:, 0, :].copy(), view[:, 1, :]
+        view[:, 0, :] = keep * low + flip * high
+        view[:, 1, :] = keep * high + flip * low
+    return out
+
+
+def _renormalise(probs: np.ndarray) -> np.ndarray:
+    probs = np.clip(probs, 0.0, None)
+    total = probs.sum()
+    return probs / total if total > 0 else probs
+
+
+class NoiseModel:
+    """
+    Global depolarizing gate noise plus symmetric readout error
+
+    Gate noise keeps the ideal distribution with probability
+    ``(1 - gate_error) ** num_gates`` and otherwise yields a uniformly random
+    outcome; readout flips each measured bit with ``readout_error``. The
+    same calibration drives the matching mitigations.
+
+    Args:
+        gate_error: Depolarizing probability per gate
+        readout_error: Per-qubit bit-flip probability at measurement
+
+    Example:
+        >>> model = NoiseModel(gate_error=0.002, readout_error=0.02)
+        >>> noisy = model.apply(sim.probabilities(), num_gates=120)
+        >>> freqs = model.mitigate(counts.probabilities(), 120, ["readout"])
+    """
+
+    def __init__(self, gate_error: float = 0.0, readout_error: float = 0.0):
+        checked = _check_noise({"gate_error": gate_error, "readout_error": readout_error})
+        self.gate_error = checked["gate_error"]
+        self.readout_error = checked["readout_error"]
+
+    @classmethod
+    def from_dict(cls, noise: Optional[Dict[str, Any]]) -> "NoiseModel":
+        return cls(**_check_noise(noise))
+
+    @property
+    def is_ideal(self) -> bool:
+        return self.gate_error == 0.0 and self.readout_error == 0.0
+
+    def survival(self, num_gates: int) -> float:
+        """Probability that no depolarizing error occurred"""
+        return (1.0 - self.gate_error) ** num_gates
+
+    def apply(self, probs: np.ndarray, num_gates: int) -> np.ndarray:
+        """Noisy outcome distribution for an ideal one"""
+        if self.is_ideal:
+            return probs
+        num_qubits = max(1, (probs.size - 1).bit_length())
+        survival = self.survival(num_gates)
+        noisy = survival * probs + (1.0 - survival) / probs.size
+        if self.readout_error:
+            p = self.readout_error
+            noisy = _per_qubit(noisy, num_qubits, 1.0 - p, p)
+        return noisy
+
+    def corrupt(self, samples: np.ndarray, num_qubits: int, num_gates: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Apply the model shot by shot to bit-packed ideal outcomes
+
+        For engines that sample without a dense distribution: each shot is
+        replaced by a uniformly random outcome with probability
+        ``1 - survival`` and then has every bit flipped with
+        ``readout_error``, which matches :meth:`apply` in distribution.
+
+        Args:
+            samples: (shots, ceil(num_qubits / 8)) uint8, little-endian bits
+            num_qubits: Qubits per outcome
+            num_gates: Gates executed
+            rng: Generator to draw the errors from
+
+        Returns:
+            Noisy outcomes in the same layout (``samples`` if ideal)
+        """
+        if self.is_ideal:
+            return samples
+        out = np.array(samples, dtype=np.uint8)
+        shots, width = out.shape
+        if self.gate_error:
+            depolarized = np.flatnonzero(rng.random(shots) >= self.survival(num_gates))
+            tail = np.packbits(np.ones(num_qubits, dtype=np.bool_), bitorder="little")
+            out[depolarized] = rng.integers(0, 256, size=(depolarized.size, width), dtype=np.uint8) & tail
+        if self.readout_error:
+            flips = rng.random((shots, num_qubits)) < self.readout_error
+            out ^= np.packbits(flips, axis=1, bitorder="little")
+        return out
+
+    def mitigate(
+        self,
+        freqs: np.ndarray,
+        num_gates: int,
+        methods: Iterable[str] = ()
+    ) -> np.ndarray:
+        """
+        Undo calibrated noise on empirical frequencies
+
+        ``readout`` inverts the per-qubit confusion matrix; ``depolarizing``
+        rescales away the uniform component. Negative quasi-probabilities
+        are clipped and the result renormalised.
+
+        Raises:
+            ValidationError: For an unknown method
+        """
+        methods = list(methods)
+        unknown = set(methods) - set(MITIGATIONS)
+        if unknown:
+            raise ValidationError(f"Unknown mitigation: {', '.join(sorted(unknown))}")
+
+        out = np.asarray(freqs, dtype=np.float64)
+        num_qubits = max(1, (out.size - 1).bit_length())
+        if "readout" in methods and self.readout_error:
+            p = self.readout_error
+            scale = 1.0 - 2.0 * p
+            out = _renormalise(_per_qubit(out, num_qubits, (1.0 - p) / scale, -p / scale))
+        if "depolarizing" in methods and self.gate_error:
+            survival = self.survival(num_gates)
+            out = _renormalise((out - (1.0 - survival) / out.size) / survival)
+        return out
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"gate_error": self.gate_error, "readout_error": self.readout_error}
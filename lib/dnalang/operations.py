@@ -1,12 +1,52 @@
 """DNALang Quantum Operations"""
 
-from typing import Dict, Any, Optional
+import asyncio
+import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Iterator, Tuple
+
+from .exceptions import DNALangException, OperationError, ValidationError
+from .registry import CircuitRegistry, RegisteredCircuit
+from .scheduler import MIN_RUNG_SHOTS, SuccessiveHalving, rung_shots
+
+EXECUTE_ENDPOINT = "/api/operations/execute"
+BATCH_ENDPOINT = "/api/operations/execute/batch"
 
 class OperationsClient:
-    """Client for quantum operations"""
+    """
+    Client for quantum operations
+
+    With ``config.local_simulator`` enabled (the default), operations on
+    ``backend="simulator"`` run in-process: Clifford-only circuits (such
+    as ``coherence``'s GHZ preparation) on the stabilizer tableau, which
+    handles thousands of qubits, wide but weakly entangled circuits (such
+    as shallow ``wflow`` runs on 40-80 qubits) on the matrix-product-state
+    engine, and everything else on the statevector engine, sharded across
+    worker processes in shared memory above ``config.max_qubits`` (see
+    :func:`dnalang.local.execute_local`).
+    Otherwise simulator executions go over HTTP and are served from the
+    client's result cache when an identical request was made within
+    ``config.cache_ttl``.
+
+    Custom circuits are registered by content hash in ``circuits``; once
+    the server has stored a circuit, later executions send only its hash.
+    """
 
     def __init__(self, client):
         self.client = client
+        self.circuits = CircuitRegistry(maxsize=client.config.circuit_registry_size)
+
+    def _is_local(self, payload: Dict[str, Any]) -> bool:
+        return payload.get("backend") == "simulator" and self.client.config.local_simulator
+
+    def _execute(self, payload: Dict[str, Any], circuit=None):
+        """Route a payload to the local engine or the execute endpoint"""
+        if self._is_local(payload):
+            from .local import execute_local
+            return self.client.run_local(execute_local, payload, self.client.config, circuit)
+        simulator = payload.get("backend") == "simulator"
+        return self.client.request("POST", EXECUTE_ENDPOINT, data=payload, cache=simulator)
 
     def coherence(
         self,
@@ -29,7 +69,7 @@ class OperationsClient:
             >>> result = client.operations.coherence(shots=4096)
             >>> print(f"Fidelity: {result['fidelity']:.4f}")
         """
-        return self.client.request("POST", "/api/operations/execute", data={
+        return self._execute({
             "operation": "coherence",
             "shots": shots,
             "qubits": qubits,
@@ -41,7 +81,9 @@ class OperationsClient:
         shots: int = 2048,
         qubits: int = 5,
         depth: int = 3,
-        backend: str = "simulator"
+        backend: str = "simulator",
+        engine: Optional[str] = None,
+        max_bond: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Random circuit sampling for WGF measurement
@@ -51,17 +93,32 @@ class OperationsClient:
             qubits: Number of qubits
             depth: Circuit depth
             backend: Quantum backend
+            engine: Local engine override (``"statevector"`` or ``"mps"``;
+                default ``config.simulator_engine``)
+            max_bond: MPS bond-dimension cap (default ``config.mps_max_bond``)
 
         Returns:
-            WGF and fidelity metrics
+            WGF and fidelity metrics; MPS runs add an ``mps`` entry with
+            the bond dimension reached, the truncation error and a
+            fidelity estimate
+
+        Example:
+            >>> result = client.operations.wflow(qubits=60, depth=4)
+            >>> result["engine"], result["mps"]["truncation_error"] < 1e-9
+            ('mps', True)
         """
-        return self.client.request("POST", "/api/operations/execute", data={
+        payload = {
             "operation": "wflow",
             "shots": shots,
             "qubits": qubits,
             "depth": depth,
             "backend": backend
-        })
+        }
+        if engine is not None:
+            payload["engine"] = engine
+        if max_bond is not None:
+            payload["max_bond"] = max_bond
+        return self._execute(payload)
 
     def disentangle(
         self,
@@ -80,36 +137,506 @@ class OperationsClient:
         Returns:
             Separability metrics
         """
-        return self.client.request("POST", "/api/operations/execute", data={
+        return self._execute({
             "operation": "disentangle",
             "shots": shots,
             "qubits": qubits,
             "backend": backend
         })
 
+    def register_circuit(self, qasm: str) -> str:
+        """
+        Parse, validate and register a QASM program by content hash
+
+        Args:
+            qasm: OpenQASM code
+
+        Returns:
+            Hex SHA-256 of the program, usable as ``custom(circuit_hash=...)``
+
+        Raises:
+            ValidationError: If the QASM does not parse
+
+        Example:
+            >>> h = client.operations.register_circuit(qasm)
+            >>> for shots in (1024, 4096, 16384):
+            ...     client.operations.custom(circuit_hash=h, shots=shots)
+        """
+        entry = self.circuits.register(qasm)
+        if not entry.valid:
+            raise ValidationError(entry.error)
+        return entry.hash
+
     def custom(
         self,
-        qasm: str,
+        qasm: Optional[str] = None,
         shots: int = 2048,
-        backend: str = "simulator"
+        backend: str = "simulator",
+        circuit_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute custom QASM circuit
 
+        The program is hashed and parsed once per client; repeat calls
+        reuse the parsed IR, and after the first successful remote
+        execution only the hash is sent. If the server has since dropped
+        the circuit, the call transparently resends the full program.
+
         Args:
             qasm: OpenQASM code
             shots: Number of shots
             backend: Quantum backend
+            circuit_hash: Hash from :meth:`register_circuit`, instead of ``qasm``
 
         Returns:
             Execution results
+
+        Raises:
+            ValidationError: If the QASM does not parse, or the hash is
+                unknown to a local run (checked before any request is sent)
         """
-        return self.client.request("POST", "/api/operations/execute", data={
+        if qasm is not None:
+            entry = self.circuits.register(qasm)
+            if circuit_hash is not None and circuit_hash != entry.hash:
+                raise ValidationError("circuit_hash does not match the QASM content")
+        elif circuit_hash is not None:
+            entry = self.circuits.get(circuit_hash)
+        else:
+            raise ValidationError("custom() needs qasm or circuit_hash")
+        if entry is not None and not entry.valid:
+            raise ValidationError(entry.error)
+
+        payload = {
             "operation": "custom",
-            "qasm": qasm,
+            "circuit_hash": entry.hash if entry is not None else circuit_hash,
             "shots": shots,
             "backend": backend
-        })
+        }
+        if self._is_local(payload):
+            return self._execute(payload, self.circuits.resolve(payload["circuit_hash"]).circuit)
+        if entry is None:
+            # Unknown locally; the server may still hold it
+            return self._execute(payload)
+        if inspect.iscoroutinefunction(self.client.request):
+            return self._send_circuit_async(entry, payload)
+        if self.circuits.is_remote(entry.hash):
+            try:
+                return self._execute(payload)
+            except OperationError as e:
+                if entry.hash not in str(e):
+                    raise
+                self.circuits.mark_remote(entry.hash, stored=False)
+        result = self._execute({**payload, "qasm": entry.qasm})
+        self.circuits.mark_remote(entry.hash)
+        return result
+
+    async def _send_circuit_async(self, entry: RegisteredCircuit, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.circuits.is_remote(entry.hash):
+            try:
+                return await self._execute(payload)
+            except OperationError as e:
+                if entry.hash not in str(e):
+                    raise
+                self.circuits.mark_remote(entry.hash, stored=False)
+        result = await self._execute({**payload, "qasm": entry.qasm})
+        self.circuits.mark_remote(entry.hash)
+        return result
+
+    def execute_parametric(
+        self,
+        qasm: str,
+        bindings,
+        parameter_names: Optional[List[str]] = None,
+        observables: Optional[List[str]] = None,
+        shots: Optional[int] = None,
+        backend: str = "simulator",
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute one parametrized circuit under many parameter bindings
+
+        Gate angles in ``qasm`` may name free parameters, e.g.
+        ``ry(theta0) q[0];``. The circuit is sent or parsed once together
+        with an (N, P) binding matrix instead of N separate submissions;
+        locally all N bindings are simulated at once on a statevector
+        with a leading batch axis (see
+        :func:`dnalang.local.execute_parametric`).
+
+        Args:
+            qasm: OpenQASM code with free parameters
+            bindings: (N, P) array-like of parameter values, one row per
+                binding
+            parameter_names: Column order of ``bindings`` (default: order
+                of first use in ``qasm``)
+            observables: Pauli strings (qubit 0 leftmost) to evaluate
+                exactly per binding
+            shots: Shots per binding (default ``config.default_shots``
+                without observables, none with them)
+            backend: Quantum backend
+            seed: Sampling seed (default ``config.simulator_seed``)
+
+        Returns:
+            Execution results; ``result["expectations"]`` is an (N, K)
+            array and ``result["counts"]`` an (N, 2**n) array indexed by
+            basis state (nested lists from a remote backend)
+
+        Example:
+            >>> thetas = np.linspace(0, np.pi, 1000)[:, None]
+            >>> result = client.operations.execute_parametric(
+            ...     qasm, thetas, observables=["ZI", "XX"]
+            ... )
+            >>> result["result"]["expectations"].shape
+            (1000, 2)
+        """
+        payload = {
+            "operation": "parametric",
+            "qasm": qasm,
+            "bindings": bindings,
+            "backend": backend
+        }
+        if parameter_names is not None:
+            payload["parameter_names"] = list(parameter_names)
+        if observables is not None:
+            payload["observables"] = list(observables)
+        if shots is not None:
+            payload["shots"] = shots
+        if seed is not None:
+            payload["seed"] = seed
+        if self._is_local(payload):
+            from .local import execute_parametric
+            return self.client.run_local(execute_parametric, payload, self.client.config)
+        if hasattr(bindings, "tolist"):
+            payload["bindings"] = bindings.tolist()
+        return self.client.request("POST", EXECUTE_ENDPOINT, data=payload)
+
+    def vqe(
+        self,
+        hamiltonian,
+        ansatz,
+        optimizer="lbfgs",
+        parameter_names: Optional[List[str]] = None,
+        initial=None,
+        max_iterations: int = 200,
+        tol: float = 1e-8,
+        gtol: float = 1e-5,
+        seed: Optional[int] = None
+    ):
+        """
+        Find a Hamiltonian's ground-state energy variationally
+
+        Runs locally on the batched statevector (see
+        :class:`dnalang.vqe.VQE`): each gradient evaluates the ansatz and
+        all of its parameter-shifted copies as one batch.
+
+        Args:
+            hamiltonian: :class:`~dnalang.vqe.Hamiltonian`, or
+                ``(coefficient, pauli)`` pairs (qubit 0 leftmost)
+            ansatz: QASM with free parameters, or a
+                :class:`~dnalang.parametric.ParametricCircuit`
+            optimizer: ``"lbfgs"``, ``"adam"``, ``"spsa"`` or an
+                :class:`~dnalang.vqe.Optimizer` instance
+            parameter_names: Parameter order (default: order of first use)
+            initial: Starting parameters (default: small random angles)
+            max_iterations: Optimizer steps
+            tol: Energy-change tolerance
+            gtol: Gradient-norm tolerance
+            seed: Seed for the initial point and SPSA
+
+        Returns:
+            :class:`~dnalang.vqe.VQEResult` with per-iteration energies
+            and timings
+
+        Raises:
+            ValidationError: If the ansatz is wider than
+                ``config.max_qubits`` or does not match the Hamiltonian
+
+        Example:
+            >>> from dnalang.vqe import hardware_efficient_ansatz
+            >>> result = client.operations.vqe(
+            ...     [(-1.0, "ZZ"), (-0.5, "XI"), (-0.5, "IX")],
+            ...     hardware_efficient_ansatz(2, layers=1)
+            ... )
+            >>> round(result.energy, 4)
+            -1.4142
+        """
+        from .vqe import VQE
+        solver = VQE(hamiltonian, ansatz, optimizer, parameter_names)
+        limit = self.client.config.max_qubits
+        if solver.ansatz.num_qubits > limit:
+            raise ValidationError(f"{solver.ansatz.num_qubits} qubits exceeds max_qubits={limit}")
+        return self.client.run_local(solver.run, initial, max_iterations, tol, gtol, seed)
+
+    def sweep(
+        self,
+        specs: List[Dict[str, Any]],
+        metric: str,
+        higher: bool = True,
+        eta: int = 2,
+        min_shots: int = MIN_RUNG_SHOTS,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Pick the best spec of a parameter sweep by successive halving
+
+        Every spec first runs on ``1/eta**K`` of its shots; each rung keeps
+        the best ``1/eta`` of the survivors and gives them ``eta`` times
+        more shots, until one spec runs at its full ``shots``. Specs with
+        ``"backend": "simulator"`` run on the local engine (with the
+        default ``config.local_simulator``); any other spec is sent to the
+        API, as in :meth:`execute_many`.
+
+        Args:
+            specs: Operation dicts, e.g. ``{"operation": "wflow", "qubits": 5,
+                "shots": 4096, "backend": "simulator"}``
+            metric: Key of ``result["result"]`` to rank by
+            higher: Whether higher metric values are better
+            eta: Keep ``1/eta`` of the specs per rung
+            min_shots: Floor on shots for any single evaluation
+            concurrency: Evaluations in flight per rung (default ``config.batch_concurrency``)
+
+        Returns:
+            Dict with ``index`` and ``spec`` of the winner, its full-budget
+            ``result``, the last ``scores`` seen per spec index and a
+            ``shots`` report (total spent vs. the full-allocation baseline);
+            an awaitable when used from AsyncQuantumClient
+
+        Example:
+            >>> specs = [{"operation": "wflow", "qubits": 6, "depth": d, "shots": 4096,
+            ...           "backend": "simulator"} for d in range(1, 33)]
+            >>> best = client.operations.sweep(specs, metric="wgf_cost", higher=False)
+            >>> print(best["spec"], f"{best['shots']['savings']:.1f}x fewer shots")
+        """
+        specs = [dict(spec) for spec in specs]
+        full = [int(spec.get("shots", self.client.config.default_shots)) for spec in specs]
+        halving = SuccessiveHalving(len(specs), eta=eta, higher=higher)
+        concurrency = max(1, concurrency or self.client.config.batch_concurrency)
+
+        if inspect.iscoroutinefunction(self.client.request):
+            return self._sweep_async(specs, full, metric, halving, min_shots, concurrency)
+
+        final: Dict[int, Dict[str, Any]] = {}
+
+        def evaluate(index: int, fraction: float):
+            shots = rung_shots(full[index], fraction, min_shots)
+            result = self._execute({**specs[index], "shots": shots})
+            if shots == full[index]:
+                final[index] = result
+            return float(result["result"][metric]), shots
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            winner = halving.run(evaluate, executor.map)
+        return _sweep_result(specs, full, halving, final[winner])
+
+    async def _sweep_async(
+        self,
+        specs: List[Dict[str, Any]],
+        full: List[int],
+        metric: str,
+        halving: SuccessiveHalving,
+        min_shots: int,
+        concurrency: int
+    ) -> Dict[str, Any]:
+        semaphore = asyncio.Semaphore(concurrency)
+        final: Dict[int, Dict[str, Any]] = {}
+
+        async def evaluate(index: int, shots: int):
+            async with semaphore:
+                result = await self._execute({**specs[index], "shots": shots})
+            if shots == full[index]:
+                final[index] = result
+            return float(result["result"][metric])
+
+        while not halving.done:
+            shots = [rung_shots(full[i], halving.fraction, min_shots) for i in halving.active]
+            scores = await asyncio.gather(*[
+                evaluate(index, n) for index, n in zip(halving.active, shots)
+            ])
+            halving.report(scores, shots)
+        return _sweep_result(specs, full, halving, final[halving.best])
+
+    def execute_many(
+        self,
+        specs: List[Dict[str, Any]],
+        ordered: bool = True,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Execute many operations through the batch endpoint
+
+        Specs are packed into batch requests bounded by ``batch_size`` items
+        and ``config.batch_max_bytes`` of JSON, and up to ``concurrency``
+        batches run at once. Results stream back as they arrive; a failed
+        item (or a failed batch request) is reported on the affected items
+        instead of aborting the sweep.
+
+        Args:
+            specs: Operation dicts, e.g. ``{"operation": "wflow", "qubits": 5, ...}``
+            ordered: Yield in spec order (True) or as batches complete (False)
+            batch_size: Max operations per request (default ``config.batch_size``)
+            concurrency: Batch requests in flight (default ``config.batch_concurrency``)
+
+        Returns:
+            Iterator of ``{"index", "status", "result", "error"}`` dicts; an
+            async iterator when used from AsyncQuantumClient
+
+        Example:
+            >>> specs = [{"operation": "wflow", "shots": 1024, "qubits": q, "depth": d}
+            ...          for q in range(2, 10) for d in range(1, 8)]
+            >>> for item in client.operations.execute_many(specs):
+            ...     if item["status"] == "ok":
+            ...         print(item["index"], item["result"]["result"])
+        """
+        config = self.client.config
+        batches = _pack_batches(
+            list(specs),
+            batch_size or config.batch_size,
+            config.batch_max_bytes
+        )
+        concurrency = max(1, concurrency or config.batch_concurrency)
+
+        if inspect.iscoroutinefunction(self.client.request):
+            return self._execute_many_async(batches, ordered, concurrency)
+        return self._execute_many_sync(batches, ordered, concurrency)
+
+    def _execute_many_sync(
+        self,
+        batches: List[List[Tuple[int, Dict]]],
+        ordered: bool,
+        concurrency: int
+    ) -> Iterator[Dict[str, Any]]:
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = [executor.submit(self._run_batch, batch) for batch in batches]
+            reorder = _InOrder() if ordered else None
+            for future in as_completed(futures):
+                items = future.result()
+                yield from reorder.push(items) if reorder else items
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _execute_many_async(
+        self,
+        batches: List[List[Tuple[int, Dict]]],
+        ordered: bool,
+        concurrency: int
+    ):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(batch):
+            async with semaphore:
+                try:
+                    response = await self.client.request(
+                        "POST", BATCH_ENDPOINT,
+                        data={"operations": [spec for _, spec in batch]}
+                    )
+                except DNALangException as e:
+                    return _batch_failed(batch, e)
+                return _unpack_batch(batch, response)
+
+        tasks = [asyncio.ensure_future(run(batch)) for batch in batches]
+        try:
+            reorder = _InOrder() if ordered else None
+            for next_done in asyncio.as_completed(tasks):
+                items = await next_done
+                for item in (reorder.push(items) if reorder else items):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _run_batch(self, batch: List[Tuple[int, Dict]]) -> List[Dict[str, Any]]:
+        try:
+            response = self.client.request(
+                "POST", BATCH_ENDPOINT,
+                data={"operations": [spec for _, spec in batch]}
+            )
+        except DNALangException as e:
+            return _batch_failed(batch, e)
+        return _unpack_batch(batch, response)
+
+
+def _sweep_result(
+    specs: List[Dict[str, Any]],
+    full: List[int],
+    halving: SuccessiveHalving,
+    result: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "index": halving.best,
+        "spec": specs[halving.best],
+        "result": result,
+        "scores": dict(halving.scores),
+        "shots": halving.summary(full_allocation=sum(full))
+    }
+
+
+def _pack_batches(
+    specs: List[Dict[str, Any]],
+    batch_size: int,
+    max_bytes: int
+) -> List[List[Tuple[int, Dict]]]:
+    """Split specs into batches bounded by item count and JSON size"""
+    batches: List[List[Tuple[int, Dict]]] = []
+    current: List[Tuple[int, Dict]] = []
+    current_bytes = 0
+
+    for index, spec in enumerate(specs):
+        size = len(json.dumps(spec, separators=(",", ":"))) + 1
+        if current and (len(current) >= batch_size or current_bytes + size > max_bytes):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append((index, spec))
+        current_bytes += size
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _unpack_batch(batch: List[Tuple[int, Dict]], response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Map a batch response back onto global spec indices"""
+    by_position = {r.get("index"): r for r in response.get("results", [])}
+    items = []
+    for position, (index, _) in enumerate(batch):
+        entry = by_position.get(position)
+        if entry is None:
+            items.append(_item(index, error="missing from batch response"))
+        elif entry.get("status") == "error":
+            items.append(_item(index, error=entry.get("error", "operation failed")))
+        else:
+            items.append(_item(index, result=entry.get("result")))
+    return items
+
+
+def _batch_failed(batch: List[Tuple[int, Dict]], error: Exception) -> List[Dict[str, Any]]:
+    return [_item(index, error=str(error)) for index, _ in batch]
+
+
+def _item(index: int, result: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "status": "error" if error is not None else "ok",
+        "result": result,
+        "error": error
+    }
+
+
+class _InOrder:
+    """Buffer out-of-order batch results and release them by index"""
+
+    def __init__(self):
+        self.next_index = 0
+        self.pending: Dict[int, Dict[str, Any]] = {}
+
+    def push(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for item in items:
+            self.pending[item["index"]] = item
+        ready = []
+        while self.next_index in self.pending:
+            ready.append(self.pending.pop(self.next_index))
+            self.next_index += 1
+        return ready
 
 
 class CoherenceOperation:
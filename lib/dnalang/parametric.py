@@ -0,0 +1,115 @@
+"""DNALang Parametrized Circuits"""
+
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+from .qasm import _Parser, tokenize
+from .statevector import Instruction
+
+_ARRAY_FUNCTIONS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "exp": np.exp, "ln": np.log, "sqrt": np.sqrt,
+}
+
+
+class _FreeParameters(dict):
+    """Symbol table that admits any identifier, in order of first use"""
+
+    def __contains__(self, token) -> bool:
+        if isinstance(token, str) and token.isidentifier():
+            self.setdefault(token, 0.0)
+            return True
+        return False
+
+
+class _BindingParser(_Parser):
+    """Evaluates gate angles over (N,) arrays of parameter values"""
+
+    functions = _ARRAY_FUNCTIONS
+
+    def __init__(self, tokens: List[str], symbols: Optional[Dict[str, Any]] = None):
+        super().__init__(tokens, symbols)
+        # Operation index -> angles holding per-binding arrays
+        self.bound: Dict[int, Tuple[Any, ...]] = {}
+
+    def emit(self, opcode: int, qubits: List[int], params: List[Any]) -> None:
+        if any(np.ndim(p) for p in params):
+            self.bound[len(self.circuit)] = tuple(params)
+            params = [0.0] * len(params)
+        self.circuit.append(opcode, qubits, params)
+
+
+class ParametricCircuit:
+    """
+    OpenQASM 2 program whose gate angles may use free parameters
+
+    Any identifier in a gate-call angle that is not ``pi``, a function or
+    a gate argument is a circuit parameter, e.g. ``ry(theta0) q[0];`` or
+    ``rz(2*gamma - pi/4) q[1];``. The program is tokenized and checked
+    once; :meth:`bind` then evaluates every angle over a whole (N, P)
+    matrix of values at once, giving instructions whose parametrized
+    angles are (N,) arrays for
+    :class:`~dnalang.batched.BatchedStatevectorSimulator`.
+
+    Args:
+        qasm: OpenQASM 2 source
+        parameters: Parameter names in column order (default: order of
+            first use in the program)
+
+    Raises:
+        ValidationError: If the program is malformed or uses an unknown
+            identifier when ``parameters`` is given
+
+    Example:
+        >>> template = ParametricCircuit(qasm)
+        >>> template.parameters
+        ['theta0', 'theta1']
+        >>> instructions = template.bind(np.random.uniform(0, np.pi, (1000, 2)))
+    """
+
+    def __init__(self, qasm: str, parameters: Optional[Sequence[str]] = None):
+        if not isinstance(qasm, str):
+            raise ValidationError("QASM source must be a string")
+        self.qasm = qasm
+        self._tokens = tokenize(qasm)
+        symbols = _FreeParameters() if parameters is None else {name: 0.0 for name in parameters}
+        circuit = _BindingParser(self._tokens, symbols).parse()
+        self.parameters: List[str] = list(symbols) if parameters is None else list(parameters)
+        self.num_qubits = circuit.num_qubits
+        self.num_gates = circuit.num_gates
+
+    def bind(self, values: np.ndarray) -> List[Instruction]:
+        """
+        Instructions for N bindings at once
+
+        Args:
+            values: (N, P) parameter values, column ``j`` for
+                ``parameters[j]`` (a single (P,) row is accepted)
+
+        Returns:
+            ``(name, qubits, params)`` list; angles that depend on the
+            parameters are (N,) arrays, the rest floats
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[None, :]
+        if values.ndim != 2 or values.shape[1] != len(self.parameters):
+            raise ValidationError(
+                f"Expected an (N, {len(self.parameters)}) parameter matrix, got shape {values.shape}"
+            )
+        symbols = {name: values[:, j] for j, name in enumerate(self.parameters)}
+        parser = _BindingParser(self._tokens, symbols)
+        circuit = parser.parse()
+        return [
+            (name, qubits, parser.bound.get(i, params))
+            for i, (name, qubits, params) in enumerate(circuit.instructions())
+        ]
+
+
+@lru_cache(maxsize=128)
+def parametric_circuit(qasm: str, parameters: Optional[Tuple[str, ...]] = None) -> ParametricCircuit:
+    """:class:`ParametricCircuit` memoised on the source and parameter names"""
+    return ParametricCircuit(qasm, parameters)
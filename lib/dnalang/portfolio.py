@@ -0,0 +1,495 @@
+"""DNALang Portfolio Optimisation"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+
+# Binary digits per allocation slot: each asset holds 0..2**bits - 1 steps
+# of max_allocation / (2**bits - 1)
+ALLOCATION_BITS = 4
+
+SOLVERS = ("tabu", "anneal")
+
+# Penalty weights: budget relative to the objective per allocation step,
+# return target relative to the budget
+BUDGET_STIFFNESS = 20.0
+RETURN_STIFFNESS = 0.1
+
+# Move budget floor, so small portfolios still explore
+MIN_MOVES = 200
+
+# Locally, shots buy annealing replicas rather than measurements
+SHOTS_PER_REPLICA = 512
+MAX_REPLICAS = 64
+
+# Rebuild only the covariance rows of changed assets while at most this
+# share of them changed since the previous call
+INCREMENTAL_SHARE = 0.25
+
+
+def return_matrix(assets: Sequence[Dict[str, Any]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Stack the assets' ``returns`` histories into an (assets x periods) array
+
+    Histories of different lengths are aligned on their most recent
+    periods, trimmed to the shortest one.
+
+    Raises:
+        ValidationError: If an asset has no symbol or no returns
+    """
+    if not assets:
+        raise ValidationError("Portfolio needs at least one asset")
+    symbols, histories = [], []
+    for asset in assets:
+        symbol = asset.get("symbol")
+        returns = asset.get("returns")
+        if not symbol or not returns:
+            raise ValidationError("Every asset needs a symbol and a non-empty returns list")
+        symbols.append(str(symbol))
+        histories.append(returns)
+    if len(set(symbols)) != len(symbols):
+        raise ValidationError("Asset symbols must be unique")
+    periods = min(len(h) for h in histories)
+    return symbols, np.array([h[len(h) - periods:] for h in histories], dtype=np.float64)
+
+
+def portfolio_statistics(returns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-period expected returns and sample covariance of an (assets x periods) array"""
+    mean = returns.mean(axis=1)
+    centered = returns - mean[:, None]
+    cov = centered @ centered.T / max(returns.shape[1] - 1, 1)
+    return mean, cov
+
+
+class PortfolioQUBO:
+    """
+    Mean-variance portfolio selection as a QUBO
+
+    Each asset's weight is a ``bits``-digit binary number of
+    ``max_allocation / (2**bits - 1)`` steps, so the per-asset cap holds by
+    construction. The energy is
+
+        (1 - risk_tolerance) * w'Σw - risk_tolerance * μ'w
+        + A * (Σw - 1)**2 + B * (μ'w - s - target_return)**2
+
+    where ``s >= 0`` is a binary-encoded slack slot turning the return
+    target into a floor. All terms are quadratic in the bits; the solvers
+    work on the factored form (one slot per asset plus the slack) and
+    :meth:`matrix` expands the explicit upper-triangular Q for small
+    problems or external samplers.
+
+    Args:
+        mean: Expected return per asset
+        cov: Covariance matrix
+        target_return: Minimum portfolio return the penalty enforces
+        risk_tolerance: Weight on return versus risk, in [0, 1]
+        max_allocation: Per-asset weight cap, in (0, 1]
+        bits: Binary digits per slot
+    """
+
+    def __init__(
+        self,
+        mean: np.ndarray,
+        cov: np.ndarray,
+        target_return: float,
+        risk_tolerance: float,
+        max_allocation: float,
+        bits: int = ALLOCATION_BITS
+    ):
+        num_assets = mean.size
+        if not 0.0 <= risk_tolerance <= 1.0:
+            raise ValidationError("risk_tolerance must be in [0, 1]")
+        if not 0.0 < max_allocation <= 1.0:
+            raise ValidationError("max_allocation must be in (0, 1]")
+        if max_allocation * num_assets < 1.0 - 1e-9:
+            raise ValidationError(
+                f"max_allocation {max_allocation} cannot fully invest {num_assets} assets"
+            )
+        if bits < 1:
+            raise ValidationError("bits must be at least 1")
+
+        self.num_assets = num_assets
+        self.bits = bits
+        self.levels = (1 << bits) - 1
+        self.mean = mean
+        self.target_return = float(target_return)
+        self.max_allocation = float(max_allocation)
+
+        # Slack absorbs any return above the target, up to the best reachable
+        headroom = max(float(mean.max()) - target_return, 0.0)
+        self.step = np.append(
+            np.full(num_assets, max_allocation / self.levels),
+            headroom / self.levels
+        )
+        budget = np.append(np.ones(num_assets), 0.0)
+        exposure = np.append(mean, -1.0)
+
+        risk = np.zeros((num_assets + 1, num_assets + 1))
+        risk[:num_assets, :num_assets] = cov
+        objective_scale = (1.0 - risk_tolerance) * np.abs(cov).max() + risk_tolerance * np.abs(mean).max()
+        objective_scale = max(objective_scale, 1e-12)
+        # One allocation step off budget must cost more than any one-step
+        # gain, and more than closing a return shortfall by over-investing
+        self.budget_penalty = BUDGET_STIFFNESS * objective_scale / self.step[0]
+        self.return_penalty = RETURN_STIFFNESS * self.budget_penalty / max(float(np.max(mean ** 2)), 1e-12)
+
+        # E(w) = w'Mw + g'w + c over slot weights w = level * step
+        self.coupling = (
+            (1.0 - risk_tolerance) * risk
+            + self.budget_penalty * np.outer(budget, budget)
+            + self.return_penalty * np.outer(exposure, exposure)
+        )
+        self.field = (
+            -risk_tolerance * np.append(mean, 0.0)
+            - 2.0 * self.budget_penalty * budget
+            - 2.0 * self.return_penalty * target_return * exposure
+        )
+        self.offset = self.budget_penalty + self.return_penalty * target_return ** 2
+
+    @property
+    def num_variables(self) -> int:
+        return (self.num_assets + 1) * self.bits
+
+    def weights(self, levels: np.ndarray) -> np.ndarray:
+        """Slot weights for integer levels (any leading batch axes)"""
+        return levels * self.step
+
+    def energy(self, levels: np.ndarray) -> np.ndarray:
+        """QUBO energy of integer levels (any leading batch axes)"""
+        w = self.weights(levels)
+        return np.einsum("...i,ij,...j->...", w, self.coupling, w) + w @ self.field + self.offset
+
+    def matrix(self) -> Tuple[np.ndarray, float]:
+        """
+        Explicit QUBO: upper-triangular Q and offset with E(x) = x'Qx + offset
+
+        Variable ``slot * bits + k`` is digit ``k`` of slot ``slot``; the
+        last slot is the return slack.
+        """
+        scale = (self.step[:, None] * (1 << np.arange(self.bits))).ravel()
+        slot = np.repeat(np.arange(self.num_assets + 1), self.bits)
+        full = self.coupling[np.ix_(slot, slot)] * np.outer(scale, scale)
+        q = np.triu(full, 1) * 2.0
+        q[np.diag_indices_from(q)] = np.diag(full) + self.field[slot] * scale
+        return q, self.offset
+
+
+def solve_qubo(
+    qubo: PortfolioQUBO,
+    replicas: int = 16,
+    iterations: Optional[int] = None,
+    method: str = "tabu",
+    seed: Optional[int] = None,
+    initial: Optional[np.ndarray] = None,
+    patience: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Minimise a :class:`PortfolioQUBO` with parallel single-bit-flip replicas
+
+    All replicas advance together as one (replicas x slots) array. Every
+    iteration scores all bit flips of every replica from a maintained local
+    field ``W @ M``, so a move costs O(slots) per replica. ``tabu`` takes
+    the best non-tabu flip (aspiration overrides tabu on a new best);
+    ``anneal`` is rejection-free simulated annealing, sampling a flip
+    from the Boltzmann distribution over all flips on a geometric
+    temperature schedule.
+
+    Args:
+        qubo: Problem to solve
+        replicas: Independent searches run side by side
+        iterations: Moves per replica (default ``2 * variables``, at least ``MIN_MOVES``)
+        method: ``"tabu"`` or ``"anneal"``
+        seed: RNG seed
+        initial: Starting levels, shape (slots,) or (replicas, slots)
+        patience: Stop once no replica improved for this many moves
+            (default ``variables / 2``)
+
+    Returns:
+        Dict with the best ``levels``, its ``energy``, per-replica best
+        energies, moves run and seconds to reach the best energy
+    """
+    if method not in SOLVERS:
+        raise ValidationError(f"Unknown solver: {method}")
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    slots, bits = qubo.num_assets + 1, qubo.bits
+    iterations = max(2 * qubo.num_variables, MIN_MOVES) if iterations is None else iterations
+    patience = max(qubo.num_variables // 2, MIN_MOVES // 2) if patience is None else patience
+
+    if initial is None:
+        levels = _initial_levels(qubo, replicas, rng)
+    else:
+        levels = np.broadcast_to(np.asarray(initial, dtype=np.int64), (replicas, slots)).copy()
+    levels = np.clip(levels, 0, qubo.levels)
+
+    digit = (1 << np.arange(bits))
+    move_size = qubo.step[:, None] * digit  # weight change of each flip, (slots, bits)
+    rows = np.arange(replicas)
+
+    local_field = qubo.weights(levels) @ qubo.coupling
+    energy = qubo.energy(levels)
+    best_energy = energy.copy()
+    best_levels = levels.copy()
+    tabu_until = np.zeros((replicas, slots * bits), dtype=np.int64)
+    tenure = max(3, min(25, qubo.num_variables // 10))
+    if method == "anneal":
+        uphill = _flip_deltas(qubo, levels, local_field, move_size)[1]
+        uphill = uphill[uphill > 0]
+        # Geometric cooling from the cheapest uphill flips' cost to 1/1000 of it
+        hot = float(np.percentile(uphill, 1)) if uphill.size else 1.0
+        temperatures = hot * np.geomspace(1.0, 1e-3, max(iterations, 1))
+
+    time_to_best = 0.0
+    last_improvement = 0
+    moves = 0
+    for moves in range(1, iterations + 1):
+        delta_w, delta = _flip_deltas(qubo, levels, local_field, move_size)
+
+        if method == "tabu":
+            allowed = (tabu_until < moves) | (energy[:, None] + delta < best_energy[:, None] - 1e-12)
+            choice = np.where(allowed, delta, np.inf).argmin(axis=1)
+            tabu_until[rows, choice] = moves + tenure + rng.integers(0, tenure, size=replicas)
+        else:
+            # Gumbel-max over flips: log(Exp(1)) is minus a Gumbel variate
+            noise = np.log(rng.standard_exponential(delta.shape, dtype=np.float32) + 1e-30)
+            choice = (delta + temperatures[moves - 1] * noise).argmin(axis=1)
+
+        slot, bit = np.divmod(choice, bits)
+        step = delta_w[rows, choice]
+        energy += delta[rows, choice]
+        levels[rows, slot] ^= digit[bit]
+        local_field += step[:, None] * qubo.coupling[slot]
+
+        improved = energy < best_energy - 1e-12
+        if improved.any():
+            best_energy[improved] = energy[improved]
+            best_levels[improved] = levels[improved]
+            last_improvement = moves
+            time_to_best = time.perf_counter() - start
+        elif moves - last_improvement >= patience:
+            break
+
+    winner = int(best_energy.argmin())
+    return {
+        "levels": best_levels[winner],
+        "energy": float(best_energy[winner]),
+        "replica_energies": best_energy,
+        "iterations": moves,
+        "time_to_best": time_to_best,
+        "wall_time": time.perf_counter() - start
+    }
+
+
+def _initial_levels(qubo: PortfolioQUBO, replicas: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Fully invested starting points, from an even spread (first replica) to
+    the highest-return assets filled to the cap (last replica)
+
+    Blends are rounded stochastically, so replicas also differ in detail.
+    """
+    num_assets = qubo.num_assets
+    step = qubo.step[0]
+    even = np.full(num_assets, 1.0 / (num_assets * step))
+    greedy = np.zeros(num_assets)
+    order = np.argsort(-qubo.mean, kind="stable")
+    filled = int(1.0 // qubo.max_allocation)
+    greedy[order[:filled]] = qubo.levels
+    greedy[order[filled:filled + 1]] = (1.0 - filled * qubo.max_allocation) / step
+    blend = np.linspace(0.0, 1.0, replicas)[:, None]
+    target = (1.0 - blend) * even + blend * greedy
+    levels = np.floor(target + rng.random(target.shape)).astype(np.int64)
+    return np.concatenate([np.clip(levels, 0, qubo.levels), np.zeros((replicas, 1), dtype=np.int64)], axis=1)
+
+
+def _flip_deltas(qubo, levels, local_field, move_size) -> Tuple[np.ndarray, np.ndarray]:
+    """Weight change and energy change of every single-bit flip, each (replicas, slots * bits)"""
+    sign = 1 - 2 * ((levels[:, :, None] >> np.arange(qubo.bits)) & 1)
+    delta_w = move_size * sign
+    delta = (
+        delta_w * (2.0 * local_field[:, :, None] + qubo.field[:, None])
+        + delta_w ** 2 * np.diag(qubo.coupling)[:, None]
+    )
+    return delta_w.reshape(len(levels), -1), delta.reshape(len(levels), -1)
+
+
+def repair(weights: np.ndarray, max_allocation: float) -> np.ndarray:
+    """Project weights onto the fully invested, capped simplex by rescaling and water-filling"""
+    weights = np.clip(weights, 0.0, None)
+    if weights.sum() <= 0:
+        weights = np.ones_like(weights)
+    weights = weights / weights.sum()
+    for _ in range(weights.size):
+        over = weights > max_allocation
+        if not over.any():
+            break
+        excess = (weights[over] - max_allocation).sum()
+        weights[over] = max_allocation
+        free = weights < max_allocation
+        weights[free] += excess * weights[free] / weights[free].sum() if weights[free].sum() > 0 else excess / free.sum()
+    return weights
+
+
+class PortfolioOptimizer:
+    """
+    Local QUBO engine behind ``FinanceClient.optimize_portfolio``
+
+    Keeps the previous call's return matrix, statistics and solution.
+    When only a few assets' prices changed, only their covariance rows
+    are recomputed, and when the universe and allocation step match, the
+    replicas start from the previous solution with a quarter of the
+    iteration and patience budgets.
+
+    Example:
+        >>> optimizer = PortfolioOptimizer()
+        >>> result = optimizer.optimize(assets, target_return=0.1, seed=7)
+        >>> result["result"]["qubo"]["warm_start"]
+        False
+    """
+
+    def __init__(self, method: str = "tabu", bits: int = ALLOCATION_BITS):
+        if method not in SOLVERS:
+            raise ValidationError(f"Unknown solver: {method}")
+        self.method = method
+        self.bits = bits
+        self._lock = threading.Lock()
+        self._symbols: Tuple[str, ...] = ()
+        self._returns: Optional[np.ndarray] = None
+        self._centered: Optional[np.ndarray] = None
+        self._mean: Optional[np.ndarray] = None
+        self._cov: Optional[np.ndarray] = None
+        self._solution: Dict[str, int] = {}
+        self._step: Optional[float] = None
+
+    def statistics(self, symbols: List[str], returns: np.ndarray) -> Tuple[np.ndarray, np.ndarray, str]:
+        """Mean and covariance, reusing the cached ones where the data did not change"""
+        same = (
+            tuple(symbols) == self._symbols
+            and self._returns is not None
+            and self._returns.shape == returns.shape
+        )
+        if same:
+            changed = np.flatnonzero((returns != self._returns).any(axis=1))
+            if changed.size == 0:
+                return self._mean, self._cov, "cached"
+            if changed.size <= INCREMENTAL_SHARE * len(symbols):
+                mean, cov, centered = self._mean.copy(), self._cov.copy(), self._centered.copy()
+                mean[changed] = returns[changed].mean(axis=1)
+                centered[changed] = returns[changed] - mean[changed, None]
+                rows = centered[changed] @ centered.T / max(returns.shape[1] - 1, 1)
+                cov[changed, :] = rows
+                cov[:, changed] = rows.T
+                self._store(symbols, returns, centered, mean, cov)
+                return mean, cov, "incremental"
+        mean, cov = portfolio_statistics(returns)
+        self._store(symbols, returns, returns - mean[:, None], mean, cov)
+        return mean, cov, "full"
+
+    def _store(self, symbols, returns, centered, mean, cov) -> None:
+        self._symbols = tuple(symbols)
+        self._returns, self._centered, self._mean, self._cov = returns, centered, mean, cov
+
+    def optimize(
+        self,
+        assets: List[Dict],
+        target_return: float = 0.12,
+        risk_tolerance: float = 0.5,
+        max_allocation: float = 0.3,
+        shots: int = 8192,
+        seed: Optional[int] = None,
+        warm_start: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Optimise a portfolio in-process
+
+        Args:
+            assets: Asset dicts with ``symbol`` and a ``returns`` history
+            target_return: Minimum expected per-period return
+            risk_tolerance: Weight on return versus risk (0-1)
+            max_allocation: Maximum weight per asset
+            shots: Sets the replica count (one per ``SHOTS_PER_REPLICA``)
+            seed: RNG seed
+            warm_start: Start from the previous solution when possible
+
+        Returns:
+            Result dict shaped like the server response, plus a ``qubo``
+            report (variables, energy, solver, warm start, covariance reuse,
+            time to best)
+        """
+        start = time.perf_counter()
+        symbols, returns = return_matrix(assets)
+        replicas = int(np.clip(shots // SHOTS_PER_REPLICA, 1, MAX_REPLICAS))
+
+        with self._lock:
+            mean, cov, covariance = self.statistics(symbols, returns)
+            qubo = PortfolioQUBO(mean, cov, target_return, risk_tolerance, max_allocation, self.bits)
+            initial = None
+            if warm_start and self._solution and self._step == qubo.step[0]:
+                initial = self._warm_levels(symbols, replicas, seed)
+
+        iterations = max(2 * qubo.num_variables, MIN_MOVES)
+        patience = max(qubo.num_variables // 2, MIN_MOVES // 2)
+        if initial is not None:
+            iterations, patience = iterations // 4, patience // 4
+        solution = solve_qubo(
+            qubo, replicas=replicas, iterations=iterations, method=self.method,
+            seed=seed, initial=initial, patience=patience
+        )
+        levels = solution["levels"]
+
+        with self._lock:
+            self._solution = dict(zip(symbols, levels[:-1].tolist()))
+            self._step = qubo.step[0]
+
+        weights = repair(qubo.weights(levels)[:-1], max_allocation)
+        expected = float(weights @ mean)
+        risk = float(np.sqrt(max(weights @ cov @ weights, 0.0)))
+        return {
+            "operation": "finance_optimize_portfolio",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "backend": "simulator",
+            "local": True,
+            "shots": shots,
+            "execution_time": time.perf_counter() - start,
+            "parameters": {
+                "target_return": target_return,
+                "risk_tolerance": risk_tolerance,
+                "max_allocation": max_allocation,
+                "seed": seed
+            },
+            "result": {
+                "optimal_allocation": [
+                    {"symbol": symbol, "allocation": float(weight)}
+                    for symbol, weight in zip(symbols, weights)
+                ],
+                "expected_return": expected,
+                "risk": risk,
+                "sharpe_ratio": expected / risk if risk > 0 else None,
+                "target_met": expected >= target_return - 1e-9,
+                "qubo": {
+                    "variables": qubo.num_variables,
+                    "bits_per_asset": qubo.bits,
+                    "energy": solution["energy"],
+                    "solver": self.method,
+                    "replicas": replicas,
+                    "iterations": solution["iterations"],
+                    "warm_start": initial is not None,
+                    "covariance": covariance,
+                    "time_to_best": solution["time_to_best"],
+                    "solve_time": solution["wall_time"]
+                }
+            }
+        }
+
+    def _warm_levels(self, symbols: List[str], replicas: int, seed: Optional[int]) -> np.ndarray:
+        """Previous levels for known symbols (0 for new ones); replicas past the first are perturbed"""
+        base = np.array([self._solution.get(s, 0) for s in symbols] + [0], dtype=np.int64)
+        levels = np.tile(base, (replicas, 1))
+        rng = np.random.default_rng(seed)
+        flips = rng.integers(0, 2, size=levels[1:].shape) * (rng.random(levels[1:].shape) < 0.05)
+        levels[1:] ^= flips << rng.integers(0, self.bits, size=levels[1:].shape)
+        return levels
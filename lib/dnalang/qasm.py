@@ -0,0 +1,558 @@
+"""DNALang OpenQASM 2 Parser"""
+
+import math
+import re
+from array import array
+from functools import lru_cache
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+
+from .exceptions import ValidationError
+
+# (name, number of parameters, number of qubits; None = variadic)
+GATES: List[Tuple[str, int, Optional[int]]] = [
+    ("id", 0, 1), ("x", 0, 1), ("y", 0, 1), ("z", 0, 1), ("h", 0, 1),
+    ("s", 0, 1), ("sdg", 0, 1), ("t", 0, 1), ("tdg", 0, 1), ("sx", 0, 1),
+    ("rx", 1, 1), ("ry", 1, 1), ("rz", 1, 1), ("p", 1, 1), ("u1", 1, 1),
+    ("u2", 2, 1), ("u3", 3, 1), ("u", 3, 1),
+    ("cx", 0, 2), ("cy", 0, 2), ("cz", 0, 2), ("ch", 0, 2), ("swap", 0, 2),
+    ("crx", 1, 2), ("cry", 1, 2), ("crz", 1, 2), ("cp", 1, 2), ("cu1", 1, 2),
+    ("cu3", 3, 2), ("ccx", 0, 3), ("cswap", 0, 3),
+    ("measure", 0, 1), ("reset", 0, 1), ("barrier", 0, None),
+]
+
+OPCODES: Dict[str, int] = {name: code for code, (name, _, _) in enumerate(GATES)}
+OPCODES["CX"] = OPCODES["cx"]
+OPCODES["U"] = OPCODES["u3"]
+
+MEASURE = OPCODES["measure"]
+RESET = OPCODES["reset"]
+BARRIER = OPCODES["barrier"]
+NON_GATES = frozenset({MEASURE, RESET, BARRIER})
+
+# Comments are stripped first; every remaining token is a string literal,
+# number, identifier, a two-character operator, or a single non-space
+# character (which the parser rejects if it is not valid punctuation)
+_COMMENT = re.compile(r"//[^\n]*")
+_TOKEN = re.compile(
+    r'"[^"]*"'
+    r"|(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?"
+    r"|[A-Za-z_][A-Za-z0-9_]*"
+    r"|->|=="
+    r"|\S"
+)
+
+_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "exp": math.exp, "ln": math.log, "sqrt": math.sqrt,
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split OpenQASM source into tokens in a single regex pass"""
+    return _TOKEN.findall(_COMMENT.sub("", text))
+
+
+class Circuit:
+    """
+    Compact, array-backed circuit IR
+
+    Operation ``i`` has opcode ``opcodes[i]``, qubits
+    ``qubits[qubit_offsets[i]:qubit_offsets[i + 1]]`` and parameters
+    ``params[param_offsets[i]:param_offsets[i + 1]]``. For ``measure`` the
+    single parameter is the classical bit index.
+
+    Example:
+        >>> circuit = parse_circuit(qasm)
+        >>> circuit.num_qubits, len(circuit), circuit.depth()
+        (3, 5, 3)
+        >>> list(circuit.instructions())[0]
+        ('h', (0,), ())
+    """
+
+    __slots__ = (
+        "version", "num_qubits", "num_clbits", "qregs", "cregs",
+        "opcodes", "qubits", "qubit_offsets", "params", "param_offsets",
+    )
+
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.num_qubits = 0
+        self.num_clbits = 0
+        self.qregs: Dict[str, Tuple[int, int]] = {}
+        self.cregs: Dict[str, Tuple[int, int]] = {}
+        self.opcodes = array("B")
+        self.qubits = array("i")
+        self.qubit_offsets = array("i", [0])
+        self.params = array("d")
+        self.param_offsets = array("i", [0])
+
+    def append(self, opcode: int, qubits, params=()) -> None:
+        """Append one operation"""
+        self.opcodes.append(opcode)
+        self.qubits.extend(qubits)
+        self.qubit_offsets.append(len(self.qubits))
+        self.params.extend(params)
+        self.param_offsets.append(len(self.params))
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def instructions(self, include_measure: bool = True) -> Iterator[Tuple[str, Tuple[int, ...], Tuple[float, ...]]]:
+        """Yield ``(name, qubits, params)`` tuples for the simulators"""
+        qo, po = self.qubit_offsets, self.param_offsets
+        qubits, params = self.qubits, self.params
+        for i, code in enumerate(self.opcodes):
+            if code == MEASURE and not include_measure:
+                continue
+            yield (
+                GATES[code][0],
+                tuple(qubits[qo[i]:qo[i + 1]]),
+                tuple(params[po[i]:po[i + 1]])
+            )
+
+    def gate_counts(self) -> Dict[str, int]:
+        """Number of operations per gate name"""
+        tally = [0] * len(GATES)
+        for code in self.opcodes:
+            tally[code] += 1
+        return {GATES[code][0]: n for code, n in enumerate(tally) if n}
+
+    @property
+    def num_gates(self) -> int:
+        """Unitary gate count (excludes measure, reset and barrier)"""
+        return sum(1 for code in self.opcodes if code not in NON_GATES)
+
+    @property
+    def num_two_qubit_gates(self) -> int:
+        qo = self.qubit_offsets
+        return sum(
+            1 for i, code in enumerate(self.opcodes)
+            if code not in NON_GATES and qo[i + 1] - qo[i] >= 2
+        )
+
+    def depth(self) -> int:
+        """Circuit depth counting unitary gates only"""
+        level = [0] * max(self.num_qubits, 1)
+        qo, qubits = self.qubit_offsets, self.qubits
+        for i, code in enumerate(self.opcodes):
+            if code in NON_GATES and code != BARRIER:
+                continue
+            touched = qubits[qo[i]:qo[i + 1]]
+            if not touched:
+                continue
+            top = max(level[q] for q in touched)
+            if code != BARRIER:
+                top += 1
+            for q in touched:
+                level[q] = top
+        return max(level)
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary used by cost estimation and display"""
+        return {
+            "version": self.version,
+            "num_qubits": self.num_qubits,
+            "num_clbits": self.num_clbits,
+            "num_gates": self.num_gates,
+            "num_two_qubit_gates": self.num_two_qubit_gates,
+            "depth": self.depth(),
+            "gate_counts": self.gate_counts(),
+        }
+
+
+class _GateDef:
+    """User-defined ``gate`` body, expanded inline at each call"""
+
+    __slots__ = ("params", "qargs", "body")
+
+    def __init__(self, params: List[str], qargs: List[str], body: list):
+        self.params = params
+        self.qargs = qargs
+        self.body = body  # [(name, [param exprs], [qarg names])]
+
+
+class _Parser:
+    """
+    Recursive-descent parser over the token list
+
+    ``symbols`` binds free identifiers in gate-call expressions (circuit
+    parameters); subclasses may swap ``functions`` and :meth:`emit` to
+    evaluate those expressions over arrays of bindings.
+    """
+
+    functions: Dict[str, Callable[[float], float]] = _FUNCTIONS
+
+    def __init__(self, tokens: List[str], symbols: Optional[Dict[str, Any]] = None):
+        self.tokens = tokens
+        self.pos = 0
+        self.circuit = Circuit()
+        self.gate_defs: Dict[str, _GateDef] = {}
+        self.symbols = symbols if symbols is not None else {}
+
+    # -- token helpers -----------------------------------------------------
+
+    def error(self, message: str) -> ValidationError:
+        near = " ".join(self.tokens[max(0, self.pos - 3):self.pos + 3])
+        return ValidationError(f"Invalid QASM: {message} (near '{near}')")
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def next(self) -> str:
+        if self.pos >= len(self.tokens):
+            raise self.error("unexpected end of input")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expect(self, token: str) -> None:
+        got = self.next()
+        if got != token:
+            self.pos -= 1
+            raise self.error(f"expected '{token}', got '{got}'")
+
+    def identifier(self) -> str:
+        token = self.next()
+        if not (token[0].isalpha() or token[0] == "_"):
+            self.pos -= 1
+            raise self.error(f"expected identifier, got '{token}'")
+        return token
+
+    def integer(self) -> int:
+        token = self.next()
+        if not token.isdigit():
+            self.pos -= 1
+            raise self.error(f"expected integer, got '{token}'")
+        return int(token)
+
+    # -- expressions -------------------------------------------------------
+
+    def expression(self, env: Optional[Dict[str, float]] = None) -> float:
+        value = self.term(env)
+        while self.peek() in ("+", "-"):
+            # No augmented assignment: value may be a caller's bound array
+            if self.next() == "+":
+                value = value + self.term(env)
+            else:
+                value = value - self.term(env)
+        return value
+
+    def term(self, env) -> float:
+        value = self.factor(env)
+        while self.peek() in ("*", "/"):
+            if self.next() == "*":
+                value = value * self.factor(env)
+            else:
+                value = value / self.factor(env)
+        return value
+
+    def factor(self, env) -> float:
+        base = self.unary(env)
+        if self.peek() == "^":
+            self.next()
+            return base ** self.factor(env)
+        return base
+
+    def unary(self, env) -> float:
+        token = self.next()
+        if token == "-":
+            return -self.unary(env)
+        if token == "+":
+            return self.unary(env)
+        if token == "(":
+            value = self.expression(env)
+            self.expect(")")
+            return value
+        if token[0].isdigit() or token[0] == ".":
+            return float(token)
+        if token == "pi":
+            return math.pi
+        if token in self.functions:
+            self.expect("(")
+            value = self.functions[token](self.expression(env))
+            self.expect(")")
+            return value
+        if env is not None and token in env:
+            return env[token]
+        if token in self.symbols:
+            return self.symbols[token]
+        self.pos -= 1
+        raise self.error(f"unexpected '{token}' in expression")
+
+    def raw_expression(self) -> List[str]:
+        """Collect an expression's tokens unevaluated (gate bodies)"""
+        start, depth = self.pos, 0
+        while True:
+            token = self.peek()
+            if token is None:
+                raise self.error("unterminated expression")
+            if depth == 0 and token in (",", ")"):
+                return self.tokens[start:self.pos]
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+            self.pos += 1
+
+    # -- statements --------------------------------------------------------
+
+    def parse(self) -> Circuit:
+        circuit = self.circuit
+        if self.peek() == "OPENQASM":
+            self.next()
+            circuit.version = self.next()
+            self.expect(";")
+        else:
+            raise self.error("missing 'OPENQASM' header")
+
+        while self.pos < len(self.tokens):
+            token = self.next()
+            if token == "include":
+                self.next()
+                self.expect(";")
+            elif token == "qreg" or token == "creg":
+                name = self.identifier()
+                self.expect("[")
+                size = self.integer()
+                self.expect("]")
+                self.expect(";")
+                if token == "qreg":
+                    circuit.qregs[name] = (circuit.num_qubits, size)
+                    circuit.num_qubits += size
+                else:
+                    circuit.cregs[name] = (circuit.num_clbits, size)
+                    circuit.num_clbits += size
+            elif token == "gate":
+                self.gate_definition()
+            elif token == "opaque":
+                while self.next() != ";":
+                    pass
+            elif token == "if":
+                raise self.error("classically controlled operations are not supported")
+            elif token == "measure":
+                self.measure()
+            else:
+                self.pos -= 1
+                if not self.fast_gate_call():
+                    self.gate_call()
+        return circuit
+
+    def fast_gate_call(self) -> bool:
+        """
+        Parse the common ``name[(literals)] reg[i], reg[j];`` form inline
+
+        Returns False without consuming input for anything else (custom
+        gates, expressions, broadcasts, errors), which then takes the
+        general path.
+        """
+        tokens, pos = self.tokens, self.pos
+        opcode = OPCODES.get(tokens[pos])
+        if opcode is None or opcode in NON_GATES or tokens[pos] in self.gate_defs:
+            return False
+        pos += 1
+        params = []
+        try:
+            if tokens[pos] == "(":
+                pos += 1
+                while True:
+                    token = tokens[pos]
+                    sign = 1.0
+                    if token == "-":
+                        sign = -1.0
+                        pos += 1
+                        token = tokens[pos]
+                    if not (token[0].isdigit() or token[0] == "."):
+                        return False
+                    params.append(sign * float(token))
+                    pos += 1
+                    if tokens[pos] == ")":
+                        pos += 1
+                        break
+                    if tokens[pos] != ",":
+                        return False
+                    pos += 1
+            qregs = self.circuit.qregs
+            qubits = []
+            while True:
+                register = qregs.get(tokens[pos])
+                if register is None or tokens[pos + 1] != "[" or tokens[pos + 3] != "]":
+                    return False
+                index = tokens[pos + 2]
+                if not index.isdigit() or int(index) >= register[1]:
+                    return False
+                qubits.append(register[0] + int(index))
+                pos += 4
+                if tokens[pos] == ";":
+                    break
+                if tokens[pos] != ",":
+                    return False
+                pos += 1
+        except IndexError:
+            return False
+
+        _, n_params, n_qubits = GATES[opcode]
+        if len(params) != n_params or len(qubits) != n_qubits or len(set(qubits)) != n_qubits:
+            return False
+        self.circuit.append(opcode, qubits, params)
+        self.pos = pos + 1
+        return True
+
+    def operand(self, registers: Dict[str, Tuple[int, int]]) -> List[int]:
+        name = self.identifier()
+        if name not in registers:
+            self.pos -= 1
+            raise self.error(f"unknown register '{name}'")
+        offset, size = registers[name]
+        if self.peek() == "[":
+            self.next()
+            index = self.integer()
+            self.expect("]")
+            if index >= size:
+                raise self.error(f"index {index} out of range for '{name}[{size}]'")
+            return [offset + index]
+        return list(range(offset, offset + size))
+
+    def measure(self) -> None:
+        qubits = self.operand(self.circuit.qregs)
+        self.expect("->")
+        clbits = self.operand(self.circuit.cregs)
+        self.expect(";")
+        if len(qubits) != len(clbits):
+            raise self.error("measure operands have different sizes")
+        for q, c in zip(qubits, clbits):
+            self.circuit.append(MEASURE, (q,), (c,))
+
+    def gate_call(self) -> None:
+        name = self.identifier()
+        params: List[float] = []
+        if self.peek() == "(":
+            self.next()
+            if self.peek() != ")":
+                params.append(self.expression())
+                while self.peek() == ",":
+                    self.next()
+                    params.append(self.expression())
+            self.expect(")")
+
+        operands = [self.operand(self.circuit.qregs)]
+        while self.peek() == ",":
+            self.next()
+            operands.append(self.operand(self.circuit.qregs))
+        self.expect(";")
+
+        # Register broadcast: "h q;" or "cx a, b;" over equal-size registers
+        width = max(len(op) for op in operands)
+        if any(len(op) not in (1, width) for op in operands):
+            raise self.error(f"mismatched register sizes in '{name}'")
+        if name == "barrier":
+            self.circuit.append(BARRIER, [q for op in operands for q in op])
+            return
+        for i in range(width):
+            qubits = [op[i] if len(op) > 1 else op[0] for op in operands]
+            self.apply(name, params, qubits)
+
+    def apply(self, name: str, params: List[float], qubits: List[int]) -> None:
+        if len(set(qubits)) != len(qubits):
+            raise self.error(f"repeated qubit in '{name}'")
+
+        definition = self.gate_defs.get(name)
+        if definition is not None:
+            if len(params) != len(definition.params) or len(qubits) != len(definition.qargs):
+                raise self.error(f"wrong number of arguments for gate '{name}'")
+            env = dict(zip(definition.params, params))
+            bound = dict(zip(definition.qargs, qubits))
+            for sub_name, exprs, qargs in definition.body:
+                sub_params = [type(self)(expr).expression_only(env) for expr in exprs]
+                self.apply(sub_name, sub_params, [bound[q] for q in qargs])
+            return
+
+        opcode = OPCODES.get(name)
+        if opcode is None:
+            raise self.error(f"unknown gate '{name}'")
+        _, n_params, n_qubits = GATES[opcode]
+        if len(params) != n_params:
+            raise self.error(f"gate '{name}' takes {n_params} parameter(s), got {len(params)}")
+        if n_qubits is not None and len(qubits) != n_qubits:
+            raise self.error(f"gate '{name}' acts on {n_qubits} qubit(s), got {len(qubits)}")
+        self.emit(opcode, qubits, params)
+
+    def emit(self, opcode: int, qubits: List[int], params: List[float]) -> None:
+        self.circuit.append(opcode, qubits, params)
+
+    def expression_only(self, env: Dict[str, float]) -> float:
+        value = self.expression(env)
+        if self.pos != len(self.tokens):
+            raise self.error("trailing tokens in expression")
+        return value
+
+    def gate_definition(self) -> None:
+        name = self.identifier()
+        formal: List[str] = []
+        if self.peek() == "(":
+            self.next()
+            while self.peek() != ")":
+                formal.append(self.identifier())
+                if self.peek() == ",":
+                    self.next()
+            self.expect(")")
+        qargs = [self.identifier()]
+        while self.peek() == ",":
+            self.next()
+            qargs.append(self.identifier())
+        self.expect("{")
+
+        body = []
+        while self.peek() != "}":
+            sub_name = self.identifier()
+            exprs: List[List[str]] = []
+            if self.peek() == "(":
+                self.next()
+                while self.peek() != ")":
+                    exprs.append(self.raw_expression())
+                    if self.peek() == ",":
+                        self.next()
+                self.expect(")")
+            args = [self.identifier()]
+            while self.peek() == ",":
+                self.next()
+                args.append(self.identifier())
+            self.expect(";")
+            unknown = [a for a in args if a not in qargs]
+            if unknown:
+                raise self.error(f"unknown qubit argument '{unknown[0]}' in gate '{name}'")
+            if sub_name != "barrier":
+                body.append((sub_name, exprs, args))
+        self.expect("}")
+        self.gate_defs[name] = _GateDef(formal, qargs, body)
+
+
+@lru_cache(maxsize=128)
+def parse_circuit(qasm: str) -> Circuit:
+    """
+    Parse OpenQASM 2 source into a :class:`Circuit`
+
+    Results are memoised on the source text, so the validator, the local
+    simulator and ``operations.custom`` share one parse per circuit. Treat
+    the returned IR as read-only.
+
+    Raises:
+        ValidationError: If the program is malformed
+    """
+    if not isinstance(qasm, str):
+        raise ValidationError("QASM source must be a string")
+    return _Parser(tokenize(qasm)).parse()
+
+
+@lru_cache(maxsize=1024)
+def validate_qasm(qasm: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate OpenQASM 2 source
+
+    Returns:
+        ``(True, None)`` if valid, else ``(False, error message)``
+    """
+    try:
+        parse_circuit(qasm)
+    except ValidationError as e:
+        return False, str(e)
+    return True, None
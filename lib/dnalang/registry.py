@@ -0,0 +1,177 @@
+"""DNALang Circuit Registry"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+from .exceptions import ValidationError
+from .qasm import Circuit, parse_circuit
+
+
+def circuit_hash(qasm: str) -> str:
+    """
+    Content address of a QASM program
+
+    Returns:
+        Hex SHA-256 of the UTF-8 source text (byte-for-byte, so the server
+        computes the same digest)
+    """
+    if not isinstance(qasm, str):
+        raise ValidationError("QASM source must be a string")
+    return hashlib.sha256(qasm.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class RegisteredCircuit:
+    """A hashed QASM program with its parsed IR and validation result"""
+
+    hash: str
+    qasm: str
+    circuit: Optional[Circuit]
+    error: Optional[str] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+class CircuitRegistry:
+    """
+    Thread-safe, bounded LRU of circuits keyed by content hash
+
+    Registering a program hashes and parses it once; registering the same
+    string again is a dict lookup (Python caches ``str`` hashes, so the
+    SHA-256 is not recomputed). The registry also remembers which hashes
+    the server has already stored, so later executions can send the hash
+    instead of the program text.
+
+    Example:
+        >>> registry = CircuitRegistry(maxsize=256)
+        >>> entry = registry.register(qasm)
+        >>> registry.get(entry.hash).circuit.num_gates
+        42
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Args:
+            maxsize: Maximum number of circuits before LRU eviction
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, RegisteredCircuit]" = OrderedDict()
+        self._by_text: Dict[str, str] = {}
+        self._remote: set = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def register(self, qasm: str) -> RegisteredCircuit:
+        """
+        Hash, parse and validate ``qasm`` (once per distinct program)
+
+        Invalid programs are registered too, with ``error`` set, so repeated
+        submissions of a bad circuit fail fast without re-parsing.
+        """
+        with self._lock:
+            key = self._by_text.get(qasm) if isinstance(qasm, str) else None
+            if key is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        key = circuit_hash(qasm)
+        try:
+            entry = RegisteredCircuit(key, qasm, parse_circuit.__wrapped__(qasm))
+        except ValidationError as e:
+            entry = RegisteredCircuit(key, qasm, None, str(e))
+
+        with self._lock:
+            self.misses += 1
+            if self.maxsize <= 0:
+                return entry
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Registered concurrently by another thread
+                entry = existing
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._by_text[qasm] = key
+            while len(self._entries) > self.maxsize:
+                old_key, old = self._entries.popitem(last=False)
+                self._by_text.pop(old.qasm, None)
+                self._remote.discard(old_key)
+                self.evictions += 1
+        return entry
+
+    def get(self, circuit_hash: str) -> Optional[RegisteredCircuit]:
+        """Return the registered circuit, or None if unknown or evicted"""
+        with self._lock:
+            entry = self._entries.get(circuit_hash)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(circuit_hash)
+            self.hits += 1
+            return entry
+
+    def resolve(self, circuit_hash: str) -> RegisteredCircuit:
+        """
+        Look up a valid circuit by hash
+
+        Raises:
+            ValidationError: If the hash is unknown or the circuit is invalid
+        """
+        entry = self.get(circuit_hash)
+        if entry is None:
+            raise ValidationError(f"Unknown circuit {circuit_hash}; register the QASM first")
+        if not entry.valid:
+            raise ValidationError(entry.error)
+        return entry
+
+    def is_remote(self, circuit_hash: str) -> bool:
+        """Whether the server is known to hold this circuit"""
+        with self._lock:
+            return circuit_hash in self._remote
+
+    def mark_remote(self, circuit_hash: str, stored: bool = True) -> None:
+        """Record that the server has (or, with ``stored=False``, has lost) a circuit"""
+        with self._lock:
+            if not stored:
+                self._remote.discard(circuit_hash)
+            elif circuit_hash in self._entries:
+                self._remote.add(circuit_hash)
+
+    def clear(self) -> None:
+        """Drop all circuits (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._by_text.clear()
+            self._remote.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Registry counters
+
+        Returns:
+            Dict with size, remote, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "remote": len(self._remote),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def __contains__(self, circuit_hash: str) -> bool:
+        return circuit_hash in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
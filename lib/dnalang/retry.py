@@ -0,0 +1,195 @@
+"""DNALang Retry Engine"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Methods that can be replayed without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses where the server refused the request before doing any work;
+# safe to replay for every method
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Transient gateway failures; only replayed for idempotent methods
+TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+
+# Statuses a GET may be replayed on
+RETRYABLE_STATUSES = THROTTLE_STATUSES | TRANSIENT_STATUSES
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter
+
+    One bucket can be shared by several clients (and their sub-clients) so
+    they draw from a single request budget. Acquisition reserves a token
+    and returns how long the caller must wait for it, so waiters are served
+    in arrival order and never spin.
+
+    Example:
+        >>> bucket = TokenBucket(rate=10, capacity=20)
+        >>> a = QuantumClient(api_key="qos_...", rate_limiter=bucket)
+        >>> b = QuantumClient(api_key="qos_...", rate_limiter=bucket)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to ``rate``)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve one token and return the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Withhold tokens for ``seconds``
+
+        Called when the server answers with Retry-After so every client
+        sharing the bucket backs off together instead of stampeding.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter
+
+    Delays are drawn uniformly from ``[0, min(max_delay, base_delay * 2**attempt)]``
+    unless the server supplied ``Retry-After``, which always wins.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config) -> "RetryPolicy":
+        """Build a policy from DNALangConfig"""
+        return cls(
+            max_retries=config.max_retries,
+            base_delay=config.retry_delay,
+            max_delay=config.max_retry_delay
+        )
+
+    def should_retry(
+        self,
+        attempt: int,
+        method: str,
+        status: Optional[int] = None,
+        connect_error: bool = False
+    ) -> bool:
+        """
+        Decide whether a failed attempt may be replayed
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            method: HTTP method
+            status: Response status (None for transport errors)
+            connect_error: True if the request never reached the server
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status is None:
+            return connect_error or method.upper() in IDEMPOTENT_METHODS
+        if status in THROTTLE_STATUSES:
+            return True
+        return status in TRANSIENT_STATUSES and method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to sleep before attempt ``attempt + 1``"""
+        if retry_after is not None:
+            # Small jitter keeps clients that got the same header from
+            # re-arriving in lockstep
+            return retry_after + random.uniform(0, self.base_delay * 0.1)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        attempt: int,
+        method: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        connect_error: bool = False,
+        limiter: Optional[TokenBucket] = None
+    ) -> Optional[float]:
+        """
+        Seconds to sleep before replaying a failed attempt
+
+        When a shared ``limiter`` is given and the server sent Retry-After,
+        the pause is applied to the bucket instead, so every client drawing
+        from it backs off and the caller's next ``acquire`` does the waiting.
+
+        Returns:
+            Delay in seconds, or None if the attempt must not be retried
+        """
+        if not self.should_retry(attempt, method, status, connect_error):
+            return None
+        delay = self.backoff(attempt, retry_after)
+        if limiter is not None and retry_after is not None:
+            limiter.pause(delay)
+            return 0.0
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
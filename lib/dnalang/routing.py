@@ -0,0 +1,598 @@
+"""DNALang Route Optimisation"""
+
+import math
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Distance matrices above this size are written to a memory-mapped
+# temporary file instead of RAM (float32: 10k stops take ~400 MB)
+DENSE_MATRIX_BYTES = 512 * 1024 ** 2
+
+# Haversine pairs evaluated per vectorized chunk (~64 MB of float64 temporaries)
+_CHUNK = 1 << 23
+
+# Nearest stops kept per stop; local search only tries moves between neighbours
+NEIGHBOURS = 10
+
+# Or-opt relocates segments of up to this many consecutive stops
+MAX_SEGMENT = 3
+
+# time_to_target is the first time the cost was within this share of the final cost
+TARGET_GAP = 0.01
+
+DEFAULT_SPEED_KMH = 50.0
+
+_EPS = 1e-9
+
+
+def haversine(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in km between points given in degrees (broadcasts)"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    h = (
+        np.sin((lat2 - lat1) * 0.5) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) * 0.5) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+def distance_matrix(
+    lat: np.ndarray,
+    lon: np.ndarray,
+    neighbours: int = NEIGHBOURS,
+    max_bytes: int = DENSE_MATRIX_BYTES,
+    workers: int = 1,
+    directory: Optional[str] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise haversine distances and nearest-neighbour lists
+
+    Rows are filled in chunks of roughly ``_CHUNK`` pairs, on ``workers``
+    threads (NumPy releases the GIL inside the trigonometry). Matrices
+    larger than ``max_bytes`` live in a memory-mapped temporary file that
+    is removed when the array is released.
+
+    Args:
+        lat: Latitudes in degrees; index 0 is the depot
+        lon: Longitudes in degrees
+        neighbours: Nearest non-depot points to list per point
+        max_bytes: Largest matrix kept in memory
+        workers: Threads filling row chunks
+        directory: Where to place the memory-mapped file
+
+    Returns:
+        (float32 matrix, int neighbour array of shape (points, k))
+    """
+    n = lat.size
+    size = n * n * np.dtype(np.float32).itemsize
+    if size > max_bytes:
+        with tempfile.TemporaryFile(dir=directory) as backing:
+            matrix = np.memmap(backing, dtype=np.float32, mode="w+", shape=(n, n))
+    else:
+        matrix = np.empty((n, n), dtype=np.float32)
+    k = max(0, min(neighbours, n - 2))
+    nearest = np.zeros((n, k), dtype=np.int64)
+
+    rad_lat, rad_lon = np.radians(lat), np.radians(lon)
+    cos_lat = np.cos(rad_lat)
+    rows = max(1, _CHUNK // n)
+
+    def fill(start: int) -> None:
+        stop = min(n, start + rows)
+        h = (
+            np.sin((rad_lat[None, :] - rad_lat[start:stop, None]) * 0.5) ** 2
+            + cos_lat[start:stop, None] * cos_lat[None, :]
+            * np.sin((rad_lon[None, :] - rad_lon[start:stop, None]) * 0.5) ** 2
+        )
+        block = (2.0 * EARTH_RADIUS_KM) * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+        matrix[start:stop] = block
+        if k:
+            block[:, 0] = np.inf  # never list the depot
+            block[np.arange(stop - start), np.arange(start, stop)] = np.inf
+            nearest[start:stop] = np.argpartition(block, k - 1, axis=1)[:, :k]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        list(pool.map(fill, range(0, n, rows)))
+    return matrix, nearest
+
+
+class GridIndex:
+    """
+    Uniform grid over an equirectangular projection for nearest-point queries
+
+    Points are bucketed into cells holding about ``per_cell`` points each;
+    a query scans rings of cells outward from the query cell and stops as
+    soon as no unscanned cell can hold a closer point. Removed points are
+    skipped and dropped from their cell lazily.
+
+    Example:
+        >>> index = GridIndex(lat, lon)
+        >>> i = index.nearest(lat[0], lon[0])
+        >>> index.remove(i)
+    """
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray, per_cell: int = 2):
+        self.scale = math.cos(math.radians(float(np.mean(lat)))) if lat.size else 1.0
+        self.x = np.radians(lon) * self.scale * EARTH_RADIUS_KM
+        self.y = np.radians(lat) * EARTH_RADIUS_KM
+        self.active = np.ones(lat.size, dtype=bool)
+
+        self.x0, self.y0 = float(self.x.min()), float(self.y.min())
+        span = max(float(self.x.max()) - self.x0, float(self.y.max()) - self.y0, 1e-9)
+        side = max(1, int(math.sqrt(lat.size / per_cell)))
+        self.cell = span / side
+        self.width = side
+        cx, cy = self._cell_of(self.x, self.y)
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for i, key in enumerate(zip(cx.tolist(), cy.tolist())):
+            self.cells.setdefault(key, []).append(i)
+
+    def _cell_of(self, x, y):
+        cx = np.clip(((x - self.x0) / self.cell).astype(np.int64), 0, self.width - 1)
+        cy = np.clip(((y - self.y0) / self.cell).astype(np.int64), 0, self.width - 1)
+        return cx, cy
+
+    def remove(self, i: int) -> None:
+        self.active[i] = False
+
+    def nearest(self, lat: float, lon: float, limit: Optional[float] = None, weight: Optional[np.ndarray] = None) -> int:
+        """
+        Closest active point, or -1 if there is none
+
+        Args:
+            lat: Query latitude in degrees
+            lon: Query longitude in degrees
+            limit: Only consider points with ``weight <= limit``
+            weight: Per-point weights compared against ``limit``
+        """
+        px = math.radians(lon) * self.scale * EARTH_RADIUS_KM
+        py = math.radians(lat) * EARTH_RADIUS_KM
+        qx, qy = (int(v[0]) for v in self._cell_of(np.array([px]), np.array([py])))
+        best, best_d2 = -1, math.inf
+        for ring in range(self.width + 1):
+            if best >= 0 and (ring - 1) * self.cell > 0 and ((ring - 1) * self.cell) ** 2 >= best_d2:
+                break
+            for key in self._ring(qx, qy, ring):
+                members = self.cells.get(key)
+                if not members:
+                    continue
+                live = [i for i in members if self.active[i]]
+                if len(live) != len(members):
+                    self.cells[key] = members = live
+                if limit is not None:
+                    live = [i for i in live if weight[i] <= limit]
+                if not live:
+                    continue
+                idx = np.array(live)
+                d2 = (self.x[idx] - px) ** 2 + (self.y[idx] - py) ** 2
+                j = int(d2.argmin())
+                if d2[j] < best_d2:
+                    best, best_d2 = int(idx[j]), float(d2[j])
+        return best
+
+    def _ring(self, qx: int, qy: int, ring: int):
+        if ring == 0:
+            yield (qx, qy)
+            return
+        lo_x, hi_x, lo_y, hi_y = qx - ring, qx + ring, qy - ring, qy + ring
+        for x in range(max(lo_x, 0), min(hi_x, self.width - 1) + 1):
+            if lo_y >= 0:
+                yield (x, lo_y)
+            if hi_y < self.width:
+                yield (x, hi_y)
+        for y in range(max(lo_y + 1, 0), min(hi_y - 1, self.width - 1) + 1):
+            if lo_x >= 0:
+                yield (lo_x, y)
+            if hi_x < self.width:
+                yield (hi_x, y)
+
+
+class RoutePlan:
+    """
+    Capacitated routes over a distance matrix (point 0 is the depot)
+
+    Each route is one vehicle trip from and back to the depot; a vehicle
+    makes several trips when the fleet cannot carry all demand at once.
+    Local search cycles through three vectorized move types, each
+    evaluating every candidate move between a stop and its nearest
+    neighbours at once and applying all non-conflicting improving moves
+    per round:
+
+    * 2-opt reverses the route segment between two neighbours in the
+      same route.
+    * 2-opt* swaps the tails of two routes after a pair of neighbours,
+      if both new loads fit.
+    * Or-opt relocates a segment of 1-3 stops next to a neighbour, in the
+      same or another route, if that route's capacity allows.
+    """
+
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        nearest: np.ndarray,
+        demand: np.ndarray,
+        routes: List[np.ndarray],
+        capacity: np.ndarray
+    ):
+        self.matrix = matrix
+        self.nearest = nearest
+        self.demand = demand
+        self.routes = routes
+        self.capacity = capacity
+        self.num_points = matrix.shape[0]
+
+    def route_cost(self, route: np.ndarray) -> float:
+        if route.size == 0:
+            return 0.0
+        path = np.concatenate(([0], route, [0]))
+        return float(self.matrix[path[:-1], path[1:]].astype(np.float64).sum())
+
+    def cost(self) -> float:
+        return sum(self.route_cost(route) for route in self.routes)
+
+    def loads(self) -> np.ndarray:
+        return np.array([float(self.demand[route].sum()) for route in self.routes])
+
+    def _positions(self):
+        route_of = np.full(self.num_points, -1, dtype=np.int64)
+        pos = np.zeros(self.num_points, dtype=np.int64)
+        succ = np.zeros(self.num_points, dtype=np.int64)
+        for r, route in enumerate(self.routes):
+            if route.size:
+                route_of[route] = r
+                pos[route] = np.arange(route.size)
+                succ[route[:-1]] = route[1:]
+                succ[route[-1]] = 0
+        return route_of, pos, succ
+
+    def two_opt_round(self) -> float:
+        """Apply non-overlapping improving 2-opt moves; return the total gain"""
+        if self.nearest.shape[1] == 0:
+            return 0.0
+        route_of, pos, succ = self._positions()
+        d = self.matrix
+        a = np.repeat(np.arange(1, self.num_points), self.nearest.shape[1])
+        b = self.nearest[1:].ravel()
+        same = (route_of[a] == route_of[b]) & (pos[b] > pos[a])
+        a, b = a[same], b[same]
+        na, nb = succ[a], succ[b]
+        gain = (
+            d[a, na].astype(np.float64) + d[b, nb] - d[a, b] - d[na, nb]
+        )
+        order = np.flatnonzero(gain > _EPS)
+        if order.size == 0:
+            return 0.0
+        order = order[np.argsort(-gain[order], kind="stable")]
+
+        taken: Dict[int, List[Tuple[int, int]]] = {}
+        total = 0.0
+        for m in order.tolist():
+            r = int(route_of[a[m]])
+            lo, hi = int(pos[a[m]]), int(pos[b[m]]) + 1
+            spans = taken.setdefault(r, [])
+            if any(lo <= s_hi and s_lo <= hi for s_lo, s_hi in spans):
+                continue
+            spans.append((lo, hi))
+            route = self.routes[r]
+            route[lo + 1:hi] = route[lo + 1:hi][::-1].copy()
+            total += float(gain[m])
+        return total
+
+    def cross_round(self) -> float:
+        """Apply improving 2-opt* tail exchanges, at most one per route; return the total gain"""
+        if self.nearest.shape[1] == 0 or len(self.routes) < 2:
+            return 0.0
+        route_of, _, succ = self._positions()
+        cumulative = np.zeros(self.num_points)
+        loads = np.zeros(len(self.routes))
+        for r, route in enumerate(self.routes):
+            if route.size:
+                cumulative[route] = np.cumsum(self.demand[route])
+                loads[r] = cumulative[route[-1]]
+        d = self.matrix
+        a = np.repeat(np.arange(1, self.num_points), self.nearest.shape[1])
+        b = self.nearest[1:].ravel()
+        ra, rb = route_of[a], route_of[b]
+        keep = (
+            (ra != rb)
+            & (cumulative[a] + loads[rb] - cumulative[b] <= self.capacity[ra] + _EPS)
+            & (cumulative[b] + loads[ra] - cumulative[a] <= self.capacity[rb] + _EPS)
+        )
+        a, b, ra, rb = a[keep], b[keep], ra[keep], rb[keep]
+        na, nb = succ[a], succ[b]
+        gain = d[a, na].astype(np.float64) + d[b, nb] - d[a, nb] - d[b, na]
+        order = np.flatnonzero(gain > _EPS)
+        order = order[np.argsort(-gain[order], kind="stable")]
+
+        used = np.zeros(len(self.routes), dtype=bool)
+        total = 0.0
+        for m in order.tolist():
+            r1, r2 = int(ra[m]), int(rb[m])
+            if used[r1] or used[r2]:
+                continue
+            used[r1] = used[r2] = True
+            route1, route2 = self.routes[r1], self.routes[r2]
+            i = int(np.flatnonzero(route1 == a[m])[0]) + 1
+            j = int(np.flatnonzero(route2 == b[m])[0]) + 1
+            self.routes[r1] = np.concatenate([route1[:i], route2[j:]])
+            self.routes[r2] = np.concatenate([route2[:j], route1[i:]])
+            total += float(gain[m])
+        return total
+
+    def or_opt_round(self, loads: np.ndarray) -> float:
+        """Apply non-conflicting improving segment relocations; return the total gain"""
+        k = self.nearest.shape[1]
+        if k == 0:
+            return 0.0
+        n, num_routes = self.num_points, len(self.routes)
+        # Linked list over stops plus a start and end sentinel per route
+        start_of = n + 2 * np.arange(num_routes)
+        end_of = start_of + 1
+        size = n + 2 * num_routes
+        loc = np.concatenate([np.arange(n), np.zeros(2 * num_routes, dtype=np.int64)])
+        succ = np.zeros(size, dtype=np.int64)
+        pred = np.zeros(size, dtype=np.int64)
+        route_of = np.full(size, -1, dtype=np.int64)
+        for r, route in enumerate(self.routes):
+            chain = np.concatenate(([start_of[r]], route, [end_of[r]]))
+            succ[chain[:-1]] = chain[1:]
+            pred[chain[1:]] = chain[:-1]
+            route_of[chain] = r
+
+        d = self.matrix
+        stops = np.arange(1, n)
+        moves = []
+        for length in range(1, MAX_SEGMENT + 1):
+            segment = [stops]
+            for _ in range(length - 1):
+                segment.append(succ[segment[-1]])
+            segment = np.stack(segment, axis=1)
+            # Drop segments running past the end of their route
+            segment = segment[(segment[:, 1:] < n).all(axis=1)]
+            s, e = segment[:, 0], segment[:, -1]
+            p, nx = pred[s], succ[e]
+            seg_load = self.demand[segment].sum(axis=1)
+            removal = d[loc[p], s].astype(np.float64) + d[e, loc[nx]] - d[loc[p], loc[nx]]
+
+            b = self.nearest[s]  # (stops, k)
+            inside = (b[:, :, None] == segment[:, None, :]).any(axis=2)
+            r_seg, r_b = route_of[s][:, None], route_of[b]
+            fits = (r_b == r_seg) | (loads[r_b] + seg_load[:, None] <= self.capacity[r_b] + _EPS)
+            valid = ~inside & fits
+
+            sb, pb = succ[b], pred[b]
+            after = removal[:, None] - (d[b, s[:, None]] + d[e[:, None], loc[sb]] - d[b, loc[sb]])
+            before = removal[:, None] - (d[loc[pb], e[:, None]] + d[s[:, None], b] - d[loc[pb], b])
+            after[~valid | (b == p[:, None])] = -np.inf
+            before[~valid | (b == nx[:, None])] = -np.inf
+            padded = np.pad(segment, ((0, 0), (0, MAX_SEGMENT - length)), constant_values=-1)
+            for forward, gain in ((True, after), (False, before)):
+                i, j = np.nonzero(gain > _EPS)
+                moves.append((gain[i, j], np.full(i.size, forward), padded[i], b[i, j]))
+
+        gains = np.concatenate([m[0] for m in moves])
+        if gains.size == 0:
+            return 0.0
+        forwards = np.concatenate([m[1] for m in moves])
+        segments = np.concatenate([m[2] for m in moves])
+        targets = np.concatenate([m[3] for m in moves])
+
+        touched = np.zeros(size, dtype=bool)
+        total = 0.0
+        for m in np.argsort(-gains, kind="stable").tolist():
+            seg = segments[m][segments[m] >= 0]
+            b, forward = int(targets[m]), bool(forwards[m])
+            s, e = int(seg[0]), int(seg[-1])
+            p, nx = int(pred[s]), int(succ[e])
+            other = int(succ[b]) if forward else int(pred[b])
+            # Links only change around touched nodes, so an untouched move's
+            # gain is still exact
+            nodes = [p, nx, b, other, *seg.tolist()]
+            if touched[nodes].any():
+                continue
+            r_from, r_to = int(route_of[s]), int(route_of[b])
+            load = float(self.demand[seg].sum())
+            if r_from != r_to and loads[r_to] + load > self.capacity[r_to] + _EPS:
+                continue
+            touched[nodes] = True
+
+            succ[p], pred[nx] = nx, p
+            if forward:
+                succ[b], pred[s] = s, b
+                succ[e], pred[other] = other, e
+            else:
+                for x, y in zip(seg[:-1].tolist(), seg[1:].tolist()):
+                    succ[y], pred[x] = x, y
+                succ[other], pred[e] = e, other
+                succ[s], pred[b] = b, s
+            route_of[seg] = r_to
+            loads[r_from] -= load
+            loads[r_to] += load
+            total += float(gains[m])
+
+        for r in range(num_routes):
+            route, node = [], int(succ[start_of[r]])
+            while node != end_of[r]:
+                route.append(node)
+                node = int(succ[node])
+            self.routes[r] = np.array(route, dtype=np.int64)
+        return total
+
+
+def nearest_neighbour_routes(
+    index: GridIndex,
+    lat: np.ndarray,
+    lon: np.ndarray,
+    demand: np.ndarray,
+    capacities: Sequence[float]
+) -> Tuple[List[np.ndarray], List[int]]:
+    """
+    Greedy construction: each trip repeatedly visits the nearest unserved
+    stop that still fits, then returns to the depot
+
+    Trips cycle through the vehicles. ``index`` covers the stops only
+    (stop ``i`` is matrix point ``i + 1``); ``lat``/``lon`` include the
+    depot at 0.
+
+    Returns:
+        (routes as arrays of matrix points, vehicle index per route)
+    """
+    remaining = int(index.active.sum())
+    routes, owners = [], []
+    trip = 0
+    while remaining:
+        vehicle = trip % len(capacities)
+        trip += 1
+        room = float(capacities[vehicle])
+        here_lat, here_lon = float(lat[0]), float(lon[0])
+        route = []
+        while True:
+            i = index.nearest(here_lat, here_lon, room, demand[1:])
+            if i < 0:
+                break
+            index.remove(i)
+            route.append(i + 1)
+            room -= float(demand[i + 1])
+            here_lat, here_lon = float(lat[i + 1]), float(lon[i + 1])
+        if route:
+            routes.append(np.array(route, dtype=np.int64))
+            owners.append(vehicle)
+            remaining -= len(route)
+    return routes, owners
+
+
+def optimize_routes(
+    depot: Dict[str, Any],
+    delivery_locations: List[Dict[str, Any]],
+    vehicles: List[Dict[str, Any]],
+    shots: int = 8192,
+    time_limit: float = 60.0,
+    workers: int = 4,
+    target_gap: float = TARGET_GAP,
+    max_matrix_bytes: int = DENSE_MATRIX_BYTES
+) -> Dict[str, Any]:
+    """
+    Solve a capacitated vehicle-routing problem in-process
+
+    Builds the haversine distance matrix, constructs routes greedily with
+    a grid spatial index, then improves them with 2-opt, 2-opt* and
+    Or-opt rounds until no move improves or ``time_limit`` runs out.
+
+    Args:
+        depot: ``{"id", "lat", "lon"}``
+        delivery_locations: Stops with ``id``, ``lat``, ``lon`` and an
+            optional ``demand`` (default 1)
+        vehicles: Vehicles with ``id``, ``capacity`` (default unlimited)
+            and ``speed`` in km/h
+        shots: Echoed for parity with the server (unused locally)
+        time_limit: Seconds of local search after construction
+        workers: Threads filling the distance matrix
+        target_gap: ``time_to_target`` measures the time to get within
+            this share of the final cost
+        max_matrix_bytes: Larger distance matrices are memory-mapped
+
+    Returns:
+        Result dict: routes per vehicle trip (stop ids, load, distance,
+        duration), total distance, and a ``search`` report with time to
+        first feasible solution, time to target quality and a cost trace
+
+    Raises:
+        ValidationError: For missing coordinates, no vehicles or stops, or
+            a stop whose demand exceeds every vehicle's capacity
+    """
+    start = time.perf_counter()
+    if not vehicles or not delivery_locations:
+        raise ValidationError("At least one vehicle and one delivery location are required")
+    points = [depot, *delivery_locations]
+    try:
+        lat = np.array([float(p["lat"]) for p in points])
+        lon = np.array([float(p["lon"]) for p in points])
+    except (KeyError, TypeError, ValueError):
+        raise ValidationError("Depot and every delivery location need numeric lat and lon")
+    demand = np.array([0.0] + [float(p.get("demand", 1)) for p in delivery_locations])
+    capacities = [float(v.get("capacity", math.inf)) for v in vehicles]
+    if demand.max() > max(capacities):
+        raise ValidationError("A delivery's demand exceeds every vehicle's capacity")
+
+    matrix, nearest = distance_matrix(lat, lon, max_bytes=max_matrix_bytes, workers=workers)
+    matrix_time = time.perf_counter() - start
+
+    routes, owners = nearest_neighbour_routes(GridIndex(lat[1:], lon[1:]), lat, lon, demand, capacities)
+    plan = RoutePlan(matrix, nearest, demand, routes, np.array([capacities[o] for o in owners]))
+    cost = constructed = plan.cost()
+    first_feasible = time.perf_counter() - start
+    trace = [(first_feasible, cost)]
+
+    rounds = 0
+    deadline = time.perf_counter() + time_limit
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for move in (plan.two_opt_round, plan.cross_round, lambda: plan.or_opt_round(plan.loads())):
+            while time.perf_counter() < deadline:
+                gain = move()
+                if gain <= _EPS:
+                    break
+                rounds += 1
+                improved = True
+                cost -= gain
+                trace.append((time.perf_counter() - start, cost))
+    cost = plan.cost()
+
+    target = cost * (1.0 + target_gap)
+    time_to_target = next((t for t, c in trace if c <= target + _EPS), trace[-1][0])
+
+    ids = [p.get("id", i) for i, p in enumerate(points)]
+    result_routes = []
+    trips: Dict[int, int] = {}
+    for route, owner in zip(plan.routes, owners):
+        if route.size == 0:
+            continue
+        vehicle = vehicles[owner]
+        distance = plan.route_cost(route)
+        trips[owner] = trips.get(owner, 0) + 1
+        result_routes.append({
+            "vehicle": vehicle.get("id", owner),
+            "trip": trips[owner],
+            "stops": [ids[i] for i in route.tolist()],
+            "load": float(demand[route].sum()),
+            "capacity": capacities[owner] if math.isfinite(capacities[owner]) else None,
+            "distance_km": distance,
+            "duration_h": distance / float(vehicle.get("speed", DEFAULT_SPEED_KMH))
+        })
+
+    storage = "memmap" if isinstance(matrix, np.memmap) else "memory"
+    del plan, matrix
+    return {
+        "operation": "logistics_route_optimization",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "backend": "simulator",
+        "local": True,
+        "shots": shots,
+        "execution_time": time.perf_counter() - start,
+        "parameters": {"time_limit": time_limit, "target_gap": target_gap},
+        "result": {
+            "routes": result_routes,
+            "total_distance_km": cost,
+            "num_routes": len(result_routes),
+            "stops_served": int(sum(len(r["stops"]) for r in result_routes)),
+            "search": {
+                "construction_distance_km": constructed,
+                "improvement": (constructed - cost) / constructed if constructed else 0.0,
+                "rounds": rounds,
+                "time_to_first_feasible": first_feasible,
+                "time_to_target": time_to_target,
+                "target_gap": target_gap,
+                "matrix": {"storage": storage, "build_time": matrix_time},
+                "trace": [[t, c] for t, c in trace]
+            }
+        }
+    }
@@ -0,0 +1,266 @@
+"""DNALang Shot Sampling"""
+
+from collections import Counter
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .exceptions import ValidationError
+
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+# Shots drawn per vectorized call when materialising individual outcomes;
+# bounds peak memory at ~32 MB of int64 indices regardless of ``shots``
+_CHUNK = 1 << 22
+
+MAX_SHOTS = 10 ** 7
+
+
+def make_rng(seed: SeedLike = None) -> np.random.Generator:
+    """Return a PCG64 generator for ``seed`` (Generators pass through)"""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+def spawn_streams(seed: Optional[int], n: int) -> List[np.random.Generator]:
+    """
+    Independent, reproducible child streams
+
+    The same ``(seed, n)`` always yields the same streams, so parallel
+    regression runs stay bit-for-bit repeatable.
+    """
+    return [make_rng(child) for child in np.random.SeedSequence(seed).spawn(n)]
+
+
+def _normalise(probabilities: np.ndarray) -> np.ndarray:
+    probs = np.asarray(probabilities, dtype=np.float64).ravel()
+    if probs.size == 0:
+        raise ValidationError("Empty probability vector")
+    probs = np.clip(probs, 0.0, None)
+    total = probs.sum()
+    if not total > 0:
+        raise ValidationError("Probability vector has no mass")
+    return probs / total
+
+
+def _check_shots(shots: int) -> int:
+    shots = int(shots)
+    if shots < 0 or shots > MAX_SHOTS:
+        raise ValidationError(f"shots must be between 0 and {MAX_SHOTS}")
+    return shots
+
+
+class Counts:
+    """
+    Measurement counts stored as a dense array indexed by basis state
+
+    Dict conversion happens only on demand via :meth:`to_dict`.
+
+    Example:
+        >>> counts = sample_counts(sim.probabilities(), shots=10**6, seed=42)
+        >>> counts.array[0b11]
+        500112
+        >>> counts.to_dict()["11"]
+        500112
+    """
+
+    def __init__(self, array: np.ndarray, num_qubits: Optional[int] = None):
+        self.array = np.asarray(array, dtype=np.int64)
+        self.num_qubits = num_qubits if num_qubits is not None else max(1, (self.array.size - 1).bit_length())
+
+    @property
+    def shots(self) -> int:
+        return int(self.array.sum())
+
+    def probabilities(self) -> np.ndarray:
+        """Empirical outcome frequencies"""
+        shots = self.shots
+        return self.array / shots if shots else self.array.astype(np.float64)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Non-zero counts keyed by bitstring (qubit 0 rightmost)"""
+        nonzero = np.flatnonzero(self.array)
+        width = self.num_qubits
+        return {format(int(i), f"0{width}b"): int(self.array[i]) for i in nonzero}
+
+    def most_common(self, k: int = 10) -> List[tuple]:
+        """The ``k`` most frequent outcomes as ``(bitstring, count)`` pairs"""
+        k = min(k, self.array.size)
+        top = np.argpartition(self.array, -k)[-k:]
+        top = top[np.argsort(self.array[top])[::-1]]
+        return [(format(int(i), f"0{self.num_qubits}b"), int(self.array[i])) for i in top if self.array[i]]
+
+    def __getitem__(self, bitstring: str) -> int:
+        return int(self.array[int(bitstring, 2)])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.array))
+
+    def __repr__(self) -> str:
+        return f"<Counts(shots={self.shots}, outcomes={len(self)})>"
+
+
+def build_alias_table(probabilities: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Build a Walker/Vose alias table in vectorized rounds
+
+    Each round pairs every under-full cell with a donor by a prefix-sum
+    search over donor excess, so even highly skewed distributions (a GHZ
+    state puts all mass on two of 2**n outcomes) finish in a few rounds
+    rather than one Python iteration per outcome.
+
+    Returns:
+        Dict with ``prob`` (float64) and ``alias`` (int64) arrays
+    """
+    probs = _normalise(probabilities)
+    size = probs.size
+    scaled = probs * size
+    prob = np.ones(size, dtype=np.float64)
+    alias = np.arange(size, dtype=np.int64)
+
+    small = np.flatnonzero(scaled < 1.0)
+    large = np.flatnonzero(scaled >= 1.0)
+
+    while small.size and large.size:
+        deficit = 1.0 - scaled[small]
+        excess = scaled[large] - 1.0
+        donor = np.searchsorted(np.cumsum(excess), np.cumsum(deficit), side="left")
+        np.minimum(donor, large.size - 1, out=donor)
+
+        prob[small] = scaled[small]
+        alias[small] = large[donor]
+        scaled[large] -= np.bincount(donor, weights=deficit, minlength=large.size)
+
+        still_large = scaled[large] >= 1.0
+        small = large[~still_large]
+        large = large[still_large]
+
+    # Leftovers are full cells up to rounding error
+    prob[small] = 1.0
+    return {"prob": prob, "alias": alias}
+
+
+class ShotSampler:
+    """
+    Reusable sampler for one final probability vector
+
+    Args:
+        probabilities: Outcome probabilities (normalised internally)
+        seed: Seed, SeedSequence or Generator for a reproducible stream
+        method: ``"alias"`` (O(1) per shot after O(K) setup),
+            ``"cdf"`` (binary search on the cumulative sum) or
+            ``"multinomial"`` (draws counts directly, no per-shot outcomes)
+
+    Example:
+        >>> sampler = ShotSampler(sim.probabilities(), seed=1234)
+        >>> counts = sampler.counts(10**7)
+        >>> memory = sampler.sample(1000)  # individual shot outcomes
+    """
+
+    def __init__(
+        self,
+        probabilities: np.ndarray,
+        seed: SeedLike = None,
+        method: str = "alias"
+    ):
+        if method not in ("alias", "cdf", "multinomial"):
+            raise ValidationError(f"Unknown sampling method: {method}")
+        self.probs = _normalise(probabilities)
+        self.num_qubits = max(1, (self.probs.size - 1).bit_length())
+        self.method = method
+        self.rng = make_rng(seed)
+        self._table: Optional[Dict[str, np.ndarray]] = None
+        self._cdf: Optional[np.ndarray] = None
+
+    def _draw(self, shots: int) -> np.ndarray:
+        if self.method == "alias":
+            if self._table is None:
+                self._table = build_alias_table(self.probs)
+            cells = self.rng.integers(0, self.probs.size, size=shots)
+            keep = self.rng.random(shots) < self._table["prob"][cells]
+            return np.where(keep, cells, self._table["alias"][cells])
+        if self._cdf is None:
+            self._cdf = np.cumsum(self.probs)
+        draws = self.rng.random(shots) * self._cdf[-1]
+        return np.minimum(np.searchsorted(self._cdf, draws, side="right"), self.probs.size - 1)
+
+    def sample(self, shots: int) -> np.ndarray:
+        """Individual shot outcomes as basis-state indices"""
+        shots = _check_shots(shots)
+        if self.method == "multinomial":
+            counts = self.rng.multinomial(shots, self.probs)
+            return self.rng.permutation(np.repeat(np.arange(self.probs.size), counts))
+        return self._draw(shots)
+
+    def counts(self, shots: int) -> Counts:
+        """Counts for ``shots`` shots as a dense :class:`Counts` array"""
+        shots = _check_shots(shots)
+        if self.method == "multinomial":
+            return Counts(self.rng.multinomial(shots, self.probs), self.num_qubits)
+        total = np.zeros(self.probs.size, dtype=np.int64)
+        for chunk in self.chunks(shots):
+            total += chunk
+        return Counts(total, self.num_qubits)
+
+    def chunks(self, shots: int, chunk_size: int = _CHUNK) -> Iterator[np.ndarray]:
+        """Yield partial count arrays of at most ``chunk_size`` shots each"""
+        shots = _check_shots(shots)
+        remaining = shots
+        while remaining > 0:
+            n = min(chunk_size, remaining)
+            yield np.bincount(self._draw(n), minlength=self.probs.size)
+            remaining -= n
+
+
+def sample_counts(
+    probabilities: np.ndarray,
+    shots: int,
+    seed: SeedLike = None,
+    method: str = "multinomial"
+) -> Counts:
+    """
+    Sample ``shots`` measurement outcomes in one vectorized call
+
+    Args:
+        probabilities: Final outcome probabilities
+        shots: Number of shots (up to 10**7)
+        seed: Seed, SeedSequence or Generator
+        method: See :class:`ShotSampler`
+
+    Returns:
+        :class:`Counts`
+    """
+    return ShotSampler(probabilities, seed=seed, method=method).counts(shots)
+
+
+def count_packed(samples: np.ndarray, num_qubits: int) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    Count bit-packed shot outcomes from engines without a dense distribution
+
+    Args:
+        samples: (shots, ceil(num_qubits / 8)) uint8 rows, bit ``q``
+            (little-endian bit order) holding qubit ``q``
+        num_qubits: Qubits per outcome
+
+    Returns:
+        ``(counts by bitstring with qubit 0 rightmost, (m, num_qubits)
+        bool array of the distinct outcomes in the same order)``
+    """
+    # Hashing rows as bytes is far cheaper than np.unique's row sort
+    tally = Counter(map(bytes, np.ascontiguousarray(samples, dtype=np.uint8)))
+    width = (num_qubits + 7) // 8
+    unique = np.frombuffer(b"".join(tally), dtype=np.uint8).reshape(len(tally), width)
+    bits = np.unpackbits(unique, axis=1, count=num_qubits, bitorder="little").astype(np.bool_)
+    chars = np.where(bits[:, ::-1], "1", "0")
+    return {"".join(row): count for row, count in zip(chars, tally.values())}, bits
+
+
+def counts_to_array(counts: Dict[str, Any], num_qubits: Optional[int] = None) -> np.ndarray:
+    """Convert a ``{"bitstring": count}`` dict to a dense count array"""
+    if num_qubits is None:
+        num_qubits = max((len(k) for k in counts), default=1)
+    array = np.zeros(1 << num_qubits, dtype=np.int64)
+    for bitstring, value in counts.items():
+        array[int(bitstring, 2)] += int(value)
+    return array
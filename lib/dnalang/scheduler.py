@@ -0,0 +1,147 @@
+"""DNALang Shot Scheduling"""
+
+import math
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple
+
+from .exceptions import ValidationError
+
+# Never evaluate a candidate on fewer shots than this, however early the rung
+MIN_RUNG_SHOTS = 64
+
+
+def rung_shots(full_shots: int, fraction: float, min_shots: int = MIN_RUNG_SHOTS) -> int:
+    """Shots for one evaluation at ``fraction`` of a candidate's full budget"""
+    return min(full_shots, max(min_shots, int(round(full_shots * fraction))))
+
+
+class SuccessiveHalving:
+    """
+    Successive-halving shot allocation over a fixed candidate set
+
+    Rung ``k`` evaluates the surviving candidates at ``eta ** (k - K)`` of
+    their full shot budget and keeps the best ``1/eta`` of them, so the
+    final rung evaluates a single candidate at full budget. Wide searches
+    spend roughly ``log_eta(n)`` full evaluations' worth of shots instead
+    of ``n``.
+
+    Drive it with :meth:`run`, or step it manually with :attr:`active`,
+    :attr:`fraction` and :meth:`report` (e.g. from async code).
+
+    Example:
+        >>> halving = SuccessiveHalving(len(specs), eta=2)
+        >>> def evaluate(index, fraction):
+        ...     shots = rung_shots(2048, fraction)
+        ...     return score(specs[index], shots), shots
+        >>> best = specs[halving.run(evaluate)]
+        >>> halving.summary(full_allocation=2048 * len(specs))["savings"]
+        5.3
+    """
+
+    def __init__(self, num_candidates: int, eta: int = 2, higher: bool = True):
+        """
+        Args:
+            num_candidates: Number of candidates to choose between
+            eta: Keep ``1/eta`` of the candidates per rung (>= 2)
+            higher: Whether higher scores are better
+        """
+        if num_candidates < 1:
+            raise ValidationError("successive halving needs at least one candidate")
+        if eta < 2:
+            raise ValidationError("eta must be at least 2")
+        self.eta = eta
+        self.higher = higher
+        self.active: List[int] = list(range(num_candidates))
+        self.scores: Dict[int, float] = {}
+        self.rungs: List[Dict[str, Any]] = []
+        self.shots_spent = 0
+
+        self.num_rungs = 1
+        remaining = num_candidates
+        while remaining > 1:
+            remaining = math.ceil(remaining / eta)
+            self.num_rungs += 1
+
+    @property
+    def done(self) -> bool:
+        return len(self.rungs) >= self.num_rungs
+
+    @property
+    def fraction(self) -> float:
+        """Share of the full shot budget for the current rung"""
+        return float(self.eta) ** (len(self.rungs) - self.num_rungs + 1)
+
+    @property
+    def best(self) -> int:
+        """Index of the best candidate so far (the survivor once done)"""
+        return self.active[0]
+
+    def report(self, scores: Sequence[float], shots: Optional[Sequence[int]] = None) -> None:
+        """
+        Record scores for :attr:`active` (in order) and advance one rung
+
+        Args:
+            scores: One score per active candidate
+            shots: Shots each evaluation cost, for the spend report
+        """
+        if self.done:
+            raise ValidationError("successive halving already finished")
+        if len(scores) != len(self.active):
+            raise ValidationError(f"expected {len(self.active)} scores, got {len(scores)}")
+
+        spent = int(sum(shots)) if shots is not None else 0
+        self.shots_spent += spent
+        self.rungs.append({
+            "fraction": self.fraction,
+            "candidates": len(self.active),
+            "shots": spent
+        })
+        for index, value in zip(self.active, scores):
+            self.scores[index] = float(value)
+
+        ranked = sorted(
+            zip(self.active, scores),
+            key=lambda pair: pair[1],
+            reverse=self.higher
+        )
+        keep = 1 if self.done else math.ceil(len(ranked) / self.eta)
+        self.active = [index for index, _ in ranked[:keep]]
+
+    def run(
+        self,
+        evaluate: Callable[[int, float], Tuple[float, int]],
+        map_fn: Callable = map
+    ) -> int:
+        """
+        Run every remaining rung
+
+        Args:
+            evaluate: ``evaluate(index, fraction) -> (score, shots_used)``
+            map_fn: ``map``-compatible callable, e.g. ``executor.map`` to
+                evaluate a rung concurrently
+
+        Returns:
+            Index of the surviving candidate
+        """
+        while not self.done:
+            fraction = self.fraction
+            outcomes = list(map_fn(lambda index: evaluate(index, fraction), self.active))
+            self.report([score for score, _ in outcomes], [shots for _, shots in outcomes])
+        return self.best
+
+    def summary(self, full_allocation: int) -> Dict[str, Any]:
+        """
+        Spend report
+
+        Args:
+            full_allocation: Shots a full-budget evaluation of every candidate would cost
+
+        Returns:
+            Dict with total shots, the full-allocation baseline, the saving
+            factor and per-rung detail
+        """
+        return {
+            "total": self.shots_spent,
+            "full_allocation": full_allocation,
+            "savings": full_allocation / self.shots_spent if self.shots_spent else None,
+            "rungs": list(self.rungs)
+        }
@@ -0,0 +1,293 @@
+"""DNALang Candidate Screening"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .exceptions import DNALangException, OperationError, ValidationError
+
+CHECKPOINT_VERSION = 1
+
+# Shards kept in flight per worker, so slow shards do not starve the pool
+# while the library itself is never materialised
+_PREFETCH = 2
+
+
+def fingerprint(data: Any) -> str:
+    """Stable hash of a JSON-serialisable value (dict key order ignored)"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class TopK:
+    """
+    Running top-K of scored items on a bounded min-heap
+
+    Holds at most ``k`` entries however many are pushed; ties keep the
+    item seen first (lower library index).
+
+    Example:
+        >>> top = TopK(3)
+        >>> for i, score in enumerate([0.2, 0.9, 0.5, 0.7]):
+        ...     top.push(score, i, {"name": f"m{i}"})
+        >>> [entry["index"] for entry in top.ranked()]
+        [1, 3, 2]
+    """
+
+    def __init__(self, k: int):
+        if k < 1:
+            raise ValidationError("top_k must be at least 1")
+        self.k = k
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, score: float, index: int, candidate: Dict[str, Any], **extra) -> bool:
+        """Offer an item; return whether it entered the top-K"""
+        key = (float(score), -index)
+        if len(self._heap) >= self.k and key <= self._heap[0][:2]:
+            return False
+        entry = {"index": index, "score": float(score), "candidate": candidate, **extra}
+        item = (key[0], key[1], entry)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        else:
+            heapq.heapreplace(self._heap, item)
+        return True
+
+    def ranked(self) -> List[Dict[str, Any]]:
+        """Entries best first, each with its 1-based ``rank``"""
+        ordered = sorted(self._heap, key=lambda item: item[:2], reverse=True)
+        return [{"rank": rank, **entry} for rank, (_, _, entry) in enumerate(ordered, 1)]
+
+    def entries(self) -> List[Dict[str, Any]]:
+        return [entry for _, _, entry in self._heap]
+
+
+class ScreeningPipeline:
+    """
+    Sharded, concurrent, resumable screening of a candidate library
+
+    The library is consumed lazily in shards of ``batch_size``; shard
+    ``i`` always holds candidates ``[i * batch_size, (i + 1) * batch_size)``,
+    so a checkpoint only needs the finished shard numbers, the counters
+    and the current top-K. The checkpoint is rewritten atomically after
+    every shard. A failed shard is reported and left unfinished, so
+    resuming retries it.
+
+    ``score_batch(candidates)`` returns one score per candidate (higher is
+    better) plus optional per-candidate detail dicts; it may be a
+    coroutine function when driven with :meth:`run_async`.
+
+    Args:
+        score_batch: Scores one shard
+        top_k: Ranked entries kept
+        batch_size: Candidates per shard
+        checkpoint: JSON file to resume from and save progress to
+        identity: Anything identifying the screen (e.g. the target); a
+            checkpoint written for a different identity is rejected
+    """
+
+    def __init__(
+        self,
+        score_batch: Callable,
+        top_k: int = 100,
+        batch_size: int = 256,
+        checkpoint: Optional[str] = None,
+        identity: Any = None
+    ):
+        if batch_size < 1:
+            raise ValidationError("batch_size must be at least 1")
+        self.score_batch = score_batch
+        self.batch_size = batch_size
+        self.checkpoint = checkpoint
+        self.identity = fingerprint(identity)
+        self.top = TopK(top_k)
+        self.done: set = set()
+        self.scored = 0
+        self.failed: Dict[int, str] = {}
+        self.resumed = 0
+        if checkpoint and os.path.exists(checkpoint):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.checkpoint, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValidationError(f"Unsupported checkpoint version in {self.checkpoint}")
+        if state.get("identity") != self.identity or state.get("batch_size") != self.batch_size:
+            raise ValidationError(
+                f"Checkpoint {self.checkpoint} was written for a different screen or batch size"
+            )
+        if state.get("top_k") != self.top.k:
+            raise ValidationError(f"Checkpoint {self.checkpoint} kept top_k={state.get('top_k')}")
+        self.done = set(state["done"])
+        self.scored = state["scored"]
+        # Failed shards are not in ``done``, so they are retried and
+        # cleared from here if they succeed this time
+        self.failed = {int(k): v for k, v in state.get("failed", {}).items()}
+        self.resumed = len(self.done)
+        for entry in state["top"]:
+            extra = {k: v for k, v in entry.items() if k not in ("index", "score", "candidate")}
+            self.top.push(entry["score"], entry["index"], entry["candidate"], **extra)
+
+    def save(self) -> None:
+        """Write the checkpoint atomically"""
+        if not self.checkpoint:
+            return
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "identity": self.identity,
+            "batch_size": self.batch_size,
+            "top_k": self.top.k,
+            "done": sorted(self.done),
+            "scored": self.scored,
+            "failed": {str(k): v for k, v in sorted(self.failed.items())},
+            "top": self.top.entries()
+        }
+        temporary = f"{self.checkpoint}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"), default=str)
+        os.replace(temporary, self.checkpoint)
+
+    def _shards(self, candidates: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        iterator = iter(candidates)
+        for batch in itertools.count():
+            shard = list(itertools.islice(iterator, self.batch_size))
+            if not shard:
+                return
+            if batch not in self.done:
+                yield batch, shard
+
+    def _complete(self, batch: int, shard: List[Dict[str, Any]], outcome: Any, error: Optional[Exception]) -> Dict[str, Any]:
+        """Fold one shard's outcome into the ranking and checkpoint; return the stream event"""
+        entered = 0
+        if error is None:
+            try:
+                scores, details = _parse_scores(outcome, len(shard))
+            except DNALangException as e:
+                error = e
+        if error is not None:
+            self.failed[batch] = str(error)
+        else:
+            base = batch * self.batch_size
+            for offset, (candidate, score, detail) in enumerate(zip(shard, scores, details)):
+                entered += self.top.push(score, base + offset, candidate, **detail)
+            self.scored += len(shard)
+            self.done.add(batch)
+            self.failed.pop(batch, None)
+        self.save()
+        return {
+            "batch": batch,
+            "candidates": len(shard),
+            "status": "ok" if error is None else "error",
+            "error": None if error is None else str(error),
+            "entered": entered,
+            "scored": self.scored,
+            "failed": len(self.failed),
+            "ranked": self.top.ranked()
+        }
+
+    def run(self, candidates: Iterable[Dict[str, Any]], concurrency: int = 4) -> Iterator[Dict[str, Any]]:
+        """
+        Screen on a thread pool, yielding one event per finished shard
+
+        Each event carries the shard's status, how many of its candidates
+        entered the top-K, running counters and the current ranking.
+        """
+        concurrency = max(1, concurrency)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = {}
+
+        def drain():
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch, shard = pending.pop(future)
+                try:
+                    outcome, error = future.result(), None
+                except DNALangException as e:
+                    outcome, error = None, e
+                yield self._complete(batch, shard, outcome, error)
+
+        try:
+            for batch, shard in self._shards(candidates):
+                pending[executor.submit(self.score_batch, shard)] = (batch, shard)
+                if len(pending) >= concurrency * _PREFETCH:
+                    yield from drain()
+            while pending:
+                yield from drain()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run_async(self, candidates: Iterable[Dict[str, Any]], concurrency: int = 4):
+        """Async-iterate shard events (see :meth:`run`); ``score_batch`` may be async"""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        pending = {}
+
+        async def score(shard):
+            async with semaphore:
+                outcome = self.score_batch(shard)
+                if asyncio.iscoroutine(outcome):
+                    outcome = await outcome
+                return outcome
+
+        async def drain():
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            events = []
+            for task in done:
+                batch, shard = pending.pop(task)
+                try:
+                    outcome, error = task.result(), None
+                except DNALangException as e:
+                    outcome, error = None, e
+                events.append(self._complete(batch, shard, outcome, error))
+            return events
+
+        try:
+            for batch, shard in self._shards(candidates):
+                pending[asyncio.ensure_future(score(shard))] = (batch, shard)
+                if len(pending) >= max(1, concurrency) * _PREFETCH:
+                    for event in await drain():
+                        yield event
+            while pending:
+                for event in await drain():
+                    yield event
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _parse_scores(response: Any, expected: int) -> Tuple[List[float], List[Dict[str, Any]]]:
+    """
+    Per-candidate scores from a docking response
+
+    Accepts a plain list of scores, or a server result whose
+    ``result.ranked_candidates`` entries carry the candidate's ``index``
+    within the shard and its ``score`` (other fields are kept as detail).
+    """
+    if isinstance(response, dict):
+        ranked = (response.get("result") or {}).get("ranked_candidates")
+        if ranked is None:
+            raise OperationError("Docking response has no ranked_candidates")
+        scores: List[Optional[float]] = [None] * expected
+        details: List[Dict[str, Any]] = [{} for _ in range(expected)]
+        for entry in ranked:
+            index = entry.get("index")
+            if isinstance(index, int) and 0 <= index < expected and entry.get("score") is not None:
+                scores[index] = float(entry["score"])
+                details[index] = {
+                    k: v for k, v in entry.items() if k not in ("index", "score", "name", "candidate")
+                }
+        if any(score is None for score in scores):
+            raise OperationError("Docking response did not score every candidate")
+        return scores, details
+    scores = [float(score) for score in response]
+    if len(scores) != expected:
+        raise OperationError(f"Expected {expected} scores, got {len(scores)}")
+    return scores, [{} for _ in scores]
@@ -0,0 +1,363 @@
+"""DNALang Sharded Statevector Simulator"""
+
+import bisect
+import multiprocessing
+import os
+import queue
+from multiprocessing import shared_memory
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .compiler import instruction_matrix
+from .exceptions import OperationError, ValidationError
+from .statevector import CONTROLLED_GATES, NON_UNITARY, Instruction, StatevectorSimulator, gate_matrix
+
+# Widest gate the engine takes; every shard keeps at least this many qubits
+_MAX_GATE_QUBITS = 3
+
+# Seconds between worker liveness checks while waiting for shards
+_POLL_INTERVAL = 0.5
+
+# Plan steps, executed by every shard in order:
+#   ("apply", name, qubits, params)  gate on shard-local qubits
+#   ("block", matrix, slots)         gate touching shard-index qubits only
+#                                    diagonally; slots are (is_global, index)
+#   ("exchange", bit, qubit)         swap shard-index bit ``bit`` with local
+#                                    ``qubit``; the only cross-shard traffic
+Step = Tuple[Any, ...]
+
+
+def gate_unitary(name: str, qubits: Sequence[int], params: Sequence[Any]) -> np.ndarray:
+    """
+    Dense unitary of an instruction on up to three qubits
+
+    ``qubits[0]`` is the most significant bit of the returned matrix.
+    """
+    if len(qubits) <= 2:
+        return np.asarray(instruction_matrix(name, qubits, params), dtype=np.complex128)
+    if name == "unitary":
+        return params[0]
+    full = np.eye(1 << len(qubits), dtype=np.complex128)
+    if name in CONTROLLED_GATES:
+        full[-2:, -2:] = gate_matrix(CONTROLLED_GATES[name][1], params)
+    elif name == "cswap":
+        full[[5, 6], :] = full[[6, 5], :]
+    else:
+        raise ValidationError(f"Unsupported gate: {name}")
+    return full
+
+
+def _diagonal_in(matrix: np.ndarray, position: int, k: int) -> bool:
+    """Whether ``matrix`` never flips the qubit at ``position`` (MSB first)"""
+    index = np.arange(1 << k)
+    mask = 1 << (k - 1 - position)
+    flips = ((index[:, None] ^ index[None, :]) & mask) != 0
+    return not np.any(matrix[flips])
+
+
+def plan_circuit(
+    instructions: Iterable[Instruction],
+    num_qubits: int,
+    shard_bits: int
+) -> Tuple[List[Step], int]:
+    """
+    Schedule a circuit over ``2**shard_bits`` shards
+
+    The top ``shard_bits`` physical qubits select the shard, the rest
+    index amplitudes inside it. Gates on local qubits, and gates that only
+    condition on or phase shard-index qubits (controls, Z/S/T/RZ/CZ/CP),
+    run inside each shard. A gate that flips a shard-index qubit first
+    exchanges that qubit with a local one, picking the local qubit whose
+    next use is furthest away, and the logical-to-physical layout is
+    updated instead of being swapped back. The plan ends by restoring the
+    identity layout.
+
+    Returns:
+        ``(steps, exchanges)``
+    """
+    instructions = [inst for inst in instructions if inst[0] not in NON_UNITARY]
+    local_qubits = num_qubits - shard_bits
+    physical = list(range(num_qubits))  # logical -> physical
+    logical = list(range(num_qubits))   # physical -> logical
+    uses: Dict[int, List[int]] = {q: [] for q in range(num_qubits)}
+    for i, (_, qubits, _) in enumerate(instructions):
+        for q in qubits:
+            uses[q].append(i)
+
+    def next_use(q: int, after: int) -> int:
+        i = bisect.bisect_right(uses[q], after)
+        return uses[q][i] if i < len(uses[q]) else len(instructions)
+
+    steps: List[Step] = []
+    exchanges = 0
+
+    def exchange(position: int, target: int) -> None:
+        nonlocal exchanges
+        steps.append(("exchange", position - local_qubits, target))
+        a, b = logical[position], logical[target]
+        logical[position], logical[target] = b, a
+        physical[a], physical[b] = target, position
+        exchanges += 1
+
+    for i, (name, qubits, params) in enumerate(instructions):
+        if len(qubits) > _MAX_GATE_QUBITS:
+            raise ValidationError(f"The sharded engine takes gates on up to {_MAX_GATE_QUBITS} qubits")
+        name = name.lower()
+        positions = [physical[q] for q in qubits]
+        if all(p < local_qubits for p in positions):
+            steps.append(("apply", name, tuple(positions), params))
+            continue
+        matrix = gate_unitary(name, qubits, params)
+        for slot, q in enumerate(qubits):
+            if physical[q] >= local_qubits and not _diagonal_in(matrix, slot, len(qubits)):
+                busy = {physical[other] for other in qubits}
+                free = [p for p in range(local_qubits) if p not in busy]
+                target = max(free, key=lambda p: next_use(logical[p], i))
+                exchange(physical[q], target)
+        positions = [physical[q] for q in qubits]
+        if all(p < local_qubits for p in positions):
+            steps.append(("apply", name, tuple(positions), params))
+        else:
+            slots = tuple(
+                (True, p - local_qubits) if p >= local_qubits else (False, p) for p in positions
+            )
+            steps.append(("block", matrix, slots))
+
+    # Bring every logical qubit home: shard-index positions first (through
+    # local qubit 0 when the qubit sits at another of them), then local swaps
+    for position in range(local_qubits, num_qubits):
+        source = physical[position]
+        if source == position:
+            continue
+        if source >= local_qubits:
+            exchange(source, 0)
+            source = 0
+        exchange(position, source)
+    for position in range(local_qubits):
+        source = physical[position]
+        if source != position:
+            steps.append(("apply", "swap", (position, source), ()))
+            a, b = logical[position], logical[source]
+            logical[position], logical[source] = b, a
+            physical[a], physical[b] = source, position
+    return steps, exchanges
+
+
+def _shard_block(matrix: np.ndarray, slots: Sequence[Tuple[bool, int]], shard: int) -> Tuple[np.ndarray, List[int]]:
+    """The part of ``matrix`` acting inside ``shard``, and its local qubits"""
+    k = len(slots)
+    index = np.arange(1 << k)
+    keep = np.ones(1 << k, dtype=np.bool_)
+    for slot, (is_global, q) in enumerate(slots):
+        if is_global:
+            keep &= ((index >> (k - 1 - slot)) & 1) == ((shard >> q) & 1)
+    return matrix[np.ix_(keep, keep)], [q for is_global, q in slots if not is_global]
+
+
+def _exchange(state: np.ndarray, shard: int, local_qubits: int, bit: int, qubit: int) -> None:
+    """This shard's half of swapping shard-index ``bit`` with local ``qubit``"""
+    size = 1 << local_qubits
+    low, high = sorted((shard, shard ^ (1 << bit)))
+    # Amplitudes with (bit, qubit) = (0, 1) trade places with (1, 0)
+    a = state[low * size:(low + 1) * size].reshape(-1, 2, 1 << qubit)[:, 1, :]
+    b = state[high * size:(high + 1) * size].reshape(-1, 2, 1 << qubit)[:, 0, :]
+    if a.shape[0] > 1:
+        middle = a.shape[0] // 2
+        part = (slice(0, middle),) if shard == low else (slice(middle, None),)
+    else:
+        middle = a.shape[1] // 2
+        part = (slice(None), slice(0, middle)) if shard == low else (slice(None), slice(middle, None))
+    tmp = a[part].copy()
+    a[part] = b[part]
+    b[part] = tmp
+
+
+def run_plan(sim: StatevectorSimulator, state: np.ndarray, shard: int, steps: Sequence[Step], barrier) -> None:
+    """Execute a plan on one shard (``sim`` wraps the shard's slice of ``state``)"""
+    for step in steps:
+        kind = step[0]
+        if kind == "apply":
+            sim.apply(*step[1:])
+        elif kind == "block":
+            sub, local = _shard_block(step[1], step[2], shard)
+            if not local:
+                if sub[0, 0] != 1:
+                    sim.state *= sub[0, 0]
+            elif not np.array_equal(sub, np.eye(sub.shape[0])):
+                sim.apply_unitary(sub, local)
+        else:
+            barrier.wait()
+            _exchange(state, shard, sim.num_qubits, step[1], step[2])
+            barrier.wait()
+
+
+def _shard_worker(name: str, num_qubits: int, shard: int, local_qubits: int, tasks, done, barrier) -> None:
+    # Children share the parent's resource tracker, which unlinks the
+    # block once, when the parent does
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        state = np.ndarray((1 << num_qubits,), dtype=np.complex128, buffer=shm.buf)
+        size = 1 << local_qubits
+        sim = StatevectorSimulator(local_qubits, state=state[shard * size:(shard + 1) * size])
+        # First touch from the owning process, in parallel across shards
+        sim.state[:] = 0
+        if shard == 0:
+            sim.state[0] = 1.0
+        done.put((shard, None))
+        while True:
+            steps = tasks.get()
+            if steps is None:
+                break
+            try:
+                run_plan(sim, state, shard, steps, barrier)
+                done.put((shard, None))
+            except Exception as e:
+                barrier.abort()
+                done.put((shard, f"{type(e).__name__}: {e}"))
+    finally:
+        sim = state = None
+        shm.close()
+
+
+class ShardedStatevectorSimulator(StatevectorSimulator):
+    """
+    Statevector split across worker processes in shared memory
+
+    The ``2**n`` amplitudes live in one ``multiprocessing.shared_memory``
+    block cut into ``2**s`` contiguous shards, one per worker process
+    (``s = floor(log2(workers))``): the top ``s`` qubits select the
+    shard. Each worker wraps its slice in a
+    :class:`~dnalang.statevector.StatevectorSimulator` and applies gates
+    on local qubits to it in place, with no copies and no communication.
+    Gates that merely control on or phase shard-index qubits also stay
+    local; only a gate that flips a shard-index qubit triggers an
+    exchange, in which pairs of workers swap a quarter of their shards
+    directly in shared memory (see :func:`plan_circuit`). A whole circuit
+    is sent to the workers as one plan, synchronised only at exchanges.
+
+    The parent's :attr:`state` is a view of the shared block, so the
+    inherited probability, sampling and Schmidt methods work unchanged.
+    Call :meth:`close` (or use it as a context manager) to stop the
+    workers and free the block.
+
+    Args:
+        num_qubits: Number of qubits
+        workers: Worker processes (default ``os.cpu_count()``; rounded
+            down to a power of two)
+
+    Example:
+        >>> with ShardedStatevectorSimulator(28, workers=16) as sim:
+        ...     sim.run(circuit.instructions())
+        ...     counts = sim.sample(4096, seed=1)
+    """
+
+    def __init__(self, num_qubits: int, workers: Optional[int] = None):
+        if num_qubits < 1:
+            raise ValidationError("num_qubits must be positive")
+        workers = workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValidationError("workers must be at least 1")
+        self.shard_bits = max(0, min(workers.bit_length() - 1, num_qubits - _MAX_GATE_QUBITS))
+        self.num_shards = 1 << self.shard_bits
+        self.exchanges = 0
+        self._shm = shared_memory.SharedMemory(create=True, size=16 << num_qubits)
+        self._processes: List[multiprocessing.Process] = []
+        state = np.ndarray((1 << num_qubits,), dtype=np.complex128, buffer=self._shm.buf)
+        if self.num_shards == 1:
+            state[:] = 0
+            state[0] = 1.0
+        super().__init__(num_qubits, state=state)
+        if self.num_shards > 1:
+            try:
+                self._start()
+            except BaseException:
+                self.close()
+                raise
+
+    def _start(self) -> None:
+        local_qubits = self.num_qubits - self.shard_bits
+        self._barrier = multiprocessing.Barrier(self.num_shards)
+        self._done = multiprocessing.Queue()
+        self._tasks = [multiprocessing.SimpleQueue() for _ in range(self.num_shards)]
+        for shard in range(self.num_shards):
+            process = multiprocessing.Process(
+                target=_shard_worker,
+                args=(self._shm.name, self.num_qubits, shard, local_qubits,
+                      self._tasks[shard], self._done, self._barrier),
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        self._wait()
+
+    def _wait(self) -> None:
+        errors = []
+        for _ in range(self.num_shards):
+            while True:
+                try:
+                    _, error = self._done.get(timeout=_POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    self._check_workers()
+            if error:
+                errors.append(error)
+        if errors:
+            self._barrier.reset()
+            raise OperationError(f"Sharded simulation failed: {errors[0]}")
+
+    def _check_workers(self) -> None:
+        """Raise if a worker has died (OOM kill, signal, crash on start-up)"""
+        for shard, process in enumerate(self._processes):
+            if not process.is_alive():
+                # Release survivors blocked at an exchange; the state is
+                # lost, so stop them rather than leave them on the queues
+                self._barrier.abort()
+                for other in self._processes:
+                    if other.is_alive():
+                        other.terminate()
+                raise OperationError(
+                    f"Sharded simulation failed: worker for shard {shard} exited with code {process.exitcode}"
+                )
+
+    def run(self, instructions: Iterable[Instruction]) -> "ShardedStatevectorSimulator":
+        """Plan and apply a circuit across all shards"""
+        instructions = list(instructions)
+        for _, qubits, _ in instructions:
+            self._check(tuple(qubits))
+        if self.num_shards == 1:
+            return super().run(instructions)
+        steps, exchanges = plan_circuit(instructions, self.num_qubits, self.shard_bits)
+        self._check_workers()
+        for tasks in self._tasks:
+            tasks.put(steps)
+        self._wait()
+        self.exchanges += exchanges
+        return self
+
+    def apply(self, name: str, qubits: Sequence[int], params: Sequence[float] = ()) -> None:
+        if self.num_shards == 1:
+            super().apply(name, qubits, params)
+        else:
+            self.run([(name, tuple(qubits), tuple(params))])
+
+    def close(self) -> None:
+        """Stop the workers and release the shared block"""
+        for tasks in getattr(self, "_tasks", ()):
+            tasks.put(None)
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        self._tasks = []
+        if self._shm is not None:
+            self.state = None
+            self._scratch = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "ShardedStatevectorSimulator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
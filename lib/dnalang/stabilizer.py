@@ -0,0 +1,330 @@
+"""DNALang Stabilizer Simulator"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+from .sampling import SeedLike, count_packed, make_rng, _check_shots
+from .statevector import Instruction, NON_UNITARY
+
+# Gates the tableau applies directly
+_PRIMITIVES = frozenset({"id", "x", "y", "z", "h", "s", "sdg", "cx", "cz", "swap"})
+
+# Clifford gates expressed in primitives, in time order; ``0``/``1`` index
+# the instruction's qubits
+_DECOMPOSITIONS = {
+    "sx": (("h", 0), ("s", 0), ("h", 0)),
+    "cy": (("sdg", 1), ("cx", 0, 1), ("s", 1)),
+}
+
+# Rotations that are Clifford at multiples of pi/2: gate -> primitive
+# sequences for k = 0..3 quarter turns (global phase dropped)
+_QUARTER_TURNS = {
+    "rz": ((), ("s",), ("z",), ("sdg",)),
+    "rx": ((), ("h", "s", "h"), ("x",), ("h", "sdg", "h")),
+    "ry": ((), ("sdg", "h", "s", "h", "s"), ("y",), ("sdg", "h", "sdg", "h", "s")),
+}
+_QUARTER_TURNS["p"] = _QUARTER_TURNS["u1"] = _QUARTER_TURNS["rz"]
+
+_ANGLE_EPS = 1e-9
+
+
+def _quarter_turns(angle: float) -> Optional[int]:
+    turns = angle / (math.pi / 2)
+    k = round(turns)
+    return k % 4 if abs(turns - k) < _ANGLE_EPS else None
+
+
+def clifford_ops(instruction: Instruction) -> Optional[List[Tuple[str, Tuple[int, ...]]]]:
+    """
+    Primitive tableau operations for one instruction
+
+    Returns:
+        ``[(gate, qubits), ...]`` or None if the instruction is not Clifford
+    """
+    name, qubits, params = instruction
+    name = name.lower()
+    if name in NON_UNITARY:
+        return []
+    if name in _PRIMITIVES:
+        return [(name, tuple(qubits))]
+    if name in _DECOMPOSITIONS:
+        return [(gate, tuple(qubits[i] for i in idx)) for gate, *idx in _DECOMPOSITIONS[name]]
+    if name in _QUARTER_TURNS and len(params) == 1:
+        k = _quarter_turns(float(params[0]))
+        if k is not None:
+            return [(gate, (qubits[0],)) for gate in _QUARTER_TURNS[name][k]]
+    return None
+
+
+def is_clifford(instructions: Iterable[Instruction]) -> bool:
+    """Whether every instruction maps to stabilizer-tableau operations"""
+    return all(clifford_ops(inst) is not None for inst in instructions)
+
+
+def _phase_sum(x1, z1, x2, z2) -> np.ndarray:
+    """
+    Sum over qubits of the Aaronson-Gottesman ``g`` exponent
+
+    ``x1``/``z1`` describe one Pauli (broadcast), ``x2``/``z2`` one or more
+    Paulis it is multiplied onto (last axis = qubits). Per qubit, ``g`` is
+    +1 for YZ, XY, ZX, -1 for YX, XZ, ZY and 0 otherwise.
+    """
+    y1, xo, zo = x1 & z1, x1 & ~z1, z1 & ~x1
+    y2, xo2, zo2 = x2 & z2, x2 & ~z2, z2 & ~x2
+    plus = (y1 & zo2) | (xo & y2) | (zo & xo2)
+    minus = (y1 & xo2) | (xo & zo2) | (zo & y2)
+    return plus.sum(axis=-1, dtype=np.int64) - minus.sum(axis=-1, dtype=np.int64)
+
+
+class StabilizerSimulator:
+    """
+    Stabilizer-tableau simulator for Clifford circuits
+
+    Tracks the ``n`` stabilizer generators of the state as bit matrices
+    (Aaronson-Gottesman, without destabilizers), stored qubit-major so a
+    gate is a few whole-column boolean operations: O(n) per gate and
+    O(n**2) memory instead of a ``2**n`` statevector. Measuring every
+    qubit of a stabilizer state gives a uniform distribution over the
+    affine space ``x0 + rowspace(X part of the stabilizers)``, so after
+    one O(n**3) Gaussian elimination any number of shots are drawn by
+    XOR-ing random combinations of the basis rows.
+
+    Qubit 0 is the rightmost bit of outcome bitstrings, as in
+    :class:`~dnalang.statevector.StatevectorSimulator`.
+
+    Example:
+        >>> sim = StabilizerSimulator(1000)
+        >>> sim.run([("h", (0,), ())] + [("cx", (q, q + 1), ()) for q in range(999)])
+        >>> sorted(v > 0 for v in sim.sample_counts(100, seed=1).values())
+        [True, True]
+        >>> sim.expectation("Z" * 1000)
+        1
+    """
+
+    def __init__(self, num_qubits: int):
+        if num_qubits < 1:
+            raise ValidationError("num_qubits must be positive")
+        n = num_qubits
+        self.num_qubits = n
+        # x[q, i], z[q, i]: Pauli of generator i on qubit q; |0...0> is Z_i
+        self.x = np.zeros((n, n), dtype=np.bool_)
+        self.z = np.eye(n, dtype=np.bool_)
+        self.r = np.zeros(n, dtype=np.bool_)
+        self._reduced: Optional[Dict[str, np.ndarray]] = None
+
+    def _check(self, qubits: Sequence[int]) -> None:
+        for q in qubits:
+            if not 0 <= q < self.num_qubits:
+                raise ValidationError(f"Qubit index {q} out of range for {self.num_qubits} qubits")
+        if len(set(qubits)) != len(qubits):
+            raise ValidationError(f"Repeated qubit in {tuple(qubits)}")
+
+    def _gate(self, name: str, qubits: Tuple[int, ...]) -> None:
+        x, z, r = self.x, self.z, self.r
+        if name == "h":
+            q, = qubits
+            r ^= x[q] & z[q]
+            x[q], z[q] = z[q].copy(), x[q].copy()
+        elif name == "s":
+            q, = qubits
+            r ^= x[q] & z[q]
+            z[q] ^= x[q]
+        elif name == "sdg":
+            q, = qubits
+            r ^= x[q] & ~z[q]
+            z[q] ^= x[q]
+        elif name == "x":
+            r ^= z[qubits[0]]
+        elif name == "z":
+            r ^= x[qubits[0]]
+        elif name == "y":
+            r ^= x[qubits[0]] ^ z[qubits[0]]
+        elif name == "cx":
+            a, b = qubits
+            r ^= x[a] & z[b] & ~(x[b] ^ z[a])
+            x[b] ^= x[a]
+            z[a] ^= z[b]
+        elif name == "cz":
+            a, b = qubits
+            r ^= x[a] & x[b] & (z[a] ^ z[b])
+            z[a] ^= x[b]
+            z[b] ^= x[a]
+        elif name == "swap":
+            a, b = qubits
+            x[[a, b]] = x[[b, a]]
+            z[[a, b]] = z[[b, a]]
+
+    def apply(self, name: str, qubits: Sequence[int], params: Sequence[float] = ()) -> None:
+        """
+        Apply a named Clifford gate
+
+        Raises:
+            ValidationError: If the gate is not Clifford (or unknown)
+        """
+        qubits = tuple(qubits)
+        ops = clifford_ops((name, qubits, tuple(params)))
+        if ops is None:
+            raise ValidationError(f"{name}{tuple(params) or ''} is not a Clifford gate")
+        if ops:
+            self._check(qubits)
+            self._reduced = None
+        for gate, targets in ops:
+            self._gate(gate, targets)
+
+    def run(self, instructions: Iterable[Instruction]) -> "StabilizerSimulator":
+        """Apply a sequence of ``(name, qubits, params)`` instructions"""
+        for name, qubits, params in instructions:
+            self.apply(name, qubits, params)
+        return self
+
+    def generators(self) -> List[str]:
+        """Stabilizer generators as signed Pauli strings (qubit 0 leftmost)"""
+        letters = np.array(["I", "X", "Z", "Y"])
+        codes = self.x.T.astype(np.int8) + 2 * self.z.T.astype(np.int8)
+        return [("-" if sign else "+") + "".join(letters[row]) for sign, row in zip(self.r, codes)]
+
+    def _reduce(self) -> Dict[str, np.ndarray]:
+        """
+        Row-reduce the generators, X block first, keeping signs exact
+
+        Produces ``basis`` (X parts spanning the outcome space), the
+        Z-only ``constraints`` ``a . x = sign`` fixing it, a particular
+        outcome ``x0``, and the full reduced tableau for expectations.
+        """
+        if self._reduced is not None:
+            return self._reduced
+        n = self.num_qubits
+        # Generator-major copies: rows are generators, columns qubits
+        xs, zs, rs = self.x.T.copy(), self.z.T.copy(), self.r.copy()
+        pivots: List[Tuple[int, int]] = []  # (row, column in [X | Z])
+        row = 0
+        for block, bits in ((0, xs), (1, zs)):
+            for col in range(n):
+                if row == n:
+                    break
+                candidates = np.flatnonzero(bits[row:, col]) + row
+                if candidates.size == 0:
+                    continue
+                pivot = candidates[0]
+                if pivot != row:
+                    for m in (xs, zs, rs):
+                        m[[row, pivot]] = m[[pivot, row]]
+                targets = np.flatnonzero(bits[:, col])
+                targets = targets[targets != row]
+                if targets.size:
+                    # Only qubits where the pivot row is not the identity change
+                    support = np.flatnonzero(xs[row] | zs[row])
+                    block_ix = np.ix_(targets, support)
+                    px, pz = xs[row, support], zs[row, support]
+                    tx, tz = xs[block_ix], zs[block_ix]
+                    phase = 2 * rs[targets].astype(np.int64) + 2 * int(rs[row]) + _phase_sum(px, pz, tx, tz)
+                    rs[targets] = (phase % 4) == 2
+                    xs[block_ix] = tx ^ px
+                    zs[block_ix] = tz ^ pz
+                pivots.append((row, block * n + col))
+                row += 1
+            if block == 0:
+                rank = row
+        x0 = np.zeros(n, dtype=np.bool_)
+        for pivot_row, column in pivots[rank:]:
+            # Reduced Z-only rows: each pivot column appears in one row only,
+            # so free variables at 0 leave x[pivot] = sign
+            x0[column - n] = rs[pivot_row]
+        self._reduced = {
+            "xs": xs, "zs": zs, "rs": rs,
+            "pivots": np.array([c for _, c in pivots], dtype=np.int64),
+            "basis": xs[:rank],
+            "constraints": zs[rank:],
+            "signs": rs[rank:],
+            "x0": x0,
+        }
+        return self._reduced
+
+    @property
+    def support_dimension(self) -> int:
+        """``k``: outcomes are uniform over ``2**k`` bitstrings"""
+        return int(self._reduce()["basis"].shape[0])
+
+    def probabilities(self, outcomes: np.ndarray) -> np.ndarray:
+        """
+        Ideal probability of each outcome
+
+        Args:
+            outcomes: (m, n) bool array, column ``q`` = qubit ``q``
+
+        Returns:
+            ``2**-k`` for outcomes in the support, else 0
+        """
+        reduced = self._reduce()
+        outcomes = np.atleast_2d(np.asarray(outcomes, dtype=np.bool_))
+        constraints = reduced["constraints"].astype(np.int64)
+        parity = (outcomes.astype(np.int64) @ constraints.T) % 2 == reduced["signs"]
+        inside = parity.all(axis=1)
+        return np.where(inside, 2.0 ** -self.support_dimension, 0.0)
+
+    def expectation(self, pauli: str) -> int:
+        """
+        Expectation of a Pauli string (qubit 0 leftmost, optional sign)
+
+        Returns:
+            +1 or -1 if the Pauli (up to sign) stabilizes the state, else 0
+        """
+        sign = pauli.startswith("-")
+        letters = pauli.lstrip("+-").upper()
+        if len(letters) != self.num_qubits or set(letters) - set("IXYZ"):
+            raise ValidationError(f"Pauli string must have {self.num_qubits} letters from IXYZ")
+        target = np.array([c in "XY" for c in letters] + [c in "ZY" for c in letters])
+        reduced = self._reduce()
+        n = self.num_qubits
+        acc_x, acc_z = np.zeros(n, dtype=np.bool_), np.zeros(n, dtype=np.bool_)
+        phase = 0
+        remainder = target.copy()
+        for row, column in enumerate(reduced["pivots"]):
+            if not remainder[column]:
+                continue
+            xs, zs = reduced["xs"][row], reduced["zs"][row]
+            phase += 2 * int(reduced["rs"][row]) + int(_phase_sum(xs, zs, acc_x, acc_z))
+            acc_x ^= xs
+            acc_z ^= zs
+            remainder[:n] ^= xs
+            remainder[n:] ^= zs
+        if remainder.any():
+            return 0
+        # acc is (-1)^(phase/2) times the unsigned target Pauli
+        value = -1 if phase % 4 == 2 else 1
+        return -value if sign else value
+
+    def sample(self, shots: int, seed: SeedLike = None) -> np.ndarray:
+        """
+        Measure every qubit ``shots`` times
+
+        Args:
+            shots: Number of shots
+            seed: Seed, SeedSequence or Generator
+
+        Returns:
+            (shots, ceil(n / 8)) uint8 outcomes, bit ``q`` of each row
+            (little-endian bit order) holding qubit ``q``; see
+            :func:`dnalang.sampling.count_packed`
+        """
+        shots = _check_shots(shots)
+        rng = make_rng(seed)
+        reduced = self._reduce()
+        width = (self.num_qubits + 7) // 8
+        basis = np.packbits(reduced["basis"], axis=1, bitorder="little")
+        out = np.repeat(np.packbits(reduced["x0"], bitorder="little")[None, :], shots, axis=0)
+        # Eight basis rows at a time: XOR in one of 256 precomputed
+        # combinations chosen by a random byte
+        for start in range(0, basis.shape[0], 8):
+            table = np.zeros((1, width), dtype=np.uint8)
+            for row in basis[start:start + 8]:
+                table = np.concatenate([table, table ^ row])
+            out ^= table[rng.integers(0, table.shape[0], size=shots)]
+        return out
+
+    def sample_counts(self, shots: int, seed: SeedLike = None) -> Dict[str, int]:
+        """Counts keyed by bitstring (qubit 0 rightmost)"""
+        return count_packed(self.sample(shots, seed), self.num_qubits)[0]
@@ -0,0 +1,358 @@
+"""DNALang Statevector Simulator"""
+
+import math
+from typing import Dict, Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exceptions import ValidationError
+from .sampling import Counts, SeedLike, sample_counts
+
+# Instruction tuple: (gate name, qubit indices, parameters)
+Instruction = Tuple[str, Tuple[int, ...], Tuple[float, ...]]
+
+_SQ2 = 1 / math.sqrt(2)
+
+FIXED_GATES: Dict[str, np.ndarray] = {
+    "id": np.eye(2, dtype=np.complex128),
+    "x": np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    "y": np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    "z": np.array([[1, 0], [0, -1]], dtype=np.complex128),
+    "h": np.array([[_SQ2, _SQ2], [_SQ2, -_SQ2]], dtype=np.complex128),
+    "s": np.array([[1, 0], [0, 1j]], dtype=np.complex128),
+    "sdg": np.array([[1, 0], [0, -1j]], dtype=np.complex128),
+    "t": np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]], dtype=np.complex128),
+    "tdg": np.array([[1, 0], [0, np.exp(-1j * math.pi / 4)]], dtype=np.complex128),
+    "sx": 0.5 * np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]], dtype=np.complex128),
+}
+
+
+def _rx(theta: float) -> np.ndarray:
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+
+
+def _ry(theta: float) -> np.ndarray:
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array([[c, -s], [s, c]], dtype=np.complex128)
+
+
+def _rz(theta: float) -> np.ndarray:
+    return np.array([[np.exp(-0.5j * theta), 0], [0, np.exp(0.5j * theta)]], dtype=np.complex128)
+
+
+def _phase(lam: float) -> np.ndarray:
+    return np.array([[1, 0], [0, np.exp(1j * lam)]], dtype=np.complex128)
+
+
+def _u3(theta: float, phi: float, lam: float) -> np.ndarray:
+    c, s = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array([
+        [c, -np.exp(1j * lam) * s],
+        [np.exp(1j * phi) * s, np.exp(1j * (phi + lam)) * c]
+    ], dtype=np.complex128)
+
+
+PARAMETRIC_GATES = {
+    "rx": _rx,
+    "ry": _ry,
+    "rz": _rz,
+    "p": _phase,
+    "u1": _phase,
+    "u2": lambda phi, lam: _u3(math.pi / 2, phi, lam),
+    "u3": _u3,
+    "u": _u3,
+}
+
+# Controlled gates: name -> (number of controls, base gate name)
+CONTROLLED_GATES = {
+    "cx": (1, "x"), "cy": (1, "y"), "cz": (1, "z"), "ch": (1, "h"),
+    "cp": (1, "p"), "cu1": (1, "u1"), "crx": (1, "rx"), "cry": (1, "ry"),
+    "crz": (1, "rz"), "cu3": (1, "u3"), "ccx": (2, "x"),
+}
+
+# Gates on qubits below this are applied as one dense (2**k x 2**k) matmul
+# over contiguous k-qubit blocks; strided views are slow when the inner
+# stride is only one or two amplitudes
+_BLOCK_QUBITS = 4
+
+# Amplitudes per matmul when a borrowed buffer must be updated in place
+_INPLACE_CHUNK = 1 << 14
+
+# Instructions that do not change the state
+NON_UNITARY = frozenset({"barrier", "measure"})
+
+
+def gate_matrix(name: str, params: Sequence[float] = ()) -> np.ndarray:
+    """
+    Return the 2x2 unitary for a single-qubit gate
+
+    Raises:
+        ValidationError: If the gate is unknown
+    """
+    if name in FIXED_GATES:
+        return FIXED_GATES[name]
+    if name in PARAMETRIC_GATES:
+        return PARAMETRIC_GATES[name](*params)
+    raise ValidationError(f"Unsupported gate: {name}")
+
+
+def _embed(matrix: np.ndarray, qubits: Sequence[int], num_qubits: int) -> np.ndarray:
+    """
+    Expand a gate on ``qubits`` to a full ``2**num_qubits`` operator
+
+    ``qubits[0]`` is the most significant bit of ``matrix``'s index.
+    """
+    k = len(qubits)
+    full = np.kron(matrix, np.eye(1 << (num_qubits - k), dtype=np.complex128))
+    # full acts on axes (qubits..., others...) in MSB-first order; permute
+    # both row and column indices into the natural qubit order
+    others = [q for q in range(num_qubits - 1, -1, -1) if q not in qubits]
+    order = list(qubits) + others
+    axes = [order.index(q) for q in range(num_qubits - 1, -1, -1)]
+    shape = (2,) * (2 * num_qubits)
+    full = full.reshape(shape).transpose(axes + [num_qubits + a for a in axes])
+    return full.reshape(1 << num_qubits, 1 << num_qubits)
+
+
+class StatevectorSimulator:
+    """
+    Dense statevector simulator
+
+    The state is a single contiguous complex128 array of length ``2**n``;
+    qubit 0 is the least significant bit (Qiskit ordering). Gates are
+    applied in place on reshaped views of that array, so no per-amplitude
+    Python loops run and single-qubit gates allocate only one half-size
+    temporary.
+
+    ``state`` may be passed in (e.g. a shared-memory shard); the simulator
+    then works on that buffer in place, starting from its contents.
+
+    Example:
+        >>> sim = StatevectorSimulator(2)
+        >>> sim.apply("h", (0,))
+        >>> sim.apply("cx", (0, 1))
+        >>> sim.probabilities()
+        array([0.5, 0. , 0. , 0.5])
+    """
+
+    def __init__(self, num_qubits: int, state: Optional[np.ndarray] = None):
+        if num_qubits < 1:
+            raise ValidationError("num_qubits must be positive")
+        self.num_qubits = num_qubits
+        self._borrowed = state is not None
+        if state is None:
+            state = np.zeros(1 << num_qubits, dtype=np.complex128)
+            state[0] = 1.0
+        elif state.shape != (1 << num_qubits,) or state.dtype != np.complex128:
+            raise ValidationError(f"state must be a complex128 array of length 2**{num_qubits}")
+        self.state = state
+        self._scratch: Optional[np.ndarray] = None
+
+    def reset(self) -> None:
+        """Return to |0...0>"""
+        self.state[:] = 0
+        self.state[0] = 1.0
+
+    def _view(self, qubit: int) -> np.ndarray:
+        """(high, 2, low) view that isolates ``qubit`` on axis 1"""
+        return self.state.reshape(-1, 2, 1 << qubit)
+
+    def _view2(self, q_hi: int, q_lo: int) -> np.ndarray:
+        """(a, 2, b, 2, c) view isolating two qubits, ``q_hi > q_lo``"""
+        return self.state.reshape(-1, 2, 1 << (q_hi - q_lo - 1), 2, 1 << q_lo)
+
+    def _check(self, qubits: Sequence[int]) -> None:
+        for q in qubits:
+            if not 0 <= q < self.num_qubits:
+                raise ValidationError(f"Qubit index {q} out of range for {self.num_qubits} qubits")
+        if len(set(qubits)) != len(qubits):
+            raise ValidationError(f"Repeated qubit in {tuple(qubits)}")
+
+    def apply_1q(self, matrix: np.ndarray, qubit: int) -> None:
+        """Apply a 2x2 unitary to ``qubit`` in place"""
+        v = self._view(qubit)
+        a0 = v[:, 0, :]
+        a1 = v[:, 1, :]
+        if matrix[0, 1] == 0 and matrix[1, 0] == 0:
+            # Diagonal gates (Z, S, T, RZ, P): scale each half
+            if matrix[0, 0] != 1:
+                a0 *= matrix[0, 0]
+            if matrix[1, 1] != 1:
+                a1 *= matrix[1, 1]
+            return
+        if qubit < _BLOCK_QUBITS and self.num_qubits >= _BLOCK_QUBITS:
+            self._apply_blocked(matrix, (qubit,))
+            return
+        tmp = matrix[0, 0] * a0 + matrix[0, 1] * a1
+        a1 *= matrix[1, 1]
+        a1 += matrix[1, 0] * a0
+        a0[...] = tmp
+
+    def _apply_blocked(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """Apply a gate on low qubits as a BLAS matmul over contiguous blocks"""
+        block = 1 << _BLOCK_QUBITS
+        kron = _embed(matrix, qubits, _BLOCK_QUBITS)
+        if self._borrowed:
+            # The buffer cannot be swapped for scratch; go a cache-sized chunk at a time
+            rows = self.state.reshape(-1, block)
+            step = _INPLACE_CHUNK // block
+            for start in range(0, rows.shape[0], step):
+                chunk = rows[start:start + step]
+                chunk[...] = chunk @ kron.T
+            return
+        if self._scratch is None:
+            self._scratch = np.empty_like(self.state)
+        out = self._scratch.reshape(-1, block)
+        np.matmul(self.state.reshape(-1, block), kron.T, out=out)
+        self.state, self._scratch = self._scratch, self.state
+
+    def _apply_2q(self, matrix: np.ndarray, q0: int, q1: int) -> None:
+        """Dense two-qubit gate via a 5-D view and one (N/4 x 4) matmul"""
+        hi, lo = max(q0, q1), min(q0, q1)
+        if q0 < q1:
+            # Matrix index is (q0, q1) MSB-first; reorder to (hi, lo)
+            matrix = matrix.reshape(2, 2, 2, 2).transpose(1, 0, 3, 2).reshape(4, 4)
+        v = self._view2(hi, lo)
+        gathered = v.transpose(0, 2, 4, 1, 3).reshape(-1, 4)
+        out = np.matmul(gathered, matrix.T)
+        v[...] = out.reshape(v.shape[0], v.shape[2], v.shape[4], 2, 2).transpose(0, 3, 1, 4, 2)
+
+    def apply_controlled_1q(self, matrix: np.ndarray, control: int, target: int) -> None:
+        """Apply ``matrix`` to ``target`` on the subspace where ``control`` is 1"""
+        if control > target:
+            v = self._view2(control, target)
+            a0, a1 = v[:, 1, :, 0, :], v[:, 1, :, 1, :]
+        else:
+            v = self._view2(target, control)
+            a0, a1 = v[:, 0, :, 1, :], v[:, 1, :, 1, :]
+
+        if matrix[0, 0] == 0 and matrix[1, 1] == 0 and matrix[0, 1] == 1 and matrix[1, 0] == 1:
+            # CX: swap the two halves of the control=1 subspace
+            tmp = a0.copy()
+            a0[...] = a1
+            a1[...] = tmp
+            return
+        if matrix[0, 1] == 0 and matrix[1, 0] == 0:
+            if matrix[0, 0] != 1:
+                a0 *= matrix[0, 0]
+            if matrix[1, 1] != 1:
+                a1 *= matrix[1, 1]
+            return
+        tmp = matrix[0, 0] * a0 + matrix[0, 1] * a1
+        a1 *= matrix[1, 1]
+        a1 += matrix[1, 0] * a0
+        a0[...] = tmp
+
+    def apply_swap(self, q1: int, q2: int) -> None:
+        """Swap two qubits in place"""
+        hi, lo = max(q1, q2), min(q1, q2)
+        v = self._view2(hi, lo)
+        tmp = v[:, 0, :, 1, :].copy()
+        v[:, 0, :, 1, :] = v[:, 1, :, 0, :]
+        v[:, 1, :, 0, :] = tmp
+
+    def apply_unitary(self, matrix: np.ndarray, qubits: Sequence[int]) -> None:
+        """
+        Apply a dense ``2**k x 2**k`` unitary to ``qubits``
+
+        ``qubits[0]`` is the most significant bit of the matrix index.
+        """
+        k = len(qubits)
+        if k == 1:
+            self.apply_1q(matrix, qubits[0])
+            return
+        n = self.num_qubits
+        if max(qubits) < _BLOCK_QUBITS <= n:
+            self._apply_blocked(matrix, qubits)
+            return
+        if k == 2:
+            self._apply_2q(matrix, qubits[0], qubits[1])
+            return
+        # Move the target axes last, apply as one matmul, scatter back in place
+        psi = self.state.reshape((2,) * n)
+        targets = [n - 1 - q for q in qubits]
+        rest = [axis for axis in range(n) if axis not in targets]
+        perm = rest + targets
+        gathered = psi.transpose(perm).reshape(-1, 1 << k)
+        out = np.matmul(gathered, matrix.T)
+        psi[...] = out.reshape([2] * n).transpose(np.argsort(perm))
+
+    def apply(self, name: str, qubits: Sequence[int], params: Sequence[float] = ()) -> None:
+        """
+        Apply a named gate
+
+        Args:
+            name: Gate name (OpenQASM 2 qelib1 names)
+            qubits: Qubit indices (controls first)
+            params: Gate angles
+        """
+        name = name.lower()
+        if name in NON_UNITARY:
+            return
+        qubits = tuple(qubits)
+        self._check(qubits)
+
+        if name == "unitary":
+            # Fused block produced by dnalang.compiler; params = (matrix,)
+            self.apply_unitary(params[0], qubits)
+        elif name == "swap":
+            self.apply_swap(*qubits)
+        elif name in CONTROLLED_GATES:
+            n_controls, base = CONTROLLED_GATES[name]
+            matrix = gate_matrix(base, params)
+            if n_controls == 1:
+                self.apply_controlled_1q(matrix, qubits[0], qubits[1])
+            else:
+                full = np.eye(1 << (n_controls + 1), dtype=np.complex128)
+                full[-2:, -2:] = matrix
+                self.apply_unitary(full, qubits)
+        elif name == "cswap":
+            full = np.eye(8, dtype=np.complex128)
+            full[[5, 6], :] = full[[6, 5], :]
+            self.apply_unitary(full, qubits)
+        else:
+            self.apply_1q(gate_matrix(name, params), qubits[0])
+
+    def run(self, instructions: Iterable[Instruction]) -> "StatevectorSimulator":
+        """Apply a sequence of ``(name, qubits, params)`` instructions"""
+        for name, qubits, params in instructions:
+            self.apply(name, qubits, params)
+        return self
+
+    def probabilities(self) -> np.ndarray:
+        """Born-rule probabilities of every basis state"""
+        probs = self.state.real ** 2 + self.state.imag ** 2
+        return probs
+
+    def sample(self, shots: int, seed: SeedLike = None) -> Counts:
+        """
+        Sample measurement outcomes
+
+        Args:
+            shots: Number of shots
+            seed: Seed, SeedSequence or Generator (see dnalang.sampling)
+
+        Returns:
+            :class:`dnalang.sampling.Counts` array indexed by basis state
+        """
+        return sample_counts(self.probabilities(), shots, seed=seed)
+
+    def sample_counts(self, shots: int, seed: Optional[int] = None) -> Dict[str, int]:
+        """Counts keyed by bitstring (qubit 0 rightmost)"""
+        return self.sample(shots, seed).to_dict()
+
+    def reduced_purity(self, num_low: int) -> Dict[str, Any]:
+        """
+        Schmidt decomposition across the cut after the ``num_low`` low qubits
+
+        Returns:
+            Dict with the subsystem ``purity`` and ``entropy`` (bits)
+        """
+        matrix = self.state.reshape(-1, 1 << num_low)
+        schmidt = np.linalg.svd(matrix, compute_uv=False) ** 2
+        schmidt = schmidt[schmidt > 1e-15]
+        return {
+            "purity": float(np.sum(schmidt ** 2)),
+            "entropy": float(-np.sum(schmidt * np.log2(schmidt)))
+        }
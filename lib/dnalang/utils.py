@@ -1,29 +1,28 @@
 """DNALang Utilities"""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional
 import re
 
+from .qasm import parse_circuit, validate_qasm
+
 def validate_circuit(qasm: str) -> bool:
     """
     Validate OpenQASM circuit
 
+    Parses the full program (registers, gate arities, operand ranges,
+    custom gate definitions); results are cached per source text.
+
     Args:
         qasm: OpenQASM code string
 
     Returns:
         True if valid
-
-    Raises:
-        ValidationError: If circuit is invalid
     """
     if not qasm or not isinstance(qasm, str):
         return False
 
-    # Basic QASM validation
-    if not qasm.strip().startswith("OPENQASM"):
-        return False
-
-    return True
+    valid, _ = validate_qasm(qasm)
+    return valid
 
 
 def format_results(result: Dict[str, Any]) -> str:
@@ -52,42 +51,53 @@ def format_results(result: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def calculate_metrics(counts: Dict[str, int]) -> Dict[str, float]:
+def calculate_metrics(
+    counts: Dict[str, int],
+    target: Optional[Dict[str, float]] = None
+) -> Dict[str, float]:
     """
     Calculate quantum metrics from measurement counts
 
+    Thin wrapper over :func:`dnalang.metrics.compute_metrics` (or
+    :func:`dnalang.metrics.sparse_metrics` for registers wider than
+    ``DENSE_QUBITS``); use those directly for count arrays and stacked
+    batches.
+
     Args:
         counts: Measurement counts dict (e.g., {"00": 512, "11": 512})
+        target: Ideal outcome probabilities keyed by bitstring (defaults to
+            the GHZ/Bell distribution over the counts' width)
 
     Returns:
-        Calculated metrics (fidelity, entropy, etc.)
+        Calculated metrics. ``fidelity`` is the measured population on the
+        target's outcomes (all-0/all-1 by default, as in local coherence
+        results); ``classical_fidelity`` is the Bhattacharyya overlap with
+        the target distribution. Also entropy, tvd, heavy-output
+        probability, etc.
 
     Example:
         >>> counts = {"00": 500, "11": 500, "01": 24, "10": 24}
         >>> metrics = calculate_metrics(counts)
         >>> print(f"Fidelity: {metrics['fidelity']:.4f}")
+        Fidelity: 0.9542
     """
+    from .metrics import DENSE_QUBITS, compute_metrics, counts_matrix, ghz_target, sparse_metrics, summarize
+
     total_shots = sum(counts.values())
     if total_shots == 0:
         return {}
 
-    # Calculate probabilities
-    probs = {state: count / total_shots for state, count in counts.items()}
-
-    # Shannon entropy
-    import math
-    entropy = -sum(p * math.log2(p) if p > 0 else 0 for p in probs.values())
+    num_qubits = max(len(key) for key in counts)
+    if target is not None:
+        num_qubits = max(num_qubits, max(len(key) for key in target))
 
-    # Simplified fidelity (assumes ideal state is |00> + |11>)
-    ideal_states = ["00", "11"] if "00" in counts else list(counts.keys())[:2]
-    fidelity = sum(probs.get(state, 0) for state in ideal_states)
-
-    return {
-        "fidelity": fidelity,
-        "entropy": entropy,
-        "total_shots": total_shots,
-        "num_states": len(counts)
-    }
+    if num_qubits > DENSE_QUBITS:
+        metrics = summarize(sparse_metrics(counts, target, num_qubits))
+    else:
+        ideal = ghz_target(num_qubits) if target is None else counts_matrix(target, num_qubits)[0]
+        metrics = summarize(compute_metrics(counts_matrix(counts, num_qubits), target=ideal))
+    metrics["num_states"] = len(counts)
+    return metrics
 
 
 def validate_api_key(api_key: str) -> bool:
@@ -122,30 +132,8 @@ def parse_qasm(qasm: str) -> Dict[str, Any]:
         >>> qasm = "OPENQASM 2.0;\\nqreg q[2];"
         >>> info = parse_qasm(qasm)
         >>> print(f"Qubits: {info['num_qubits']}")
-    """
-    lines = qasm.strip().split("\n")
-
-    info = {
-        "version": None,
-        "num_qubits": 0,
-        "num_gates": 0
-    }
-
-    for line in lines:
-        line = line.strip()
-
-        # Version
-        if line.startswith("OPENQASM"):
-            info["version"] = line.split()[-1].rstrip(";")
 
-        # Qubit register
-        if line.startswith("qreg"):
-            match = re.search(r"\[(\d+)\]", line)
-            if match:
-                info["num_qubits"] = int(match.group(1))
-
-        # Count gates (simplified)
-        if any(gate in line for gate in ["cx", "h", "x", "y", "z", "rx", "ry", "rz"]):
-            info["num_gates"] += 1
-
-    return info
+    Raises:
+        ValidationError: If the program is malformed
+    """
+    return parse_circuit(qasm).stats()
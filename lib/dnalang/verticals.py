@@ -1,6 +1,20 @@
 """DNALang Industry Verticals"""
 
-from typing import Dict, Any, List
+import inspect
+from typing import Dict, Any, Iterable, List, Optional
+
+from .operations import EXECUTE_ENDPOINT
+
+
+def _run(client, operation: str, parameters: Dict[str, Any], wait: bool):
+    """Execute a vertical operation, or submit it as a job when ``wait`` is False"""
+    if not wait:
+        return client.submit_job(operation, parameters)
+    return client.request("POST", EXECUTE_ENDPOINT, data={
+        "operation": operation,
+        "parameters": parameters
+    })
+
 
 class VerticalsClient:
     """Client for industry vertical solutions"""
@@ -18,6 +32,15 @@ class FinanceClient:
 
     def __init__(self, client):
         self.client = client
+        self._optimizer = None
+
+    @property
+    def optimizer(self):
+        """Local QUBO engine; keeps the last solution to warm-start the next call"""
+        if self._optimizer is None:
+            from .portfolio import PortfolioOptimizer
+            self._optimizer = PortfolioOptimizer(method=self.client.config.portfolio_solver)
+        return self._optimizer
 
     def optimize_portfolio(
         self,
@@ -25,20 +48,36 @@ class FinanceClient:
         target_return: float = 0.12,
         risk_tolerance: float = 0.5,
         max_allocation: float = 0.3,
-        shots: int = 8192
+        shots: int = 8192,
+        wait: bool = True
     ) -> Dict[str, Any]:
         """
         Optimize investment portfolio using quantum algorithms
 
+        With ``config.local_verticals`` (the default) blocking calls solve
+        a mean-variance QUBO in-process (see :mod:`dnalang.portfolio`):
+        the return target becomes a floor, the cap is built into the
+        allocation encoding, and parallel tabu or annealing replicas search
+        it. Repeat calls over the same assets warm-start from the previous
+        solution and only recompute covariance rows whose returns changed.
+
         Args:
             assets: List of asset dictionaries with symbol, returns, etc.
             target_return: Target annual return (0.12 = 12%)
             risk_tolerance: Risk tolerance factor (0-1)
             max_allocation: Maximum allocation per asset (0.3 = 30%)
-            shots: Quantum shots for optimization
+            shots: Quantum shots for optimization (locally, one annealing
+                replica per 512 shots)
+            wait: Block for the full result (True) or return a Job handle
+                that streams partial results (False)
 
         Returns:
-            Optimized portfolio with allocations
+            Optimized portfolio with allocations; local results add a
+            ``qubo`` report (energy, solver, warm start, time to best)
+
+        Raises:
+            ValidationError: If an asset lacks returns or the cap cannot
+                fully invest the portfolio (local engine)
 
         Example:
             >>> assets = [
@@ -46,18 +85,20 @@ class FinanceClient:
             ...     {"symbol": "JPM", "returns": [0.08, 0.06, 0.09], ...}
             ... ]
             >>> portfolio = client.finance.optimize_portfolio(assets)
-            >>> print(f"Sharpe Ratio: {portfolio['sharpe_ratio']:.2f}")
+            >>> print(f"Sharpe Ratio: {portfolio['result']['sharpe_ratio']:.2f}")
         """
-        return self.client.request("POST", "/api/operations/execute", data={
-            "operation": "finance_optimize_portfolio",
-            "parameters": {
-                "assets": assets,
-                "target_return": target_return,
-                "risk_tolerance": risk_tolerance,
-                "max_allocation": max_allocation,
-                "shots": shots
-            }
-        })
+        if wait and self.client.config.local_verticals:
+            return self.client.run_local(
+                self.optimizer.optimize, assets, target_return, risk_tolerance,
+                max_allocation, shots, self.client.config.simulator_seed
+            )
+        return _run(self.client, "finance_optimize_portfolio", {
+            "assets": assets,
+            "target_return": target_return,
+            "risk_tolerance": risk_tolerance,
+            "max_allocation": max_allocation,
+            "shots": shots
+        }, wait)
 
 
 class PharmaClient:
@@ -70,7 +111,8 @@ class PharmaClient:
         self,
         target_protein: Dict,
         drug_candidates: List[Dict],
-        shots: int = 4096
+        shots: int = 4096,
+        wait: bool = True
     ) -> Dict[str, Any]:
         """
         Simulate drug-protein docking using quantum chemistry
@@ -79,6 +121,8 @@ class PharmaClient:
             target_protein: Protein structure dict
             drug_candidates: List of drug molecule dicts
             shots: Quantum shots
+            wait: Block for the full result (True) or return a Job handle
+                that streams partial results (False)
 
         Returns:
             Ranked drug candidates
@@ -92,14 +136,73 @@ class PharmaClient:
             >>> results = client.pharma.drug_docking(protein, candidates)
             >>> best = results['best_candidate']
         """
-        return self.client.request("POST", "/api/operations/execute", data={
-            "operation": "pharma_drug_docking",
-            "parameters": {
-                "target_protein": target_protein,
-                "drug_candidates": drug_candidates,
-                "shots": shots
-            }
-        })
+        return _run(self.client, "pharma_drug_docking", {
+            "target_protein": target_protein,
+            "drug_candidates": drug_candidates,
+            "shots": shots
+        }, wait)
+
+    def screen(
+        self,
+        target_protein: Dict,
+        drug_candidates: Iterable[Dict],
+        top_k: int = 100,
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        checkpoint: Optional[str] = None,
+        shots: int = 4096
+    ):
+        """
+        Screen a large candidate library against one target
+
+        Candidates are read lazily and sharded into ``drug_docking`` calls
+        of ``batch_size``, with up to ``concurrency`` in flight. Only a
+        running top-K is kept, so libraries of any size screen in constant
+        memory. With ``checkpoint`` set, progress is saved after every
+        shard and a rerun with the same target, library order, batch size
+        and ``top_k`` resumes where it stopped (failed shards are retried).
+
+        Args:
+            target_protein: Protein structure dict
+            drug_candidates: Any iterable of drug molecule dicts (e.g. a
+                generator reading a file)
+            top_k: Best candidates to keep
+            batch_size: Candidates per docking request
+                (default ``config.screening_batch_size``)
+            concurrency: Requests in flight (default ``config.batch_concurrency``)
+            checkpoint: Path of a JSON checkpoint to resume from and update
+            shots: Quantum shots per docking request
+
+        Returns:
+            Iterator of one event per finished shard: ``batch``, ``status``
+            (``"ok"``/``"error"``), ``error``, how many of its candidates
+            ``entered`` the top-K, running ``scored``/``failed`` counts and
+            the current ``ranked`` top-K (``rank``, library ``index``,
+            ``score``, ``candidate`` and any docking detail); an async
+            iterator when used from AsyncQuantumClient
+
+        Raises:
+            ValidationError: If the checkpoint belongs to a different screen
+
+        Example:
+            >>> for event in client.pharma.screen(protein, read_library("zinc.jsonl"),
+            ...                                   top_k=50, checkpoint="spike.ckpt"):
+            ...     print(event["scored"], event["ranked"][0]["candidate"]["name"])
+        """
+        from .screening import ScreeningPipeline
+
+        config = self.client.config
+        pipeline = ScreeningPipeline(
+            lambda shard: self.drug_docking(target_protein, shard, shots),
+            top_k=top_k,
+            batch_size=batch_size or config.screening_batch_size,
+            checkpoint=checkpoint,
+            identity={"target_protein": target_protein, "shots": shots}
+        )
+        concurrency = concurrency or config.batch_concurrency
+        if inspect.iscoroutinefunction(self.client.request):
+            return pipeline.run_async(drug_candidates, concurrency)
+        return pipeline.run(drug_candidates, concurrency)
 
 
 class MaterialsClient:
@@ -107,6 +210,15 @@ class MaterialsClient:
 
     def __init__(self, client):
         self.client = client
+        self._model = None
+
+    @property
+    def model(self):
+        """Local catalyst model; caches per-material descriptors across calls"""
+        if self._model is None:
+            from .catalysis import CatalystModel
+            self._model = CatalystModel()
+        return self._model
 
     def design_catalyst(
         self,
@@ -114,17 +226,24 @@ class MaterialsClient:
         candidate_materials: List[Dict],
         temperature: float = 298.15,
         pressure: float = 1.0,
-        shots: int = 8192
+        shots: int = 8192,
+        wait: bool = True
     ) -> Dict[str, Any]:
         """
         Design optimal catalyst using quantum simulation
 
+        Scored by the server for the given reaction; use
+        :meth:`sweep_catalyst` for whole temperature x pressure grids on
+        the local descriptor model.
+
         Args:
             reaction: Target chemical reaction
             candidate_materials: List of material dicts
             temperature: Temperature in Kelvin
             pressure: Pressure in atm
             shots: Quantum shots
+            wait: Block for the full result (True) or return a Job handle
+                that streams partial results (False)
 
         Returns:
             Ranked materials by catalytic performance
@@ -140,16 +259,64 @@ class MaterialsClient:
             ...     temperature=450.0
             ... )
         """
-        return self.client.request("POST", "/api/operations/execute", data={
-            "operation": "materials_catalyst_design",
-            "parameters": {
-                "reaction": reaction,
-                "candidate_materials": candidate_materials,
-                "temperature": temperature,
-                "pressure": pressure,
-                "shots": shots
-            }
-        })
+        return _run(self.client, "materials_catalyst_design", {
+            "reaction": reaction,
+            "candidate_materials": candidate_materials,
+            "temperature": temperature,
+            "pressure": pressure,
+            "shots": shots
+        }, wait)
+
+    def sweep_catalyst(
+        self,
+        reaction: str,
+        candidate_materials: List[Dict],
+        temperatures: Iterable[float],
+        pressures: Iterable[float],
+        workers: Optional[int] = None
+    ):
+        """
+        Score every material over a full temperature x pressure grid
+
+        Runs locally: identical materials and repeated grid values are
+        evaluated once, per-material intermediates are cached across
+        calls, and large grids are split over a process pool.
+
+        The descriptor model covers compositions built from the metals in
+        :data:`~dnalang.catalysis.D_BAND_CENTRES` (or explicit energies)
+        and is reaction-agnostic: ``reaction`` is recorded with the grid
+        but does not change the scores.
+
+        Args:
+            reaction: Target chemical reaction (recorded only)
+            candidate_materials: List of material dicts
+            temperatures: Temperatures in Kelvin
+            pressures: Pressures in atm
+            workers: Processes for large grids (default:
+                ``config.sweep_workers``, then the CPU count)
+
+        Returns:
+            :class:`~dnalang.catalysis.CatalystGrid` whose ``scores`` array
+            has shape (materials, temperatures, pressures), in log10
+            turnover frequency
+
+        Raises:
+            ValidationError: For empty inputs, non-positive conditions or
+                materials the model cannot describe
+
+        Example:
+            >>> grid = client.materials.sweep_catalyst(
+            ...     "CO2 Reduction",
+            ...     materials,
+            ...     temperatures=range(300, 701, 10),
+            ...     pressures=[0.5, 1.0, 5.0, 10.0]
+            ... )
+            >>> grid.best()["material"]
+        """
+        return self.client.run_local(
+            self.model.sweep, reaction, candidate_materials, list(temperatures), list(pressures),
+            workers or self.client.config.sweep_workers
+        )
 
 
 class LogisticsClient:
@@ -163,19 +330,36 @@ class LogisticsClient:
         depot: Dict,
         delivery_locations: List[Dict],
         vehicles: List[Dict],
-        shots: int = 8192
+        shots: int = 8192,
+        wait: bool = True
     ) -> Dict[str, Any]:
         """
         Optimize delivery routes using quantum algorithms
 
+        With ``config.local_verticals`` (the default) blocking calls are
+        solved in-process (see :mod:`dnalang.routing`): a chunked
+        haversine distance matrix (memory-mapped for large inputs), a
+        grid-indexed nearest-neighbour construction, then vectorized
+        2-opt, 2-opt* and Or-opt rounds that respect vehicle ``capacity``
+        against each stop's ``demand`` (default 1), for up to
+        ``config.route_time_limit`` seconds.
+
         Args:
             depot: Distribution center location dict
             delivery_locations: List of delivery location dicts
             vehicles: List of vehicle dicts
             shots: Quantum shots
+            wait: Block for the full result (True) or return a Job handle
+                that streams partial results (False)
 
         Returns:
-            Optimized routes for all vehicles
+            Optimized routes for all vehicles; local results add a
+            ``search`` report with time to first feasible solution and
+            time to target quality
+
+        Raises:
+            ValidationError: If coordinates are missing or a delivery
+                fits no vehicle (local engine)
 
         Example:
             >>> depot = {"id": "depot", "lat": 40.7128, "lon": -74.0060}
@@ -190,12 +374,16 @@ class LogisticsClient:
             ...     depot, locations, vehicles
             ... )
         """
-        return self.client.request("POST", "/api/operations/execute", data={
-            "operation": "logistics_route_optimization",
-            "parameters": {
-                "depot": depot,
-                "delivery_locations": delivery_locations,
-                "vehicles": vehicles,
-                "shots": shots
-            }
-        })
+        config = self.client.config
+        if wait and config.local_verticals:
+            from .routing import optimize_routes
+            return self.client.run_local(
+                optimize_routes, depot, delivery_locations, vehicles, shots,
+                config.route_time_limit, config.route_workers
+            )
+        return _run(self.client, "logistics_route_optimization", {
+            "depot": depot,
+            "delivery_locations": delivery_locations,
+            "vehicles": vehicles,
+            "shots": shots
+        }, wait)
@@ -0,0 +1,692 @@
+"""DNALang Variational Quantum Eigensolver"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .batched import BatchedStatevectorSimulator, batch_chunks, pauli_masks
+from .exceptions import ValidationError
+from .parametric import ParametricCircuit, parametric_circuit
+from .sampling import SeedLike, make_rng
+from .statevector import Instruction
+
+# Parameter-shift rules, as (angle offset, weight) pairs. Gates whose
+# angle enters as exp(-i angle G) with two eigenvalues of G one apart
+# (Pauli rotations; phase gates, which differ by a global phase) need
+# two shifts; controlled rotations (eigenvalues 0, +-1/2) need four.
+_TWO_TERM = ((math.pi / 2, 0.5), (-math.pi / 2, -0.5))
+_D_PLUS = (math.sqrt(2) + 1) / (4 * math.sqrt(2))
+_D_MINUS = (math.sqrt(2) - 1) / (4 * math.sqrt(2))
+_FOUR_TERM = (
+    (math.pi / 2, _D_PLUS), (-math.pi / 2, -_D_PLUS),
+    (3 * math.pi / 2, -_D_MINUS), (-3 * math.pi / 2, _D_MINUS),
+)
+SHIFT_RULES = {
+    **{gate: _TWO_TERM for gate in ("rx", "ry", "rz", "p", "u1", "u2", "u3", "u", "cp", "cu1")},
+    **{gate: _FOUR_TERM for gate in ("crx", "cry", "crz")},
+}
+
+# Step for the central difference giving each gate angle's derivative
+# with respect to the circuit parameters (exact for affine angles)
+_JACOBIAN_STEP = 1e-6
+
+# Energy decrease an SPSA step must beat to count as progress; smaller
+# changes are rounding noise from a (near-)null gradient estimate
+_SPSA_PROGRESS = 1e-12
+
+
+class Hamiltonian:
+    """
+    Weighted sum of Pauli strings
+
+    Strings use the :func:`~dnalang.batched.pauli_masks` convention
+    (qubit 0 leftmost, optional leading sign). Repeated strings are
+    merged and the all-identity term is kept as ``constant``.
+
+    Args:
+        terms: ``(coefficient, pauli)`` pairs, or a ``{pauli: coefficient}``
+            dict
+
+    Raises:
+        ValidationError: For an empty Hamiltonian, strings of different
+            lengths or letters outside IXYZ
+
+    Example:
+        >>> h = Hamiltonian([(-1.0, "ZZ"), (0.5, "XI"), (0.5, "IX")])
+        >>> h.num_qubits, len(h)
+        (2, 3)
+    """
+
+    def __init__(self, terms: Union[Iterable[Tuple[float, str]], Dict[str, float]]):
+        if isinstance(terms, dict):
+            terms = [(coefficient, pauli) for pauli, coefficient in terms.items()]
+        merged: Dict[str, float] = {}
+        for coefficient, pauli in terms:
+            if not isinstance(pauli, str):
+                raise ValidationError(f"Pauli term must be a string, got {pauli!r}")
+            letters = pauli.lstrip("+-").upper()
+            sign = -1.0 if pauli.startswith("-") else 1.0
+            merged[letters] = merged.get(letters, 0.0) + sign * float(coefficient)
+        if not merged:
+            raise ValidationError("Hamiltonian needs at least one term")
+        widths = {len(letters) for letters in merged}
+        if len(widths) != 1:
+            raise ValidationError(f"Pauli strings must all have the same length, got {sorted(widths)}")
+        self.num_qubits = widths.pop()
+        identity = "I" * self.num_qubits
+        self.constant = merged.pop(identity, 0.0)
+        self.paulis = list(merged)
+        for pauli in self.paulis:
+            pauli_masks(pauli, self.num_qubits)
+        self.coefficients = np.array([merged[p] for p in self.paulis], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.paulis) + (self.constant != 0.0)
+
+    def expectation(self, sim: BatchedStatevectorSimulator) -> np.ndarray:
+        """(N,) energies of every row of a batched state"""
+        if not self.paulis:
+            return np.full(sim.batch_size, self.constant)
+        return sim.expectation(self.paulis) @ self.coefficients + self.constant
+
+    def matrix(self) -> np.ndarray:
+        """Dense (2**n, 2**n) matrix, for checking small systems"""
+        dim = 1 << self.num_qubits
+        index = np.arange(dim)
+        out = self.constant * np.eye(dim, dtype=np.complex128)
+        for pauli, coefficient in zip(self.paulis, self.coefficients):
+            x_mask, z_mask, sign = pauli_masks(pauli, self.num_qubits)
+            phase = 1j ** pauli.count("Y")
+            signs = 1.0 - 2.0 * (np.array([bin(i & z_mask).count("1") for i in index]) & 1)
+            out[index ^ x_mask, index] += sign * coefficient * phase * signs
+        return out
+
+
+def hardware_efficient_ansatz(
+    num_qubits: int,
+    layers: int = 2,
+    occupied: Sequence[int] = (),
+    rotations: Sequence[str] = ("ry",)
+) -> str:
+    """
+    QASM for a layered rotation + CZ-ladder ansatz
+
+    Every layer applies each gate in ``rotations`` to every qubit with
+    its own parameter (``t0``, ``t1``, ... in program order), then a CZ
+    ladder; a final rotation layer closes the circuit. CZ leaves basis
+    states unchanged, so at zero angles the circuit prepares exactly the
+    ``occupied`` reference, and RY-only layers give real amplitudes,
+    which suffice for molecular Hamiltonians.
+
+    Args:
+        num_qubits: Circuit width
+        layers: Entangling layers
+        occupied: Qubits flipped to 1 first, e.g. the occupied spin
+            orbitals of a Hartree-Fock reference
+        rotations: Parametrized single-qubit gates per layer
+
+    Returns:
+        OpenQASM 2 program with ``num_qubits * len(rotations) * (layers + 1)``
+        parameters
+    """
+    if num_qubits < 1 or layers < 0:
+        raise ValidationError("num_qubits must be positive and layers non-negative")
+    lines = ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{num_qubits}];"]
+    lines += [f"x q[{q}];" for q in occupied]
+    k = 0
+    for layer in range(layers + 1):
+        for q in range(num_qubits):
+            for gate in rotations:
+                lines.append(f"{gate}(t{k}) q[{q}];")
+                k += 1
+        if layer < layers:
+            lines += [f"cz q[{q}], q[{q + 1}];" for q in range(num_qubits - 1)]
+    return "\n".join(lines)
+
+
+def pauli_rotation(pauli: str, angle: str) -> List[str]:
+    """
+    QASM statements for ``exp(-i * angle / 2 * P)``
+
+    Basis changes map every X and Y of the Pauli string (qubit 0
+    leftmost) to Z, a CX ladder gathers the parity onto the last
+    non-identity qubit for one ``rz(angle)``, and the ladder and basis
+    changes are then undone.
+
+    Args:
+        pauli: Pauli string, at least one letter not I
+        angle: QASM angle expression, e.g. a parameter name
+    """
+    support = [q for q, letter in enumerate(pauli.upper()) if letter != "I"]
+    if not support or set(pauli.upper()) - set("IXYZ"):
+        raise ValidationError(f"Rotation needs a non-identity Pauli string from IXYZ, got {pauli!r}")
+    into = {"X": "h q[{}];", "Y": "rx(pi/2) q[{}];"}
+    back = {"X": "h q[{}];", "Y": "rx(-pi/2) q[{}];"}
+    letters = pauli.upper()
+    lines = [into[letters[q]].format(q) for q in support if letters[q] in into]
+    ladder = [f"cx q[{a}], q[{b}];" for a, b in zip(support, support[1:])]
+    lines += ladder + [f"rz({angle}) q[{support[-1]}];"] + ladder[::-1]
+    lines += [back[letters[q]].format(q) for q in support if letters[q] in back]
+    return lines
+
+
+def excitation_ansatz(num_qubits: int, generators: Sequence[str], occupied: Sequence[int] = ()) -> str:
+    """
+    QASM for a product of Pauli-string rotations on a reference state
+
+    The qubit coupled-cluster form used for molecules: ``occupied``
+    qubits are flipped (the Hartree-Fock reference) and each generator
+    ``P_k`` then applies ``exp(-i t_k / 2 * P_k)`` with its own
+    parameter ``t_k``. Zero parameters give the reference exactly.
+
+    Args:
+        num_qubits: Circuit width
+        generators: Pauli strings (qubit 0 leftmost), e.g. ``"XXXY"``
+            for the double excitation of H2
+        occupied: Qubits set to 1 first
+
+    Returns:
+        OpenQASM 2 program with ``len(generators)`` parameters
+    """
+    lines = ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{num_qubits}];"]
+    lines += [f"x q[{q}];" for q in occupied]
+    for k, pauli in enumerate(generators):
+        if len(pauli) != num_qubits:
+            raise ValidationError(f"Generator {pauli!r} must have {num_qubits} letters")
+        lines += pauli_rotation(pauli, f"t{k}")
+    return "\n".join(lines)
+
+
+class VQE:
+    """
+    Variational quantum eigensolver on the batched statevector
+
+    Every objective evaluation is a batch: :meth:`energies` binds an
+    (M, P) parameter matrix in one pass, and :meth:`energy_and_gradient`
+    evaluates the circuit and all of its parameter-shifted copies (2 per
+    parametrized Pauli-rotation angle, so 2P for the usual one-gate-per-
+    parameter ansatz; 4 per controlled rotation) as a single batch. Parameters that feed several
+    gates, or enter through expressions such as ``2*theta``, get one
+    shift pair per occurrence, combined by the chain rule.
+
+    Args:
+        hamiltonian: :class:`Hamiltonian` or its terms
+        ansatz: :class:`~dnalang.parametric.ParametricCircuit` or QASM
+            source with free parameters
+        optimizer: Name in ``OPTIMIZERS`` or an :class:`Optimizer`
+        parameter_names: Parameter order when ``ansatz`` is QASM
+            (default: order of first use)
+
+    Raises:
+        ValidationError: If the ansatz and Hamiltonian widths differ
+
+    Example:
+        >>> h = Hamiltonian([(-1.0, "ZZ"), (-0.5, "XI"), (-0.5, "IX")])
+        >>> vqe = VQE(h, hardware_efficient_ansatz(2, layers=1), optimizer="lbfgs")
+        >>> result = vqe.run(seed=1)
+        >>> round(result.energy, 4), result.converged
+        (-1.4142, True)
+    """
+
+    def __init__(
+        self,
+        hamiltonian: Union[Hamiltonian, Iterable[Tuple[float, str]], Dict[str, float]],
+        ansatz: Union[ParametricCircuit, str],
+        optimizer: Union[str, "Optimizer"] = "lbfgs",
+        parameter_names: Optional[Sequence[str]] = None
+    ):
+        if not isinstance(hamiltonian, Hamiltonian):
+            hamiltonian = Hamiltonian(hamiltonian)
+        if isinstance(ansatz, str):
+            ansatz = parametric_circuit(ansatz, tuple(parameter_names) if parameter_names is not None else None)
+        if ansatz.num_qubits != hamiltonian.num_qubits:
+            raise ValidationError(
+                f"Ansatz has {ansatz.num_qubits} qubits but the Hamiltonian acts on {hamiltonian.num_qubits}"
+            )
+        self.hamiltonian = hamiltonian
+        self.ansatz = ansatz
+        self.optimizer = make_optimizer(optimizer)
+        # Circuits simulated so far (one per batch row)
+        self.evaluations = 0
+
+    @property
+    def num_parameters(self) -> int:
+        return len(self.ansatz.parameters)
+
+    def _simulate(self, instructions: List[Instruction], rows: int) -> np.ndarray:
+        """Energies of a batch of ``rows`` bound circuits"""
+        n = self.ansatz.num_qubits
+        out = np.empty(rows, dtype=np.float64)
+        for chunk in batch_chunks(rows, n):
+            block = instructions if chunk.stop - chunk.start == rows else [
+                (name, qubits, tuple(p[chunk] if np.ndim(p) else p for p in params))
+                for name, qubits, params in instructions
+            ]
+            sim = BatchedStatevectorSimulator(n, chunk.stop - chunk.start).run(block)
+            out[chunk] = self.hamiltonian.expectation(sim)
+        self.evaluations += rows
+        return out
+
+    def _check_parameters(self, theta: np.ndarray) -> np.ndarray:
+        theta = np.asarray(theta, dtype=np.float64)
+        if theta.shape[-1:] != (self.num_parameters,):
+            raise ValidationError(f"Expected {self.num_parameters} parameters, got shape {theta.shape}")
+        return theta
+
+    def energies(self, thetas: np.ndarray) -> np.ndarray:
+        """
+        Energies of many parameter vectors in one batch
+
+        Args:
+            thetas: (M, P) parameter matrix
+
+        Returns:
+            (M,) energies
+        """
+        thetas = np.atleast_2d(self._check_parameters(thetas))
+        return self._simulate(self.ansatz.bind(thetas), len(thetas))
+
+    def energy(self, theta: np.ndarray) -> float:
+        return float(self.energies(theta)[0])
+
+    def energy_and_gradient(self, theta: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Exact energy and parameter-shift gradient at one point
+
+        Returns:
+            ``(energy, gradient)`` with gradient of shape (P,)
+
+        Raises:
+            ValidationError: If a parameter feeds a gate without a
+                parameter-shift rule (see ``SHIFT_RULES``)
+        """
+        theta = self._check_parameters(theta)
+        p = self.num_parameters
+        step = _JACOBIAN_STEP * np.eye(p)
+        # Row 0 binds theta itself, rows 1..2P its +-step probes
+        instructions = self.ansatz.bind(np.vstack([theta, theta + step, theta - step]))
+
+        shifts: List[Tuple[int, int, float]] = []
+        weights: List[float] = []
+        jacobian: List[np.ndarray] = []
+        for i, (name, _, params) in enumerate(instructions):
+            for a, angle in enumerate(params):
+                if not np.ndim(angle):
+                    continue
+                slope = (angle[1:p + 1] - angle[p + 1:]) / (2 * _JACOBIAN_STEP)
+                if not np.any(np.abs(slope) > 1e-9):
+                    continue
+                if name not in SHIFT_RULES:
+                    raise ValidationError(f"Gate {name!r} has no parameter-shift rule")
+                for offset, weight in SHIFT_RULES[name]:
+                    shifts.append((i, a, offset))
+                    weights.append(weight)
+                    jacobian.append(slope)
+
+        rows = 1 + len(shifts)
+        batch = [
+            (name, qubits, tuple(np.full(rows, angle[0]) if np.ndim(angle) else angle for angle in params))
+            for name, qubits, params in instructions
+        ]
+        for row, (i, a, offset) in enumerate(shifts, start=1):
+            batch[i][2][a][row] += offset
+        energies = self._simulate(batch, rows)
+        if not shifts:
+            return float(energies[0]), np.zeros(p)
+        gradient = (np.asarray(weights) * energies[1:]) @ np.asarray(jacobian)
+        return float(energies[0]), gradient
+
+    def run(
+        self,
+        initial: Optional[np.ndarray] = None,
+        max_iterations: int = 200,
+        tol: float = 1e-8,
+        gtol: float = 1e-5,
+        seed: SeedLike = None,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> "VQEResult":
+        """
+        Minimise the energy
+
+        Stops once an iteration changes the energy by less than ``tol``
+        or the gradient norm drops below ``gtol``. The result is the
+        lower-energy of the final parameters and the best point examined
+        along the way.
+
+        Args:
+            initial: Starting parameters (default: small random angles)
+            max_iterations: Optimizer steps
+            tol: Energy-change tolerance
+            gtol: Gradient-norm tolerance (gradient-based optimizers)
+            seed: Seed for the initial point and stochastic optimizers
+            callback: Called with each iteration's history entry
+
+        Returns:
+            :class:`VQEResult` with the per-iteration history and timings
+        """
+        rng = make_rng(seed)
+        if initial is None:
+            theta = rng.normal(0.0, 0.1, self.num_parameters)
+        else:
+            theta = self._check_parameters(initial).copy()
+        self.optimizer.reset(self.num_parameters, rng)
+
+        history: List[Dict[str, Any]] = []
+        converged = False
+        start = time.perf_counter()
+        previous = math.inf
+        best = (math.inf, theta)
+        for iteration in range(max_iterations):
+            tick, circuits = time.perf_counter(), self.evaluations
+            current = theta
+            theta, energy, gradient_norm = self.optimizer.step(self, theta)
+            entry = {
+                "iteration": iteration,
+                "energy": energy,
+                "gradient_norm": gradient_norm,
+                "circuits": self.evaluations - circuits,
+                "time": time.perf_counter() - tick,
+                "rejected": self.optimizer.rejected
+            }
+            history.append(entry)
+            if callback is not None:
+                callback(entry)
+            if self.optimizer.rejected:
+                continue
+            if energy < best[0]:
+                best = (energy, current)
+            if abs(previous - energy) < tol or (gradient_norm is not None and gradient_norm < gtol):
+                converged = True
+                break
+            previous = energy
+
+        energy = self.energy(theta)
+        if best[0] < energy:
+            energy, theta = best
+        return VQEResult(
+            energy=energy,
+            parameters=theta,
+            iterations=len(history),
+            converged=converged,
+            history=history,
+            stats={
+                "optimizer": self.optimizer.name,
+                "num_qubits": self.ansatz.num_qubits,
+                "num_parameters": self.num_parameters,
+                "num_terms": len(self.hamiltonian),
+                "circuits": self.evaluations,
+                "total_time": time.perf_counter() - start
+            }
+        )
+
+
+@dataclass(frozen=True)
+class VQEResult:
+    """
+    Outcome of :meth:`VQE.run`
+
+    ``history`` holds one entry per iteration: the energy and gradient
+    norm at the point examined, the circuits simulated, the wall time and
+    whether the optimizer rejected its trial point.
+    """
+
+    energy: float
+    parameters: np.ndarray
+    iterations: int
+    converged: bool
+    history: List[Dict[str, Any]] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def energies(self) -> np.ndarray:
+        return np.array([entry["energy"] for entry in self.history])
+
+    @property
+    def timings(self) -> np.ndarray:
+        """Per-iteration wall time in seconds"""
+        return np.array([entry["time"] for entry in self.history])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "energy": self.energy,
+            "parameters": self.parameters.tolist(),
+            "iterations": self.iterations,
+            "converged": self.converged,
+            "history": self.history,
+            **self.stats
+        }
+
+
+class Optimizer:
+    """
+    Base class for VQE optimizers
+
+    :meth:`step` takes the current parameters and returns the next ones
+    together with the energy and gradient norm (``None`` when not
+    computed) at the current point. State carried between steps is
+    cleared by :meth:`reset` at the start of every run. A step that
+    discards its trial point sets :attr:`rejected`, and the run does not
+    test convergence on it.
+    """
+
+    name = "optimizer"
+    rejected = False
+
+    def reset(self, num_parameters: int, rng: np.random.Generator) -> None:
+        self.rng = rng
+        self.rejected = False
+
+    def step(self, vqe: VQE, theta: np.ndarray) -> Tuple[np.ndarray, float, Optional[float]]:
+        raise NotImplementedError
+
+
+class SPSA(Optimizer):
+    """
+    Simultaneous perturbation stochastic approximation
+
+    Estimates the gradient from energy differences along ``resamplings``
+    random +-1 directions, so a step costs ``1 + 2 * resamplings``
+    circuits (the current point and the probes, in one batch) whatever
+    the parameter count. Without a ``learning_rate`` the step-size scale
+    is calibrated on the first step, from ``calibration`` extra probe
+    pairs, so the first update moves parameters by about
+    ``target_step``. With ``blocking``, a step that did not lower the
+    energy (seen when the next step evaluates its point) is rejected: the
+    gradient is re-estimated at the previous point along a fresh probe
+    direction (``2 * resamplings`` more circuits) and the step retried
+    with the next, smaller gain; the simulator's energies are exact, so
+    any increase is real.
+
+    Args:
+        learning_rate: Step-size scale ``a`` (default: calibrated)
+        perturbation: Probe-size scale ``c``
+        alpha: Step-size decay exponent
+        gamma: Probe-size decay exponent
+        stability: Offset ``A`` in the step-size schedule ``a / (k + 1 + A)**alpha``
+        resamplings: Probe directions averaged per step
+        calibration: Probe pairs used to calibrate ``a``
+        target_step: First-step parameter change sought by calibration
+        blocking: Reject steps that do not lower the energy
+    """
+
+    name = "spsa"
+
+    def __init__(
+        self,
+        learning_rate: Optional[float] = None,
+        perturbation: float = 0.1,
+        alpha: float = 0.602,
+        gamma: float = 0.101,
+        stability: float = 10.0,
+        resamplings: int = 1,
+        calibration: int = 10,
+        target_step: float = 0.5,
+        blocking: bool = True
+    ):
+        self.learning_rate = learning_rate
+        self.perturbation = perturbation
+        self.alpha = alpha
+        self.gamma = gamma
+        self.stability = stability
+        self.resamplings = resamplings
+        self.calibration = calibration
+        self.target_step = target_step
+        self.blocking = blocking
+
+    def reset(self, num_parameters: int, rng: np.random.Generator) -> None:
+        super().reset(num_parameters, rng)
+        self.k = 0
+        self.a = self.learning_rate
+        # Last accepted point and its energy
+        self.accepted: Optional[Tuple[np.ndarray, float]] = None
+
+    def step(self, vqe: VQE, theta: np.ndarray) -> Tuple[np.ndarray, float, Optional[float]]:
+        c = self.perturbation / (self.k + 1) ** self.gamma
+        probes = self.resamplings if self.a is not None else max(self.resamplings, self.calibration)
+        deltas = self.rng.choice((-1.0, 1.0), size=(probes, len(theta)))
+        energies = vqe.energies(np.vstack([theta, theta + c * deltas, theta - c * deltas]))
+        energy = float(energies[0])
+        self.rejected = self.blocking and self.accepted is not None and energy > self.accepted[1] - _SPSA_PROGRESS
+        if self.rejected:
+            # Back to the last accepted point, probed along a new direction
+            theta, energy = self.accepted
+            deltas = self.rng.choice((-1.0, 1.0), size=(probes, len(theta)))
+            probe_energies = vqe.energies(np.vstack([theta + c * deltas, theta - c * deltas]))
+        else:
+            probe_energies = energies[1:]
+            self.accepted = (theta, energy)
+        differences = (probe_energies[:probes] - probe_energies[probes:]) / (2 * c)
+        if self.a is None:
+            magnitude = float(np.abs(differences).mean()) or 1.0
+            self.a = self.target_step * (1 + self.stability) ** self.alpha / magnitude
+        gradient = (differences[:self.resamplings, None] * deltas[:self.resamplings]).mean(axis=0)
+        a = self.a / (self.k + 1 + self.stability) ** self.alpha
+        self.k += 1
+        return theta - a * gradient, energy, None
+
+
+class Adam(Optimizer):
+    """
+    Adam on exact parameter-shift gradients
+
+    Args:
+        learning_rate: Step size
+        beta1: First-moment decay
+        beta2: Second-moment decay
+        epsilon: Denominator floor
+    """
+
+    name = "adam"
+
+    def __init__(self, learning_rate: float = 0.05, beta1: float = 0.9, beta2: float = 0.999, epsilon: float = 1e-8):
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def reset(self, num_parameters: int, rng: np.random.Generator) -> None:
+        super().reset(num_parameters, rng)
+        self.m = np.zeros(num_parameters)
+        self.v = np.zeros(num_parameters)
+        self.t = 0
+
+    def step(self, vqe: VQE, theta: np.ndarray) -> Tuple[np.ndarray, float, Optional[float]]:
+        energy, gradient = vqe.energy_and_gradient(theta)
+        self.t += 1
+        self.m = self.beta1 * self.m + (1 - self.beta1) * gradient
+        self.v = self.beta2 * self.v + (1 - self.beta2) * gradient ** 2
+        m_hat = self.m / (1 - self.beta1 ** self.t)
+        v_hat = self.v / (1 - self.beta2 ** self.t)
+        step = self.learning_rate * m_hat / (np.sqrt(v_hat) + self.epsilon)
+        return theta - step, energy, float(np.linalg.norm(gradient))
+
+
+class LBFGS(Optimizer):
+    """
+    Limited-memory BFGS with a batched backtracking line search
+
+    The quasi-Newton direction comes from the last ``memory`` curvature
+    pairs. All ``line_search`` trial step lengths (1, 1/2, 1/4, ...) are
+    evaluated in one batch, and the longest one meeting the Armijo
+    condition is taken; if none does, the curvature history is dropped
+    and the search repeated along the steepest descent. The gradient at
+    the new point is reused by the next step.
+
+    Args:
+        memory: Curvature pairs kept
+        line_search: Trial step lengths per iteration
+        armijo: Sufficient-decrease constant
+    """
+
+    name = "lbfgs"
+
+    def __init__(self, memory: int = 10, line_search: int = 6, armijo: float = 1e-4):
+        self.memory = memory
+        self.steps = 0.5 ** np.arange(line_search)
+        self.armijo = armijo
+
+    def reset(self, num_parameters: int, rng: np.random.Generator) -> None:
+        super().reset(num_parameters, rng)
+        self.pairs: List[Tuple[np.ndarray, np.ndarray, float]] = []
+        self.cached: Optional[Tuple[np.ndarray, float, np.ndarray]] = None
+
+    def _direction(self, gradient: np.ndarray) -> np.ndarray:
+        """Two-loop recursion for -H*g"""
+        q = gradient.copy()
+        alphas = []
+        for s, y, rho in reversed(self.pairs):
+            alpha = rho * (s @ q)
+            q -= alpha * y
+            alphas.append(alpha)
+        if self.pairs:
+            s, y, _ = self.pairs[-1]
+            q *= (s @ y) / (y @ y)
+        else:
+            q /= max(1.0, float(np.linalg.norm(gradient)))
+        for (s, y, rho), alpha in zip(self.pairs, reversed(alphas)):
+            q += (alpha - rho * (y @ q)) * s
+        return -q
+
+    def step(self, vqe: VQE, theta: np.ndarray) -> Tuple[np.ndarray, float, Optional[float]]:
+        if self.cached is not None and np.array_equal(self.cached[0], theta):
+            _, energy, gradient = self.cached
+        else:
+            energy, gradient = vqe.energy_and_gradient(theta)
+        while True:
+            direction = self._direction(gradient)
+            slope = float(gradient @ direction)
+            if slope < 0:
+                trials = vqe.energies(theta + self.steps[:, None] * direction)
+                accepted = np.nonzero(trials <= energy + self.armijo * self.steps * slope)[0]
+                if len(accepted):
+                    break
+            if not self.pairs:
+                # Even steepest descent makes no progress: stay put
+                self.cached = (theta, energy, gradient)
+                return theta, energy, float(np.linalg.norm(gradient))
+            # Stale curvature: retry along the steepest descent
+            self.pairs.clear()
+
+        theta_next = theta + self.steps[accepted[0]] * direction
+        energy_next, gradient_next = vqe.energy_and_gradient(theta_next)
+        s, y = theta_next - theta, gradient_next - gradient
+        if s @ y > 1e-12:
+            self.pairs.append((s, y, 1.0 / (s @ y)))
+            del self.pairs[:-self.memory]
+        self.cached = (theta_next, energy_next, gradient_next)
+        return theta_next, energy, float(np.linalg.norm(gradient))
+
+
+OPTIMIZERS = {"spsa": SPSA, "adam": Adam, "lbfgs": LBFGS}
+
+
+def make_optimizer(optimizer: Union[str, Optimizer]) -> Optimizer:
+    """Optimizer instance from a name in ``OPTIMIZERS`` (default settings) or an instance"""
+    if isinstance(optimizer, Optimizer):
+        return optimizer
+    if optimizer not in OPTIMIZERS:
+        raise ValidationError(f"Unknown optimizer {optimizer!r}; expected one of {sorted(OPTIMIZERS)}")
+    return OPTIMIZERS[optimizer]()
@@ -0,0 +1,72 @@
+// Content-addressed store for custom QASM circuits
+//
+// Clients send a circuit's full text once (with its SHA-256 as circuit_hash);
+// later executions reference it by hash alone. Entries live in a bounded
+// LRU, so a client must be ready to resend the body on an unknown hash.
+
+import { createHash } from "crypto"
+
+const MAX_CIRCUITS = 1024
+
+export type StoredCircuit = {
+  hash: string
+  qasm: string
+  registeredAt: string
+}
+
+export class CircuitNotFoundError extends Error {
+  readonly circuitHash: string
+
+  constructor(circuitHash: string) {
+    super(`Unknown circuit ${circuitHash}; resend the QASM body`)
+    this.name = "CircuitNotFoundError"
+    this.circuitHash = circuitHash
+  }
+}
+
+// Map iteration order is insertion order, so re-inserting on access keeps
+// the least recently used circuit first
+const circuits = new Map<string, StoredCircuit>()
+
+export function hashCircuit(qasm: string): string {
+  return createHash("sha256").update(qasm, "utf8").digest("hex")
+}
+
+export function registerCircuit(qasm: string, circuitHash?: string): StoredCircuit {
+  const hash = hashCircuit(qasm)
+  if (circuitHash && circuitHash !== hash) {
+    throw new Error("circuit_hash does not match the QASM content")
+  }
+
+  const stored = circuits.get(hash) ?? { hash, qasm, registeredAt: new Date().toISOString() }
+  circuits.delete(hash)
+  circuits.set(hash, stored)
+
+  while (circuits.size > MAX_CIRCUITS) {
+    circuits.delete(circuits.keys().next().value as string)
+  }
+  return stored
+}
+
+export function lookupCircuit(circuitHash: string): StoredCircuit {
+  const stored = circuits.get(circuitHash)
+  if (!stored) {
+    throw new CircuitNotFoundError(circuitHash)
+  }
+  circuits.delete(circuitHash)
+  circuits.set(circuitHash, stored)
+  return stored
+}
+
+// Fill in `qasm` from the registry (or register a newly sent body) so the
+// executor always sees the program text
+export function resolveCircuit(parameters: any): any {
+  if (typeof parameters?.qasm === "string") {
+    const stored = registerCircuit(parameters.qasm, parameters.circuit_hash)
+    return { ...parameters, circuit_hash: stored.hash }
+  }
+  if (typeof parameters?.circuit_hash === "string") {
+    return { ...parameters, qasm: lookupCircuit(parameters.circuit_hash).qasm }
+  }
+  return parameters
+}
@@ -0,0 +1,158 @@
+// In-memory job runner for long-running operations
+//
+// A submitted job runs in the background and records partial results as
+// they are produced. Clients either poll with an offset or follow the
+// NDJSON stream; both can resume from the last index they saw.
+
+import { executeQuantumOperation } from "@/lib/quantum/operations"
+
+const MAX_JOBS = 100
+
+// Operations whose work splits into per-item partial results, and the
+// parameter holding the items
+const STREAMED_ITEMS: Record<string, string> = {
+  finance_optimize_portfolio: "assets",
+  pharma_drug_docking: "drug_candidates",
+  materials_catalyst_design: "candidate_materials",
+  logistics_route_optimization: "delivery_locations",
+}
+
+export type JobStatus = "queued" | "running" | "completed" | "failed" | "cancelled"
+
+export type JobEvent =
+  | { type: "partial"; index: number; data: any }
+  | { type: "result"; result: any }
+  | { type: "error"; error: string; status: JobStatus }
+
+type Job = {
+  id: string
+  operation: string
+  parameters: any
+  status: JobStatus
+  created_at: string
+  completed_at: string | null
+  partials: JobEvent[]
+  result: any
+  error: string | null
+  waiters: Set<() => void>
+}
+
+const jobs = new Map<string, Job>()
+
+function notify(job: Job) {
+  for (const wake of job.waiters) wake()
+  job.waiters.clear()
+}
+
+function finished(job: Job) {
+  return job.status === "completed" || job.status === "failed" || job.status === "cancelled"
+}
+
+function evict() {
+  for (const [id, job] of jobs) {
+    if (jobs.size <= MAX_JOBS) break
+    if (finished(job)) jobs.delete(id)
+  }
+}
+
+// Simulated per-item scoring; yields to the event loop between items so
+// readers see results arrive incrementally
+async function runJob(job: Job) {
+  job.status = "running"
+  try {
+    const items = job.parameters?.[STREAMED_ITEMS[job.operation]] ?? []
+    for (let index = 0; index < items.length; index++) {
+      if (finished(job)) return // cancelled
+      await new Promise((resolve) => setTimeout(resolve, 5))
+      job.partials.push({
+        type: "partial",
+        index,
+        data: { item: items[index], score: Math.random() },
+      })
+      notify(job)
+    }
+    const result = await executeQuantumOperation(job.operation, job.parameters)
+    if (finished(job)) return // cancelled
+    job.result = result
+    job.status = "completed"
+  } catch (error) {
+    job.error = error instanceof Error ? error.message : "Unknown error"
+    job.status = "failed"
+  } finally {
+    job.completed_at = job.completed_at ?? new Date().toISOString()
+    notify(job)
+  }
+}
+
+export function submitJob(operation: string, parameters: any) {
+  const job: Job = {
+    id: `job_${Date.now()}_${Math.random().toString(36).slice(2, 8)}`,
+    operation,
+    parameters,
+    status: "queued",
+    created_at: new Date().toISOString(),
+    completed_at: null,
+    partials: [],
+    result: null,
+    error: null,
+    waiters: new Set(),
+  }
+  jobs.set(job.id, job)
+  evict()
+  void runJob(job)
+  return jobSummary(job)
+}
+
+export function getJob(id: string) {
+  return jobs.get(id)
+}
+
+export function cancelJob(id: string) {
+  const job = jobs.get(id)
+  if (job && !finished(job)) {
+    job.status = "cancelled"
+    job.completed_at = new Date().toISOString()
+    notify(job)
+  }
+  return job
+}
+
+export function jobSummary(job: Job) {
+  return {
+    id: job.id,
+    operation: job.operation,
+    status: job.status,
+    partial_results: job.partials.length,
+    created_at: job.created_at,
+    completed_at: job.completed_at,
+  }
+}
+
+export function jobPage(job: Job, offset: number, limit: number) {
+  const results = job.partials.slice(offset, offset + limit)
+  return {
+    job: jobSummary(job),
+    results,
+    next_offset: offset + results.length,
+    result: job.status === "completed" ? job.result : null,
+    error: job.error,
+  }
+}
+
+// Partial results from `offset` onwards as they are produced, then the
+// final result (or error) once the job finishes
+export async function* jobEvents(job: Job, offset: number): AsyncGenerator<JobEvent> {
+  let next = offset
+  while (true) {
+    while (next < job.partials.length) {
+      yield job.partials[next++]
+    }
+    if (finished(job)) break
+    await new Promise<void>((resolve) => job.waiters.add(resolve))
+  }
+  if (job.status === "completed") {
+    yield { type: "result", result: job.result }
+  } else {
+    yield { type: "error", error: job.error ?? `Job ${job.status}`, status: job.status }
+  }
+}
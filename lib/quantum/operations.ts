@@ -0,0 +1,129 @@
+// Simulated quantum operation execution shared by the execute routes
+
+import { resolveCircuit } from "@/lib/quantum/circuit-registry"
+
+export async function executeQuantumOperation(operation: string, parameters: any) {
+  if (operation === "custom") {
+    parameters = resolveCircuit(parameters)
+  }
+
+  // Simulate operation execution with realistic results
+  const baseResult = {
+    operation,
+    timestamp: new Date().toISOString(),
+    backend: parameters?.backend || "ibm_brisbane",
+    shots: parameters?.shots || 2048,
+    execution_time: Math.random() * 2 + 0.5,
+  }
+
+  switch (operation) {
+    case "coherence":
+      return {
+        ...baseResult,
+        result: {
+          fidelity: 0.95 + Math.random() * 0.04,
+          coherence: 0.98 + Math.random() * 0.02,
+          bell_violation: 2.7 + Math.random() * 0.1,
+          counts: {
+            "00": Math.floor(parameters.shots * 0.48),
+            "11": Math.floor(parameters.shots * 0.48),
+            "01": Math.floor(parameters.shots * 0.02),
+            "10": Math.floor(parameters.shots * 0.02),
+          },
+        },
+      }
+
+    case "wflow":
+      return {
+        ...baseResult,
+        result: {
+          wgf_cost: 0.15 + Math.random() * 0.1,
+          fidelity_cost: 0.85 + Math.random() * 0.1,
+          gradient_variance: 0.02 + Math.random() * 0.01,
+          convergence_rate: 0.92 + Math.random() * 0.05,
+        },
+      }
+
+    case "disentangle":
+      return {
+        ...baseResult,
+        result: {
+          separability: 0.88 + Math.random() * 0.1,
+          mutual_information: 0.12 + Math.random() * 0.05,
+          feature_clusters: 4,
+          monosemantic_score: 0.91 + Math.random() * 0.08,
+        },
+      }
+
+    case "finance_optimize_portfolio":
+      return {
+        ...baseResult,
+        result: {
+          optimal_allocation: parameters.assets.map((asset: any, i: number) => ({
+            symbol: asset.symbol,
+            allocation: Math.random() * 0.3,
+          })),
+          expected_return: 0.12 + Math.random() * 0.03,
+          sharpe_ratio: 1.5 + Math.random() * 0.5,
+          risk: 0.15 + Math.random() * 0.05,
+        },
+      }
+
+    case "pharma_drug_docking": {
+      // `index` is the candidate's position in the request, so clients can
+      // match scores back to sharded input
+      const ranked = (parameters.drug_candidates ?? [])
+        .map((candidate: any, index: number) => ({
+          index,
+          name: candidate?.name,
+          binding_affinity: -(6 + Math.random() * 6),
+          score: Math.random(),
+        }))
+        .sort((a: any, b: any) => b.score - a.score)
+      return {
+        ...baseResult,
+        result: {
+          ranked_candidates: ranked,
+          best_candidate: ranked[0] ?? null,
+        },
+      }
+    }
+
+    case "materials_catalyst_design": {
+      const ranked = (parameters.candidate_materials ?? [])
+        .map((material: any, index: number) => ({
+          index,
+          name: material?.name,
+          composition: material?.composition,
+          score: Math.random() * 8,
+        }))
+        .sort((a: any, b: any) => b.score - a.score)
+      return {
+        ...baseResult,
+        result: {
+          ranked_materials: ranked,
+          best_material: ranked[0] ?? null,
+        },
+      }
+    }
+
+    case "custom":
+      return {
+        ...baseResult,
+        circuit_hash: parameters.circuit_hash,
+        result: {
+          status: "completed",
+          message: `Circuit ${parameters.circuit_hash.slice(0, 12)} executed successfully`,
+        },
+      }
+
+    default:
+      return {
+        ...baseResult,
+        result: {
+          status: "completed",
+          message: `Operation ${operation} executed successfully`,
+        },
+      }
+  }
+}
@@ -0,0 +1 @@
+"""DNALang SDKs"""
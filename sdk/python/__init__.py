@@ -0,0 +1,5 @@
+"""DNALang Python SDK"""
+
+from .realtime_client import RealtimeClient, DROP_POLICIES
+
+__all__ = ["RealtimeClient", "DROP_POLICIES"]
@@ -0,0 +1,325 @@
+"""
+DNALang Realtime Client
+
+Streams agent telemetry to the realtime dashboard over a WebSocket
+without ever stalling the caller: ``send_*`` only enqueue, and a
+background task ships the queue in micro-batches.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Dict, Any, Deque, Hashable, List, Optional, Tuple
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class RealtimeClient:
+    """
+    Batched, backpressured telemetry transport
+
+    Messages go into a bounded queue and are sent as one
+    ``{"type": "batch", "messages": [...]}`` frame once ``batch_size``
+    are waiting or the oldest has waited ``flush_interval`` seconds.
+    Only the latest ``agent_status`` per agent is kept while queued.
+    When the dashboard falls behind and the queue is full,
+    ``drop_policy`` decides: ``"drop_oldest"`` (default) evicts the
+    oldest message, ``"drop_newest"`` discards the new one, ``"block"``
+    waits for room (the only policy that can slow the caller). Lost
+    connections are retried in the background with exponential backoff.
+
+    Args:
+        url: Dashboard WebSocket URL
+        max_queue: Messages held before the drop policy applies
+        batch_size: Messages per frame
+        flush_interval: Longest a message waits for a batch to fill
+        drop_policy: One of ``DROP_POLICIES``
+        reconnect_delay: First reconnect backoff (doubles, max 30 s)
+        connect_timeout: Seconds :meth:`connect` waits for the first
+            connection before carrying on in the background
+
+    Example:
+        >>> client = RealtimeClient("ws://localhost:8000/realtime")
+        >>> await client.connect()
+        >>> await client.send_telemetry({"cpu_usage": 42.0}, source="monitor")
+        >>> await client.disconnect()
+        >>> client.stats["sent"]
+        1
+    """
+
+    def __init__(
+        self,
+        url: str = "ws://localhost:8000/realtime",
+        max_queue: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 0.1,
+        drop_policy: str = "drop_oldest",
+        reconnect_delay: float = 0.5,
+        connect_timeout: float = 2.0
+    ):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}, got {drop_policy!r}")
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be at least 1")
+        self.url = url
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+        self.reconnect_delay = reconnect_delay
+        self.connect_timeout = connect_timeout
+
+        # Queue of keys; coalescable messages share a key and are stored
+        # once in _latest, so a newer status replaces a queued one in place
+        self._queue: Deque[Tuple[Hashable, float]] = deque()
+        self._latest: Dict[Hashable, Dict[str, Any]] = {}
+        self._sequence = 0
+        self._ws = None
+        self._sender: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._room: Optional[asyncio.Event] = None
+        self._connected: Optional[asyncio.Event] = None
+        # Set only by disconnect(); the reconnect backoff waits on it so
+        # that queued messages cannot cut the delay short
+        self._stop: Optional[asyncio.Event] = None
+        self._closing = False
+        self.stats = {
+            "accepted": 0, "sent": 0, "batches": 0, "coalesced": 0,
+            "dropped": 0, "reconnects": 0, "errors": 0
+        }
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None
+
+    @property
+    def pending(self) -> int:
+        """Messages waiting to be sent"""
+        return len(self._queue)
+
+    async def connect(self) -> bool:
+        """
+        Start the sender and wait briefly for the dashboard
+
+        Returns:
+            Whether the connection is up; if not, messages queue (under
+            the drop policy) while the sender keeps retrying
+
+        Raises:
+            RuntimeError: If the ``websockets`` package is not installed
+        """
+        if websockets is None:
+            raise RuntimeError(
+                "RealtimeClient requires websockets. Install it with: pip install websockets"
+            )
+        if self._sender is None or self._sender.done():
+            self._closing = False
+            self._wakeup = asyncio.Event()
+            self._room = asyncio.Event()
+            self._connected = asyncio.Event()
+            self._stop = asyncio.Event()
+            self._sender = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._connected.wait(), self.connect_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Realtime dashboard at %s not reachable yet; retrying in background", self.url)
+        return self.connected
+
+    async def disconnect(self, timeout: float = 2.0) -> None:
+        """Flush what can be sent within ``timeout`` seconds, then close"""
+        if self._sender is None:
+            return
+        self._closing = True
+        self._stop.set()
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._sender), timeout)
+        except asyncio.TimeoutError:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+        self.stats["dropped"] += len(self._queue)
+        self._queue.clear()
+        self._latest.clear()
+        self._sender = None
+
+    async def send_agent_status(
+        self,
+        agent_id: str,
+        agent_type: str,
+        status: str,
+        current_task: Optional[str] = None,
+        metrics: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Queue an agent status; replaces the agent's still-queued status"""
+        await self._enqueue({
+            "type": "agent_status",
+            "data": {
+                "agent_id": agent_id,
+                "agent_type": agent_type,
+                "status": status,
+                "current_task": current_task,
+                "metrics": dict(metrics or {})
+            }
+        }, key=("agent_status", agent_id))
+
+    async def send_enhancement(self, enhancement_type: str, details: Dict[str, Any]) -> None:
+        """Queue an enhancement event"""
+        await self._enqueue({
+            "type": "enhancement",
+            "data": {"enhancement_type": enhancement_type, "details": dict(details)}
+        })
+
+    async def send_telemetry(self, metrics: Dict[str, Any], source: str) -> None:
+        """Queue a telemetry sample"""
+        await self._enqueue({"type": "telemetry", "data": {"source": source, "metrics": dict(metrics)}})
+
+    async def send_swarm_coherence(
+        self,
+        coherence: float,
+        entanglement: float,
+        agents_count: int,
+        iteration: int
+    ) -> None:
+        """Queue a swarm coherence sample"""
+        await self._enqueue({
+            "type": "swarm_coherence",
+            "data": {
+                "coherence": float(coherence),
+                "entanglement": float(entanglement),
+                "agents_count": int(agents_count),
+                "iteration": int(iteration)
+            }
+        })
+
+    async def _enqueue(self, message: Dict[str, Any], key: Optional[Hashable] = None) -> None:
+        message["timestamp"] = time.time()
+        if key is not None and key in self._latest:
+            self._latest[key] = message
+            self.stats["coalesced"] += 1
+            return
+        while len(self._queue) >= self.max_queue:
+            if self.drop_policy == "drop_newest":
+                self.stats["dropped"] += 1
+                return
+            if self.drop_policy == "drop_oldest":
+                old_key, _ = self._queue.popleft()
+                self._latest.pop(old_key, None)
+                self.stats["dropped"] += 1
+                break
+            if self._room is None:
+                # Not connected yet: nothing will ever make room
+                self.stats["dropped"] += 1
+                return
+            self._room.clear()
+            await self._room.wait()
+        if key is None:
+            self._sequence += 1
+            key = self._sequence
+        self._latest[key] = message
+        self._queue.append((key, time.monotonic()))
+        self.stats["accepted"] += 1
+        # Wake the sender on the first message (to arm its flush timer),
+        # on a full batch, and once the oldest message is overdue, since a
+        # busy caller may not give the loop time to fire the timer
+        if self._wakeup is not None and (
+            len(self._queue) == 1
+            or len(self._queue) >= self.batch_size
+            or time.monotonic() - self._queue[0][1] >= self.flush_interval
+        ):
+            self._wakeup.set()
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        batch = []
+        while self._queue and len(batch) < self.batch_size:
+            key, _ = self._queue.popleft()
+            batch.append(self._latest.pop(key))
+        if self._room is not None:
+            self._room.set()
+        return batch
+
+    def _requeue(self, batch: List[Dict[str, Any]]) -> None:
+        """Put an unsent batch back at the front, keeping newer statuses"""
+        now = time.monotonic()
+        for message in reversed(batch):
+            key: Hashable
+            if message["type"] == "agent_status":
+                key = ("agent_status", message["data"]["agent_id"])
+                if key in self._latest:
+                    continue
+            else:
+                self._sequence += 1
+                key = self._sequence
+            if len(self._queue) >= self.max_queue:
+                self.stats["dropped"] += 1
+                continue
+            self._latest[key] = message
+            self._queue.appendleft((key, now))
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                async with websockets.connect(self.url, open_timeout=self.connect_timeout) as ws:
+                    self._ws = ws
+                    self._connected.set()
+                    delay = self.reconnect_delay
+                    if await self._pump(ws):
+                        return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.debug("Realtime connection to %s failed: %s", self.url, e)
+            finally:
+                self._ws = None
+                self._connected.clear()
+            if self._closing:
+                return
+            self.stats["reconnects"] += 1
+            try:
+                await asyncio.wait_for(self._stop.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, 30.0)
+
+    async def _pump(self, ws) -> bool:
+        """Send batches until closing (True) or the connection fails (raises)"""
+        while True:
+            if not self._queue:
+                if self._closing:
+                    return True
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if len(self._queue) < self.batch_size and not self._closing:
+                waited = time.monotonic() - self._queue[0][1]
+                if waited < self.flush_interval:
+                    self._wakeup.clear()
+                    timer = asyncio.get_running_loop().call_later(
+                        self.flush_interval - waited, self._wakeup.set
+                    )
+                    try:
+                        await self._wakeup.wait()
+                    finally:
+                        timer.cancel()
+                    continue
+            batch = self._take_batch()
+            try:
+                await ws.send(json.dumps({"type": "batch", "messages": batch}, default=str))
+            except Exception:
+                self._requeue(batch)
+                raise
+            self.stats["sent"] += len(batch)
+            self.stats["batches"] += 1
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+DNALang Realtime Stand-in Server
+
+A local WebSocket endpoint that accepts what :class:`RealtimeClient`
+sends and records it, for tests and for running the agents without the
+dashboard. ``delay`` makes it consume frames slowly, to exercise the
+client's backpressure and drop policy.
+
+Example:
+    >>> async with LocalRealtimeServer(delay=0.01) as server:
+    ...     client = RealtimeClient(server.url)
+    ...     await client.connect()
+    ...     await client.send_telemetry({"cpu_usage": 42.0}, source="monitor")
+    ...     await client.disconnect()
+    >>> server.messages[0]["type"]
+    'telemetry'
+"""
+
+import asyncio
+import json
+from typing import Dict, Any, List, Optional
+
+import websockets
+
+
+class LocalRealtimeServer:
+    """
+    Recording WebSocket server
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free one; see :attr:`url`)
+        delay: Seconds to sleep after each received frame
+        echo: Print every received message
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, delay: float = 0.0, echo: bool = False):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.echo = echo
+        self.frames = 0
+        self.messages: List[Dict[str, Any]] = []
+        self.connections = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/realtime"
+
+    def by_type(self, message_type: str) -> List[Dict[str, Any]]:
+        return [m for m in self.messages if m.get("type") == message_type]
+
+    async def _handle(self, ws) -> None:
+        self.connections += 1
+        try:
+            async for frame in ws:
+                payload = json.loads(frame)
+                received = payload["messages"] if payload.get("type") == "batch" else [payload]
+                self.frames += 1
+                self.messages.extend(received)
+                if self.echo:
+                    for message in received:
+                        print(json.dumps(message))
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+        except websockets.ConnectionClosed:
+            pass
+
+    async def start(self) -> "LocalRealtimeServer":
+        self._server = await websockets.serve(self._handle, self.host, self.port)
+        self.port = next(iter(self._server.sockets)).getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LocalRealtimeServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+
+async def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local realtime dashboard stand-in")
+    parser.add_argument("--host", default="localhost", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind")
+    parser.add_argument("--delay", type=float, default=0.0, help="Seconds per received frame")
+    parser.add_argument("--quiet", action="store_true", help="Do not print messages")
+    args = parser.parse_args(argv)
+
+    server = await LocalRealtimeServer(args.host, args.port, args.delay, echo=not args.quiet).start()
+    print(f"Listening on {server.url}")
+    try:
+        await asyncio.Future()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass